@@ -15,6 +15,9 @@ class FileOpsConfig:
     hide_dot_files: bool = True
     max_depth: int = 5
     max_results: int = 100
+    # Search smaller files first in find_in_files, which reaches max_results
+    # sooner but orders results by file size rather than by path
+    small_first: bool = False
     
     # Git settings
     git_enabled: bool = True
@@ -43,7 +46,7 @@ FILE_OPERATIONS = [
     "read_file", "read_multiple_files", "read_image", "create_file", "update_file", "rewrite_file",
     "delete_file", "remove_from_file", "append_to_file", "insert_in_file",
     "copy_file", "copy_multiple_files", "move_file", "move_multiple_files", "file_exists", 
-    "delete_multiple_files", "replace_all_in_file"
+    "delete_multiple_files", "replace_all_in_file", "replace_all_in_files", "replace_all_emojis_in_files"
 ]
 
 # Directory operation types for logging and monitoring
@@ -75,6 +78,21 @@ ALL_OPERATIONS = FILE_OPERATIONS + DIR_OPERATIONS + SEARCH_OPERATIONS + GIT_OPER
 # Maximum file size (10MB)
 MAX_FILE_SIZE = 10 * 1024 * 1024
 
+# Files larger than this are skipped by find_in_files (16MB)
+MAX_SEARCH_FILE_SIZE = 16 * 1024 * 1024
+
+# Whether atomic writes fsync the data and the parent directory, so a
+# completed write survives a crash. This is only the default: callers
+# passing durable=True always fsync, and durable=False skips the temp file
+# and rename as well. Bulk scripted runs can turn this off.
+DURABLE_WRITES = True
+
+# Whether security events are buffered and written to stderr in batches
+# (at most SECURITY_LOG_FLUSH_INTERVAL seconds late) rather than one write
+# per event. Turn off to see each event as soon as it is logged.
+BUFFER_SECURITY_LOG = True
+SECURITY_LOG_FLUSH_INTERVAL = 0.5
+
 # Operation timeout in seconds
 OPERATION_TIMEOUT = 30
 
@@ -65,6 +65,11 @@ def parse_args():
         help="Maximum number of results for searches", 
         default=100
     )
+    parser.add_argument(
+        "--small-first", 
+        action="store_true", 
+        help="Search smaller files first when searching file contents"
+    )
     
     # Git configuration
     parser.add_argument(
@@ -139,6 +144,7 @@ def main():
     hide_dot_files = args.hide_dot_files and not args.show_dot_files if args.hide_dot_files or args.show_dot_files else config_from_file.get("hide_dot_files", True)
     max_depth = args.max_depth if args.max_depth != 5 or not config_from_file.get("max_depth") else config_from_file.get("max_depth")
     max_results = args.max_results if args.max_results != 100 or not config_from_file.get("max_results") else config_from_file.get("max_results")
+    small_first = args.small_first or config_from_file.get("small_first", False)
     git_enabled = not args.disable_git if not args.disable_git or not config_from_file.get("git_enabled") else config_from_file.get("git_enabled")
     git_auto_commit = not args.disable_auto_commit if not args.disable_auto_commit or not config_from_file.get("git_auto_commit") else config_from_file.get("git_auto_commit")
     git_username = args.git_username if args.git_username != "FileOps MCP" or not config_from_file.get("git_username") else config_from_file.get("git_username")
@@ -170,6 +176,7 @@ def main():
             hide_dot_files=hide_dot_files,
             max_depth=max_depth,
             max_results=max_results,
+            small_first=small_first,
             git_enabled=git_enabled,
             git_auto_commit=git_auto_commit,
             git_username=git_username,
@@ -185,12 +192,17 @@ def main():
     host = args.host if args.host != "localhost" or not config_from_file.get("host") else config_from_file.get("host")
     port = args.port if args.port != 8000 or not config_from_file.get("port") else config_from_file.get("port")
     
-    if transport == "stdio":
-        print("Starting server with stdio transport", file=sys.stderr)
-        mcp.run(transport="stdio")
-    else:
-        print(f"Starting server with SSE transport on {host}:{port}", file=sys.stderr)
-        mcp.run(transport="sse", host=host, port=port)
+    try:
+        if transport == "stdio":
+            print("Starting server with stdio transport", file=sys.stderr)
+            mcp.run(transport="stdio")
+        else:
+            print(f"Starting server with SSE transport on {host}:{port}", file=sys.stderr)
+            mcp.run(transport="sse", host=host, port=port)
+    except KeyboardInterrupt:
+        # Re-raised by the event loop once a SIGINT/SIGTERM shutdown has
+        # cancelled the running tasks; the server stopped cleanly
+        pass
     
     return 0
 
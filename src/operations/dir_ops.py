@@ -7,6 +7,7 @@ creating and deleting directories, and getting directory trees.
 import os
 import time
 import shutil
+import asyncio
 from typing import Dict, Any, List, Optional
 
 from mcp.server.fastmcp import FastMCP
@@ -45,7 +46,8 @@ def register_directory_operations(mcp: FastMCP) -> None:
             raise ValueError(f"{path} is not a directory")
         
         try:
-            entries = os.listdir(abs_path)
+            with os.scandir(abs_path) as it:
+                entries = list(it)
             return format_directory_listing(abs_path, entries)
         except PermissionError:
             raise ValueError(f"Permission denied for directory: {abs_path}")
@@ -77,7 +79,8 @@ def register_directory_operations(mcp: FastMCP) -> None:
             
             # Generate tree with depth limit from config
             try:
-                tree = get_directory_tree(abs_path, max_depth=config.max_depth)
+                # The walk blocks on the file system; keep it off the event loop
+                tree = await asyncio.to_thread(get_directory_tree, abs_path, max_depth=config.max_depth)
                 
                 if not tree:
                     return f"Error generating tree for {path}: No tree data returned"
@@ -250,15 +253,15 @@ def register_directory_operations(mcp: FastMCP) -> None:
             
             # For directories, count contents
             if os.path.isdir(abs_path):
-                try:
-                    entries = os.listdir(abs_path)
-                    dirs = sum(1 for e in entries if os.path.isdir(os.path.join(abs_path, e)))
-                    files = sum(1 for e in entries if os.path.isfile(os.path.join(abs_path, e)))
-                    result += f"\nContents: {len(entries)} total entries\n"
-                    result += f"- {dirs} directories\n"
-                    result += f"- {files} files\n"
-                except Exception as e:
-                    result += f"\nError counting contents: {str(e)}\n"
+                # Counted in one scandir pass by get_dir_info, rather than a
+                # listdir followed by two stats per entry
+                dir_info = get_dir_info(abs_path)
+                if "error" in dir_info:
+                    result += f"\nError counting contents: {dir_info['error']}\n"
+                else:
+                    result += f"\nContents: {dir_info['entry_count']} total entries\n"
+                    result += f"- {dir_info['dir_count']} directories\n"
+                    result += f"- {dir_info['file_count']} files\n"
                     
                 # Git repository information
                 try:
@@ -5,18 +5,335 @@ This module contains tools for file operations such as reading multiple files,
 creating, updating, deleting, copying, and moving files.
 """
 import os
-import time
+import re
+import stat
 import json
-from typing import Dict, Any, Optional, Union
+import mmap
+import io
+import hashlib
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Tuple, Union
 
 from mcp.server.fastmcp import FastMCP, Image
 from PIL import Image as PILImage
 
 from ..constants import config, MAX_FILE_SIZE
-from ..utils.security import validate_operation, log_security_event, is_text_file, with_error_handling, sanitize_file_string
-from ..utils.path_utils import generate_checksum
+from ..utils.security import validate_operation, validate_operation_stat, log_security_event, is_text_file, with_error_handling, sanitize_file_string
+from ..utils.path_utils import generate_checksum, atomic_write, insert_bytes, replace_in_file, temp_path_for, check_utf8
 from ..utils.formatters import format_file_contents
-from ..utils.git_utils import auto_commit_changes, GitError
+from ..utils.git_utils import auto_commit_changes, auto_commit_paths, GitError
+
+# Optional Aho-Corasick matcher for emoji replacement
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Default comprehensive emoji mapping based on docs/fix_emojis.py
+_DEFAULT_EMOJI_MAPPING = {
+    # Basic status indicators
+    '\U0001f527': '[API]',      # 🔧 wrench
+    '\U000026a1': '[FAST]',     # ⚡ lightning
+    '\U0001f680': '[PERF]',     # 🚀 rocket
+    '\U0001f4e6': '[PKG]',      # 📦 package
+    '\U0001f4ca': '[CHART]',    # 📊 chart
+    '\U0001f4c8': '[CHART]',    # 📈 chart increasing
+    '\U0001f4c9': '[CHART]',    # 📉 chart decreasing
+    '\U0001f3af': '[TARGET]',   # 🎯 target
+    '\U0001f512': '[SEC]',      # 🔒 lock
+    '\U0001f30d': '[GLOBAL]',   # 🌍 globe
+    '\U0001f30e': '[WEB]',      # 🌎 globe
+    '\U0001f4f6': '[NET]',      # 📶 network
+    '\U0001f310': '[NET]',      # 🌐 network
+    '\U0001f4a1': '[TIP]',      # 💡 bulb
+    '\U0001f3c1': '[FINAL]',    # 🏁 checkered flag
+    '\U0001f389': '[SUCCESS]',  # 🎉 party
+    '\U0001f38a': '[DONE]',     # 🎊 confetti
+    '\U0001f40c': '[SLOW]',     # 🐌 snail
+    '\U0001f433': '[DOCKER]',   # 🐳 whale
+    '\U0001f6e1\ufe0f': '[SHIELD]', # 🛡️ shield
+    '\U0001f6e1': '[SHIELD]',   # 🛡 shield
+    '\U0001f6a8': '[ERR]',      # 🚨 siren
+    '\U0001f50d': '[SEARCH]',   # 🔍 magnifying glass
+    '\U0001f514': '[CONN]',     # 🔔 bell
+    '\U0001f525': '[FIRE]',     # 🔥 fire
+    '\U0001f4aa': '[STRONG]',   # 💪 muscle
+    '\U0001f9ea': '[TEST]',     # 🧪 test tube
+    '\U0001f4dd': '[NOTE]',     # 📝 memo
+    '\U0001f4cb': '[LIST]',     # 📋 clipboard
+    '\U0001f4c4': '[FILE]',     # 📄 document
+    '\U0001f4c1': '[DIR]',      # 📁 folder
+    '\U0001f4c2': '[FOLDER]',   # 📂 open folder
+    '\U0001f4d6': '[BOOK]',     # 📖 book
+    '\U0001f4bb': '[COMP]',     # 💻 computer
+    '\U0001f5a5\ufe0f': '[DESKTOP]', # 🖥️ desktop
+    '\U0001f5a5': '[DESKTOP]',  # 🖥 desktop
+    '\U0001f4f1': '[MOBILE]',   # 📱 mobile
+    '\U000023f1\ufe0f': '[TIMER]', # ⏱️ timer
+    '\U000023f1': '[TIMER]',    # ⏱ timer
+    '\U0001f552': '[TIME]',     # 🕒 clock
+    '\U0001f195': '[NEW]',      # 🆕 new
+    '\U0001f199': '[UP]',       # 🆙 up
+    '\U0001f19a': '[VS]',       # 🆚 vs
+    '\U0001f4a5': '[BOOM]',     # 💥 explosion
+    '\U0001f525': '[HOT]',      # 🔥 fire
+    '\U00002744\ufe0f': '[COLD]', # ❄️ snowflake
+    '\U00002744': '[COLD]',     # ❄ snowflake
+    '\U0001f522': '[NUMS]',     # 🔢 numbers
+    '\U0001f523': '[SYMBOLS]',  # 🔣 symbols
+    '\U0001f524': '[ABC]',      # 🔤 letters
+    '\U00002699\ufe0f': '[GEAR]', # ⚙️ gear
+    '\U00002699': '[GEAR]',     # ⚙ gear
+    '\U00002696\ufe0f': '[BALANCE]', # ⚖️ balance
+    '\U00002696': '[BALANCE]',  # ⚖ balance
+    '\U0001f4e4': '[OUTBOX]',   # 📤 outbox
+    '\U0001f4e5': '[INBOX]',    # 📥 inbox
+    '\U0001f4ed': '[EMPTY]',    # 📭 mailbox
+    '\U0001f4ec': '[MAIL]',     # 📬 mailbox
+    '\U0001f4ea': '[MAILBOX]',  # 📪 closed mailbox
+    '\U0001f4e8': '[ENVELOPE]', # 📨 envelope
+    '\U0001f194': '[ID]',       # 🆔 ID
+    '\U0001f50c': '[PLUG]',     # 🔌 plug
+    '\U0001f4de': '[PHONE]',    # 📞 telephone
+    '\U0001f4e0': '[FAX]',      # 📠 fax
+    '\U0001f4fc': '[VHS]',      # 📼 videocassette
+    '\U0001f4fd\ufe0f': '[FILM]', # 📽️ film projector
+    '\U0001f4fd': '[FILM]',     # 📽 film projector
+    '\U0001f3a5': '[CAMERA]',   # 🎥 movie camera
+    '\U0001f4f7': '[PHOTO]',    # 📷 camera
+    '\U0001f4f8': '[FLASH]',    # 📸 camera with flash
+    '\U0001f50e': '[ZOOM]',     # 🔎 magnifying glass
+    '\U0001f50f': '[LOCK]',     # 🔏 lock with pen
+    '\U0001f510': '[UNLOCK]',   # 🔐 lock with key
+    '\U0001f511': '[KEY]',      # 🔑 key
+    '\U0001f513': '[OPEN]',     # 🔓 unlocked
+    '\U0001f6aa': '[DOOR]',     # 🚪 door
+    '\U0001f4ac': '[COMMENT]',  # 💬 speech balloon
+    '\U0001f4ad': '[THOUGHT]',  # 💭 thought balloon
+    '\U0001f5e8\ufe0f': '[SPEAK]', # 🗨️ left speech bubble
+    '\U0001f5e8': '[SPEAK]',    # 🗨 left speech bubble
+    '\U0001f5ef\ufe0f': '[ANGRY]', # 🗯️ right anger bubble
+    '\U0001f5ef': '[ANGRY]',    # 🗯 right anger bubble
+    '\U0001f4f0': '[NEWS]',     # 📰 newspaper
+    '\U0001f4f3': '[VIBRATE]',  # 📳 vibration mode
+    '\U0001f4f4': '[SILENT]',   # 📴 mobile phone off
+    '\U0001f4f5': '[NO_MOBILE]', # 📵 no mobile phones
+    '\U0001f4f6': '[SIGNAL]',   # 📶 antenna bars
+    '\U0001f4f7': '[CAMERA2]',  # 📷 camera
+    '\U0001f4f9': '[VIDEO]',    # 📹 video camera
+    '\U0001f4fa': '[TV]',       # 📺 television
+    '\U0001f4fb': '[RADIO]',    # 📻 radio
+    '\U0001f4fc': '[TAPE]',     # 📼 videocassette
+    '\U0001f50a': '[LOUD]',     # 🔊 speaker high volume
+    '\U0001f50b': '[LOW]',      # 🔋 battery
+    '\U0001f50c': '[ELECTRIC]', # 🔌 electric plug
+    '\U0001f4af': '[100]',      # 💯 hundred points
+    
+    # Add checkmark and X emojis
+    '\u2705': '[PASS]',         # ✅ check mark
+    '\u274c': '[FAIL]',         # ❌ cross mark
+    '\u26a0\ufe0f': '[WARN]',   # ⚠️ warning
+    '\u26a0': '[WARN]',         # ⚠ warning
+    '\u2139\ufe0f': '[INFO]',   # ℹ️ information
+    '\u2139': '[INFO]',         # ℹ information
+    '\u2753': '[QUESTION]',     # ❓ question mark
+    '\u2754': '[QUESTION2]',    # ❔ white question mark
+    '\u2755': '[EXCLAIM]',      # ❕ white exclamation mark
+    '\u2757': '[EXCLAIM2]',     # ❗ exclamation mark
+    '\u27a1\ufe0f': '[RIGHT]',  # ➡️ right arrow
+    '\u27a1': '[RIGHT]',        # ➡ right arrow
+    '\u2b05\ufe0f': '[LEFT]',   # ⬅️ left arrow
+    '\u2b05': '[LEFT]',         # ⬅ left arrow
+    '\u2b06\ufe0f': '[UP]',     # ⬆️ up arrow
+    '\u2b06': '[UP]',           # ⬆ up arrow
+    '\u2b07\ufe0f': '[DOWN]',   # ⬇️ down arrow
+    '\u2b07': '[DOWN]',         # ⬇ down arrow
+    
+    # Missing emoji mappings from docs/missing_emoji_mappings.md
+    # Brain/Intelligence Category
+    '\U0001f9e0': '[MEMORY]',   # 🧠 brain
+    '\U0001f9ee': '[COMPUTE]',  # 🧮 abacus
+    '\U0001f916': '[BOT]',      # 🤖 robot
+    '\U0001f52e': '[PREDICT]',  # 🔮 crystal ball
+    
+    # Connection/Process Category
+    '\U0001f517': '[LINK]',     # 🔗 link
+    '\U0001f504': '[CYCLE]',    # 🔄 counterclockwise arrows
+    '\U0001f501': '[REPEAT]',   # 🔁 repeat button
+    '\U0001f502': '[REPEAT_ONE]', # 🔂 repeat single
+    '\U0001f503': '[VERTICAL]', # 🔃 clockwise vertical arrows
+    
+    # Places/Environment Category
+    '\U0001f3e0': '[HOST]',     # 🏠 house
+    '\U0001f3c6': '[AWARD]',    # 🏆 trophy
+    '\U0001f3aa': '[STRATEGY]', # 🎪 circus tent
+    '\U0001f3e2': '[OFFICE]',   # 🏢 office building
+    '\U0001f3ed': '[FACTORY]',  # 🏭 factory
+    
+    # Tools/Objects Category
+    '\U0001f9f9': '[CLEANUP]',  # 🧹 broom
+    '\U0001f5d1\ufe0f': '[GARBAGE]', # 🗑️ wastebasket
+    '\U0001f5d1': '[GARBAGE]',  # 🗑 wastebasket
+    '\u270d\ufe0f': '[WRITE]',  # ✍️ writing hand
+    '\u270d': '[WRITE]',        # ✍ writing hand
+    '\U0001f58a\ufe0f': '[PEN]', # 🖊️ pen
+    '\U0001f58a': '[PEN]',      # 🖊 pen
+    '\U0001f528': '[BUILD]',    # 🔨 hammer
+    
+    # Animals Category (Context-Specific)
+    '\U0001f43c': '[PANDAS]',   # 🐼 panda
+    '\U0001f40d': '[PYTHON]',   # 🐍 snake
+    '\U0001f427': '[LINUX]',    # 🐧 penguin
+    '\U0001f980': '[RUST]',     # 🦀 crab
+    
+    # Symbols and Punctuation
+    '\u2022': '-',              # • bullet point to dash
+}
+
+def _compile_emoji_re(mapping: Dict[str, str]) -> Tuple["re.Pattern", Dict[bytes, bytes]]:
+    """
+    Compile a single bytes alternation matching every key of an emoji mapping.
+    
+    Keys and replacements are UTF-8 encoded so files can be scanned without
+    decoding them first. Longer keys are tried first so that emoji with a
+    variation selector (e.g. "\u26a0\ufe0f") win over their bare form.
+    
+    Returns:
+        Tuple of the compiled pattern and the UTF-8 encoded mapping
+    """
+    byte_mapping = {k.encode('utf-8'): v.encode('utf-8') for k, v in mapping.items() if k}
+    keys = sorted(byte_mapping, key=len, reverse=True)
+    return re.compile(b"|".join(re.escape(k) for k in keys)), byte_mapping
+
+_DEFAULT_EMOJI_RE, _DEFAULT_EMOJI_MAP_BYTES = _compile_emoji_re(_DEFAULT_EMOJI_MAPPING)
+
+def _build_emoji_automaton(mapping: Dict[str, str]) -> Optional["ahocorasick.Automaton"]:
+    """
+    Build an Aho-Corasick automaton over an emoji mapping.
+    
+    The automaton matches all keys in one linear pass regardless of how
+    many keys there are, which scales better than a regex alternation for
+    large custom mappings.
+    
+    Returns:
+        The automaton, or None if pyahocorasick is not installed
+    """
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    automaton = ahocorasick.Automaton()
+    for key, value in mapping.items():
+        if key:
+            automaton.add_word(key, (len(key), value))
+    automaton.make_automaton()
+    return automaton
+
+def _replace_with_automaton(automaton: "ahocorasick.Automaton", text: str) -> Tuple[str, int]:
+    """
+    Replace every longest, non-overlapping automaton match in text.
+    
+    Returns:
+        Tuple of the new text and the number of replacements made
+    """
+    parts = []
+    pos = 0
+    count = 0
+    for end, (length, value) in automaton.iter_long(text):
+        parts.append(text[pos:end - length + 1])
+        parts.append(value)
+        pos = end + 1
+        count += 1
+    if not count:
+        return text, 0
+    parts.append(text[pos:])
+    return "".join(parts), count
+
+_DEFAULT_EMOJI_AUTOMATON = _build_emoji_automaton(_DEFAULT_EMOJI_MAPPING)
+
+def _classify(path: str) -> Optional[os.stat_result]:
+    """
+    Stat a path once, returning None if it does not exist.
+    
+    Callers inspect ``st_mode`` and ``st_size`` on the result instead of
+    issuing separate exists/isfile/isdir/getsize calls.
+    """
+    try:
+        return os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+def _replace_sync(abs_path: str, old_bytes: bytes, new_bytes: bytes) -> Tuple[int, str, str]:
+    """
+    Replace every occurrence of old_bytes in a file, for replace_all_in_file(s).
+
+    The file is streamed through the replacement into a temp file; it is
+    never held in memory as a whole, and is left untouched when there is
+    nothing to replace. Both checksums are computed as the bytes are read
+    and written. As when the file was read in text mode, it must be valid
+    UTF-8 and \n in the strings matches CRLF line endings; unlike text mode,
+    the file keeps its CRLF endings, including those of inserted text,
+    rather than being rewritten with LF.
+
+    Args:
+        abs_path: Validated absolute path of the file
+        old_bytes: UTF-8 encoded text to replace
+        new_bytes: UTF-8 encoded replacement text
+
+    Returns:
+        Tuple[int, str, str]: Replacement count, original and new checksum
+
+    Raises:
+        ValueError: If the file is not UTF-8 text, the result is too large or
+            the file cannot be updated
+    """
+    original_hash = hashlib.sha256()
+    new_hash = hashlib.sha256()
+    try:
+        occurrence_count = replace_in_file(abs_path, old_bytes, new_bytes, MAX_FILE_SIZE,
+                                           src_hash=original_hash, dst_hash=new_hash, text=True)
+    except UnicodeDecodeError:
+        raise ValueError("File is not a valid text file")
+    except ValueError:
+        raise
+    except Exception as e:
+        raise ValueError(f"Failed to update file: {str(e)}")
+    return occurrence_count, original_hash.hexdigest(), new_hash.hexdigest()
+
+def _read_text_sync(abs_path: str) -> Tuple[str, str, int]:
+    """
+    Read a UTF-8 text file in one pass, for read_file and read_multiple_files.
+    
+    The checksum is computed from the same bytes that are decoded, rather
+    than from a second read of the file. Line endings are translated as
+    text mode would.
+    
+    Args:
+        abs_path: Validated absolute path of the file
+        
+    Returns:
+        Tuple[str, str, int]: Text, SHA-256 checksum and size in bytes
+        
+    Raises:
+        UnicodeDecodeError: If the file is not valid UTF-8
+        OSError: If the file cannot be read
+    """
+    with open(abs_path, 'rb') as f:
+        data = f.read()
+    checksum = hashlib.sha256(data).hexdigest()
+    text = data.decode('utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text, checksum, len(data)
+
+# Caps how many files are read and hashed at once, so concurrent reads of
+# large files do not all compete for the disk
+_READ_SEMAPHORE = asyncio.Semaphore(max(2, os.cpu_count() or 1))
+
+async def _read_text_async(abs_path: str) -> Tuple[str, str, int]:
+    """Run _read_text_sync in a worker thread, off the event loop."""
+    async with _READ_SEMAPHORE:
+        return await asyncio.to_thread(_read_text_sync, abs_path)
 
 def register_file_operations(mcp: FastMCP) -> None:
     """
@@ -65,7 +382,7 @@ def register_file_operations(mcp: FastMCP) -> None:
         source_checksum = generate_checksum(source_abs_path)
         
         # Use atomic copy operation with proper error handling
-        temp_path = f"{dest_abs_path}.tmp.{os.getpid()}.{int(time.time())}"
+        temp_path = temp_path_for(dest_abs_path)
         try:
             # Read source file
             with open(source_abs_path, 'rb') as src:
@@ -185,7 +502,7 @@ def register_file_operations(mcp: FastMCP) -> None:
                 source_checksum = generate_checksum(source_abs_path)
                 
                 # Use atomic copy operation with proper error handling
-                temp_path = f"{dest_abs_path}.tmp.{os.getpid()}.{int(time.time())}"
+                temp_path = temp_path_for(dest_abs_path)
                 try:
                     # Read source file
                     with open(source_abs_path, 'rb') as src:
@@ -260,7 +577,7 @@ def register_file_operations(mcp: FastMCP) -> None:
 
     @with_error_handling
     @mcp.tool()
-    async def replace_all_emojis_in_files(file_paths: list[str], emoji_mapping: Dict[str, str] = None, commit_message: str = None) -> str:
+    async def replace_all_emojis_in_files(file_paths: list[str], emoji_mapping: Dict[str, str] = None, commit_message: str = None, durable: Optional[bool] = None) -> str:
         """
         Replace all emoji occurrences in multiple text files with text representations.
         
@@ -310,6 +627,10 @@ def register_file_operations(mcp: FastMCP) -> None:
                           emojis will be added to the mapping. The default mapping 
                           remains intact for all other emojis.
             commit_message: Custom Git commit message (optional)
+            durable: True always writes through a fsynced temp file and
+                    atomic rename. False rewrites files in place, which is
+                    faster but not crash-safe. When omitted, the temp file and
+                    rename are used and DURABLE_WRITES decides the fsync.
             
         Returns:
             str: Summary of processing results including files processed, 
@@ -321,8 +642,7 @@ def register_file_operations(mcp: FastMCP) -> None:
         Security Notes:
             - Only processes text files (binary files are rejected for security)
             - Validates all file paths to prevent directory traversal attacks
-            - Uses atomic file operations to prevent data corruption
-            - Maintains file checksums for integrity verification
+            - Uses atomic file operations to prevent data corruption (unless durable=False)
         """
         # Validate input parameters
         if not file_paths:
@@ -331,257 +651,129 @@ def register_file_operations(mcp: FastMCP) -> None:
         if not isinstance(file_paths, list):
             raise ValueError("file_paths must be a list of strings")
         
-        # Default comprehensive emoji mapping based on docs/fix_emojis.py
-        default_emoji_mapping = {
-            # Basic status indicators
-            '\U0001f527': '[API]',      # 🔧 wrench
-            '\U000026a1': '[FAST]',     # ⚡ lightning
-            '\U0001f680': '[PERF]',     # 🚀 rocket
-            '\U0001f4e6': '[PKG]',      # 📦 package
-            '\U0001f4ca': '[CHART]',    # 📊 chart
-            '\U0001f4c8': '[CHART]',    # 📈 chart increasing
-            '\U0001f4c9': '[CHART]',    # 📉 chart decreasing
-            '\U0001f3af': '[TARGET]',   # 🎯 target
-            '\U0001f512': '[SEC]',      # 🔒 lock
-            '\U0001f30d': '[GLOBAL]',   # 🌍 globe
-            '\U0001f30e': '[WEB]',      # 🌎 globe
-            '\U0001f4f6': '[NET]',      # 📶 network
-            '\U0001f310': '[NET]',      # 🌐 network
-            '\U0001f4a1': '[TIP]',      # 💡 bulb
-            '\U0001f3c1': '[FINAL]',    # 🏁 checkered flag
-            '\U0001f389': '[SUCCESS]',  # 🎉 party
-            '\U0001f38a': '[DONE]',     # 🎊 confetti
-            '\U0001f40c': '[SLOW]',     # 🐌 snail
-            '\U0001f433': '[DOCKER]',   # 🐳 whale
-            '\U0001f6e1\ufe0f': '[SHIELD]', # 🛡️ shield
-            '\U0001f6e1': '[SHIELD]',   # 🛡 shield
-            '\U0001f6a8': '[ERR]',      # 🚨 siren
-            '\U0001f50d': '[SEARCH]',   # 🔍 magnifying glass
-            '\U0001f514': '[CONN]',     # 🔔 bell
-            '\U0001f525': '[FIRE]',     # 🔥 fire
-            '\U0001f4aa': '[STRONG]',   # 💪 muscle
-            '\U0001f9ea': '[TEST]',     # 🧪 test tube
-            '\U0001f4dd': '[NOTE]',     # 📝 memo
-            '\U0001f4cb': '[LIST]',     # 📋 clipboard
-            '\U0001f4c4': '[FILE]',     # 📄 document
-            '\U0001f4c1': '[DIR]',      # 📁 folder
-            '\U0001f4c2': '[FOLDER]',   # 📂 open folder
-            '\U0001f4d6': '[BOOK]',     # 📖 book
-            '\U0001f4bb': '[COMP]',     # 💻 computer
-            '\U0001f5a5\ufe0f': '[DESKTOP]', # 🖥️ desktop
-            '\U0001f5a5': '[DESKTOP]',  # 🖥 desktop
-            '\U0001f4f1': '[MOBILE]',   # 📱 mobile
-            '\U000023f1\ufe0f': '[TIMER]', # ⏱️ timer
-            '\U000023f1': '[TIMER]',    # ⏱ timer
-            '\U0001f552': '[TIME]',     # 🕒 clock
-            '\U0001f195': '[NEW]',      # 🆕 new
-            '\U0001f199': '[UP]',       # 🆙 up
-            '\U0001f19a': '[VS]',       # 🆚 vs
-            '\U0001f4a5': '[BOOM]',     # 💥 explosion
-            '\U0001f525': '[HOT]',      # 🔥 fire
-            '\U00002744\ufe0f': '[COLD]', # ❄️ snowflake
-            '\U00002744': '[COLD]',     # ❄ snowflake
-            '\U0001f522': '[NUMS]',     # 🔢 numbers
-            '\U0001f523': '[SYMBOLS]',  # 🔣 symbols
-            '\U0001f524': '[ABC]',      # 🔤 letters
-            '\U00002699\ufe0f': '[GEAR]', # ⚙️ gear
-            '\U00002699': '[GEAR]',     # ⚙ gear
-            '\U00002696\ufe0f': '[BALANCE]', # ⚖️ balance
-            '\U00002696': '[BALANCE]',  # ⚖ balance
-            '\U0001f4e4': '[OUTBOX]',   # 📤 outbox
-            '\U0001f4e5': '[INBOX]',    # 📥 inbox
-            '\U0001f4ed': '[EMPTY]',    # 📭 mailbox
-            '\U0001f4ec': '[MAIL]',     # 📬 mailbox
-            '\U0001f4ea': '[MAILBOX]',  # 📪 closed mailbox
-            '\U0001f4e8': '[ENVELOPE]', # 📨 envelope
-            '\U0001f194': '[ID]',       # 🆔 ID
-            '\U0001f50c': '[PLUG]',     # 🔌 plug
-            '\U0001f4de': '[PHONE]',    # 📞 telephone
-            '\U0001f4e0': '[FAX]',      # 📠 fax
-            '\U0001f4fc': '[VHS]',      # 📼 videocassette
-            '\U0001f4fd\ufe0f': '[FILM]', # 📽️ film projector
-            '\U0001f4fd': '[FILM]',     # 📽 film projector
-            '\U0001f3a5': '[CAMERA]',   # 🎥 movie camera
-            '\U0001f4f7': '[PHOTO]',    # 📷 camera
-            '\U0001f4f8': '[FLASH]',    # 📸 camera with flash
-            '\U0001f50e': '[ZOOM]',     # 🔎 magnifying glass
-            '\U0001f50f': '[LOCK]',     # 🔏 lock with pen
-            '\U0001f510': '[UNLOCK]',   # 🔐 lock with key
-            '\U0001f511': '[KEY]',      # 🔑 key
-            '\U0001f513': '[OPEN]',     # 🔓 unlocked
-            '\U0001f6aa': '[DOOR]',     # 🚪 door
-            '\U0001f4ac': '[COMMENT]',  # 💬 speech balloon
-            '\U0001f4ad': '[THOUGHT]',  # 💭 thought balloon
-            '\U0001f5e8\ufe0f': '[SPEAK]', # 🗨️ left speech bubble
-            '\U0001f5e8': '[SPEAK]',    # 🗨 left speech bubble
-            '\U0001f5ef\ufe0f': '[ANGRY]', # 🗯️ right anger bubble
-            '\U0001f5ef': '[ANGRY]',    # 🗯 right anger bubble
-            '\U0001f4f0': '[NEWS]',     # 📰 newspaper
-            '\U0001f4f3': '[VIBRATE]',  # 📳 vibration mode
-            '\U0001f4f4': '[SILENT]',   # 📴 mobile phone off
-            '\U0001f4f5': '[NO_MOBILE]', # 📵 no mobile phones
-            '\U0001f4f6': '[SIGNAL]',   # 📶 antenna bars
-            '\U0001f4f7': '[CAMERA2]',  # 📷 camera
-            '\U0001f4f9': '[VIDEO]',    # 📹 video camera
-            '\U0001f4fa': '[TV]',       # 📺 television
-            '\U0001f4fb': '[RADIO]',    # 📻 radio
-            '\U0001f4fc': '[TAPE]',     # 📼 videocassette
-            '\U0001f50a': '[LOUD]',     # 🔊 speaker high volume
-            '\U0001f50b': '[LOW]',      # 🔋 battery
-            '\U0001f50c': '[ELECTRIC]', # 🔌 electric plug
-            '\U0001f4af': '[100]',      # 💯 hundred points
-            
-            # Add checkmark and X emojis
-            '\u2705': '[PASS]',         # ✅ check mark
-            '\u274c': '[FAIL]',         # ❌ cross mark
-            '\u26a0\ufe0f': '[WARN]',   # ⚠️ warning
-            '\u26a0': '[WARN]',         # ⚠ warning
-            '\u2139\ufe0f': '[INFO]',   # ℹ️ information
-            '\u2139': '[INFO]',         # ℹ information
-            '\u2753': '[QUESTION]',     # ❓ question mark
-            '\u2754': '[QUESTION2]',    # ❔ white question mark
-            '\u2755': '[EXCLAIM]',      # ❕ white exclamation mark
-            '\u2757': '[EXCLAIM2]',     # ❗ exclamation mark
-            '\u27a1\ufe0f': '[RIGHT]',  # ➡️ right arrow
-            '\u27a1': '[RIGHT]',        # ➡ right arrow
-            '\u2b05\ufe0f': '[LEFT]',   # ⬅️ left arrow
-            '\u2b05': '[LEFT]',         # ⬅ left arrow
-            '\u2b06\ufe0f': '[UP]',     # ⬆️ up arrow
-            '\u2b06': '[UP]',           # ⬆ up arrow
-            '\u2b07\ufe0f': '[DOWN]',   # ⬇️ down arrow
-            '\u2b07': '[DOWN]',         # ⬇ down arrow
-            
-            # Missing emoji mappings from docs/missing_emoji_mappings.md
-            # Brain/Intelligence Category
-            '\U0001f9e0': '[MEMORY]',   # 🧠 brain
-            '\U0001f9ee': '[COMPUTE]',  # 🧮 abacus
-            '\U0001f916': '[BOT]',      # 🤖 robot
-            '\U0001f52e': '[PREDICT]',  # 🔮 crystal ball
-            
-            # Connection/Process Category
-            '\U0001f517': '[LINK]',     # 🔗 link
-            '\U0001f504': '[CYCLE]',    # 🔄 counterclockwise arrows
-            '\U0001f501': '[REPEAT]',   # 🔁 repeat button
-            '\U0001f502': '[REPEAT_ONE]', # 🔂 repeat single
-            '\U0001f503': '[VERTICAL]', # 🔃 clockwise vertical arrows
-            
-            # Places/Environment Category
-            '\U0001f3e0': '[HOST]',     # 🏠 house
-            '\U0001f3c6': '[AWARD]',    # 🏆 trophy
-            '\U0001f3aa': '[STRATEGY]', # 🎪 circus tent
-            '\U0001f3e2': '[OFFICE]',   # 🏢 office building
-            '\U0001f3ed': '[FACTORY]',  # 🏭 factory
-            
-            # Tools/Objects Category
-            '\U0001f9f9': '[CLEANUP]',  # 🧹 broom
-            '\U0001f5d1\ufe0f': '[GARBAGE]', # 🗑️ wastebasket
-            '\U0001f5d1': '[GARBAGE]',  # 🗑 wastebasket
-            '\u270d\ufe0f': '[WRITE]',  # ✍️ writing hand
-            '\u270d': '[WRITE]',        # ✍ writing hand
-            '\U0001f58a\ufe0f': '[PEN]', # 🖊️ pen
-            '\U0001f58a': '[PEN]',      # 🖊 pen
-            '\U0001f528': '[BUILD]',    # 🔨 hammer
-            
-            # Animals Category (Context-Specific)
-            '\U0001f43c': '[PANDAS]',   # 🐼 panda
-            '\U0001f40d': '[PYTHON]',   # 🐍 snake
-            '\U0001f427': '[LINUX]',    # 🐧 penguin
-            '\U0001f980': '[RUST]',     # 🦀 crab
-            
-            # Symbols and Punctuation
-            '\u2022': '-',              # • bullet point to dash
-        }
         
         # Start with default mapping and merge/override with custom mapping if provided
-        active_mapping = default_emoji_mapping.copy()
-        
-        if emoji_mapping is not None:
+        if emoji_mapping is None:
+            active_mapping = _DEFAULT_EMOJI_MAPPING
+            emoji_re, byte_mapping = _DEFAULT_EMOJI_RE, _DEFAULT_EMOJI_MAP_BYTES
+            automaton = _DEFAULT_EMOJI_AUTOMATON
+        else:
             if not isinstance(emoji_mapping, dict):
                 raise ValueError("emoji_mapping must be a dictionary")
+            if not all(isinstance(k, str) and isinstance(v, str) for k, v in emoji_mapping.items()):
+                raise ValueError("emoji_mapping keys and values must be strings")
             # Update default mapping with custom mappings (overrides existing, adds new)
-            active_mapping.update(emoji_mapping)
+            active_mapping = {**_DEFAULT_EMOJI_MAPPING, **emoji_mapping}
+            emoji_re, byte_mapping = _compile_emoji_re(active_mapping)
+            automaton = _build_emoji_automaton(active_mapping)
         
-        # Track processing results
-        successful_files = []
-        failed_files = []
-        total_replacements = 0
-        processed_file_paths = []  # For Git commit tracking
+        # Called once per match from inside re.subn; keep it to a single
+        # C-level lookup on the whole match
+        lookup_replacement = byte_mapping.__getitem__
+        
+        def _emoji_replacement(match: "re.Match") -> bytes:
+            return lookup_replacement(match[0])
         
-        # Process each file
-        for file_path in file_paths:
+        def _process_one(file_path: str, abs_path: str) -> tuple:
+            """Process a single validated file, returning (ok, info, replacements, abs_path)."""
             try:
-                # Validate file path and security checks
-                abs_path = validate_operation(file_path, "replace_all_emojis_in_files", check_binary=True)
-                
                 # Check if file exists and is a text file
-                if not os.path.exists(abs_path):
-                    failed_files.append(f"{file_path} (file does not exist)")
-                    continue
+                st = _classify(abs_path)
+                if st is None:
+                    return False, f"{file_path} (file does not exist)", 0, None
                 
-                if not os.path.isfile(abs_path):
-                    failed_files.append(f"{file_path} (not a regular file)")
-                    continue
+                if not stat.S_ISREG(st.st_mode):
+                    return False, f"{file_path} (not a regular file)", 0, None
                 
-                # Get original file info
-                original_checksum = generate_checksum(abs_path)
-                file_size = os.path.getsize(abs_path)
+                # Empty files cannot be memory-mapped and have nothing to replace
+                if st.st_size == 0:
+                    return True, f"{file_path} (no emojis found)", 0, None
                 
-                # Read file content with proper error handling
                 try:
-                    with open(abs_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
+                    with open(abs_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        if automaton is not None:
+                            # Match all emoji in one Aho-Corasick pass over the text
+                            content, file_replacements = _replace_with_automaton(automaton, mm[:].decode('utf-8'))
+                            if file_replacements == 0:
+                                return True, f"{file_path} (no emojis found)", 0, None
+                            new_bytes = content.encode('utf-8')
+                        else:
+                            # Scan the raw bytes through the memory map; files without
+                            # any emoji are skipped without being copied or decoded
+                            if emoji_re.search(mm) is None:
+                                # No emojis found, but file was processed successfully
+                                return True, f"{file_path} (no emojis found)", 0, None
+                            # Only UTF-8 text is rewritten; a failed strict decode is
+                            # reported as a binary file below, as the text path does
+                            check_utf8(mm)
+                            # Apply all emoji replacements in a single pass
+                            new_bytes, file_replacements = emoji_re.subn(_emoji_replacement, mm)
                 except UnicodeDecodeError:
-                    failed_files.append(f"{file_path} (binary file - text files only)")
-                    continue
+                    return False, f"{file_path} (binary file - text files only)", 0, None
                 except Exception as e:
-                    failed_files.append(f"{file_path} (read error: {str(e)})")
-                    continue
+                    return False, f"{file_path} (read error: {str(e)})", 0, None
                 
-                # Track changes for this file
-                original_content = content
-                file_replacements = 0
+                # Validate new content size
+                if len(new_bytes) > MAX_FILE_SIZE:
+                    return False, f"{file_path} (resulting file too large: {len(new_bytes)} bytes)", 0, None
                 
-                # Apply emoji replacements
-                for emoji_char, replacement in active_mapping.items():
-                    if emoji_char in content:
-                        count = content.count(emoji_char)
-                        content = content.replace(emoji_char, replacement)
-                        file_replacements += count
+                # Write the new content (atomically when durable)
+                try:
+                    atomic_write(abs_path, new_bytes, durable=durable)
+                except Exception as e:
+                    return False, f"{file_path} (write error: {str(e)})", 0, None
                 
-                # Only write file if changes were made
-                if file_replacements > 0:
-                    # Validate new content size
-                    if len(content) > MAX_FILE_SIZE:
-                        failed_files.append(f"{file_path} (resulting file too large: {len(content)} bytes)")
-                        continue
-                    
-                    # Use atomic write operation with proper error handling
-                    temp_path = f"{abs_path}.tmp.{os.getpid()}.{int(time.time())}"
-                    try:
-                        with open(temp_path, 'w', encoding='utf-8') as f:
-                            f.write(content)
-                        os.replace(temp_path, abs_path)
-                    except Exception as e:
-                        # Clean up temp file if write failed
-                        if os.path.exists(temp_path):
-                            try:
-                                os.remove(temp_path)
-                            except:
-                                pass
-                        failed_files.append(f"{file_path} (write error: {str(e)})")
-                        continue
-                    
-                    # Verify write was successful
-                    new_checksum = generate_checksum(abs_path)
-                    successful_files.append(f"{file_path} ({file_replacements} replacements)")
-                    total_replacements += file_replacements
-                    processed_file_paths.append(abs_path)
-                else:
-                    # No emojis found, but file was processed successfully
-                    successful_files.append(f"{file_path} (no emojis found)")
-                    
+                return True, f"{file_path} ({file_replacements} replacements)", file_replacements, abs_path
+            
+            except Exception as e:
+                return False, f"{file_path} (error: {str(e)})", 0, None
+        
+        # Validate every path up front and keep one entry per file: two
+        # spellings of the same file (a.txt, ./a.txt) must not be rewritten
+        # concurrently, nor have their replacements counted twice
+        results = [None] * len(file_paths)
+        abs_paths = [None] * len(file_paths)
+        first_index = {}  # Index of the first input path for each file
+        for i, file_path in enumerate(file_paths):
+            try:
+                abs_paths[i] = validate_operation(file_path, "replace_all_emojis_in_files", check_binary=True)
             except Exception as e:
-                failed_files.append(f"{file_path} (error: {str(e)})")
+                results[i] = (False, f"{file_path} (error: {str(e)})", 0, None)
+                continue
+            first_index.setdefault(abs_paths[i], i)
+        
+        # Process files concurrently; the work is dominated by file I/O,
+        # which releases the GIL
+        def _process_all() -> list:
+            max_workers = min(len(first_index), 32, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return list(executor.map(lambda item: _process_one(file_paths[item[1]], item[0]),
+                                         first_index.items()))
+        
+        if first_index:
+            for i, result in zip(first_index.values(), await asyncio.to_thread(_process_all)):
+                results[i] = result
+        
+        # Repeated files report the outcome of their first occurrence
+        for i, file_path in enumerate(file_paths):
+            if results[i] is None:
+                first = first_index[abs_paths[i]]
+                results[i] = (results[first][0], f"{file_path} (same file as {file_paths[first]})", 0, None)
+        
+        # Track processing results
+        successful_files = []
+        failed_files = []
+        total_replacements = 0
+        processed_file_paths = []  # For Git commit tracking
+        
+        for ok, file_info, file_replacements, abs_path in results:
+            if not ok:
+                failed_files.append(file_info)
+                continue
+            successful_files.append(file_info)
+            if abs_path is not None:
+                total_replacements += file_replacements
+                processed_file_paths.append(abs_path)
         
         # Prepare result summary
         total_files = len(file_paths)
@@ -607,9 +799,7 @@ def register_file_operations(mcp: FastMCP) -> None:
         if processed_file_paths:
             commit_result = ""
             try:
-                # Use the first processed file's directory for Git operations
-                commit_path = os.path.dirname(processed_file_paths[0]) if processed_file_paths else "."
-                commit = auto_commit_changes(commit_path, "replace_all_emojis_in_files", commit_message)
+                commit = auto_commit_paths(processed_file_paths, "replace_all_emojis_in_files", commit_message)
                 if commit:
                     commit_result = f"\n{commit}"
             except GitError as e:
@@ -620,9 +810,9 @@ def register_file_operations(mcp: FastMCP) -> None:
         
         # Add information about the emoji mapping used
         if emoji_mapping is not None:
-            overrides = len([k for k in emoji_mapping.keys() if k in default_emoji_mapping])
-            additions = len([k for k in emoji_mapping.keys() if k not in default_emoji_mapping])
-            mapping_info = f"\nUsed emoji mapping: Default mapping ({len(default_emoji_mapping)} patterns) + Custom overrides ({overrides} patterns) + Custom additions ({additions} patterns) = {len(active_mapping)} total patterns"
+            overrides = len([k for k in emoji_mapping.keys() if k in _DEFAULT_EMOJI_MAPPING])
+            additions = len([k for k in emoji_mapping.keys() if k not in _DEFAULT_EMOJI_MAPPING])
+            mapping_info = f"\nUsed emoji mapping: Default mapping ({len(_DEFAULT_EMOJI_MAPPING)} patterns) + Custom overrides ({overrides} patterns) + Custom additions ({additions} patterns) = {len(active_mapping)} total patterns"
         else:
             mapping_info = f"\nUsed emoji mapping: Default mapping with {len(active_mapping)} emoji patterns"
         result_lines.append(mapping_info)
@@ -863,377 +1053,6 @@ def register_file_operations(mcp: FastMCP) -> None:
         
         return "\n".join(result_lines)
 
-    @with_error_handling
-    @mcp.tool()
-    async def replace_all_emojis_in_files(file_paths: list[str], emoji_mapping: Dict[str, str] = None, commit_message: str = None) -> str:
-        """
-        Replace all emoji occurrences in multiple text files with text representations.
-        
-        This tool processes multiple files to replace Unicode emoji characters with
-        their text equivalents, helping to resolve encoding issues and improve
-        text compatibility across different systems.
-        
-        Default Emoji Mapping (125+ patterns - expanded from docs/missing_emoji_mappings.md):
-        
-        Status & Actions: 🔧 -> [API], ⚡ -> [FAST], 🚀 -> [PERF], 📦 -> [PKG], 🎯 -> [TARGET], 
-        🔒 -> [SEC], 💡 -> [TIP], 🔥 -> [FIRE], 💪 -> [STRONG], 🧪 -> [TEST]
-        
-        Files & Data: 📁 -> [DIR], 📂 -> [FOLDER], 📄 -> [FILE], 📝 -> [NOTE], 📋 -> [LIST], 
-        📖 -> [BOOK], 📊 -> [CHART], 📈 -> [CHART], 📉 -> [CHART]
-        
-        Technology & Devices: 💻 -> [COMP], 🖥️ -> [DESKTOP], 📱 -> [MOBILE], 🐳 -> [DOCKER], 
-        🌐 -> [NET], 📶 -> [NET], 🔌 -> [PLUG], ⚙️ -> [GEAR]
-        
-        Results & Status: ✅ -> [PASS], ❌ -> [FAIL], ⚠️ -> [WARN], ℹ️ -> [INFO], 
-        ❓ -> [QUESTION], ❗ -> [EXCLAIM2], 🚨 -> [ERR], 🎉 -> [SUCCESS]
-        
-        Intelligence & Processing: 🧠 -> [MEMORY], 🧮 -> [COMPUTE], 🤖 -> [BOT], 🔮 -> [PREDICT]
-        
-        Connection & Flow: 🔗 -> [LINK], 🔄 -> [CYCLE], 🔁 -> [REPEAT], 🔂 -> [REPEAT_ONE], 
-        🔃 -> [VERTICAL]
-        
-        Places & Environment: 🏠 -> [HOST], 🏆 -> [AWARD], 🎪 -> [STRATEGY], 🏢 -> [OFFICE], 
-        🏭 -> [FACTORY]
-        
-        Tools & Objects: 🧹 -> [CLEANUP], 🗑️ -> [GARBAGE], ✍️ -> [WRITE], 🖊️ -> [PEN], 
-        🔨 -> [BUILD]
-        
-        Programming Languages: 🐼 -> [PANDAS], 🐍 -> [PYTHON], 🐧 -> [LINUX], 🦀 -> [RUST]
-        
-        Navigation: ➡️ -> [RIGHT], ⬅️ -> [LEFT], ⬆️ -> [UP], ⬇️ -> [DOWN]
-        
-        Communication: 💬 -> [COMMENT], 💭 -> [THOUGHT], 🗨️ -> [SPEAK], 📞 -> [PHONE], 
-        📧 -> [EMAIL]
-        
-        And 90+ more comprehensive patterns for complete emoji coverage!
-        
-        Args:
-            file_paths: List of paths to the text files to process
-            emoji_mapping: Optional custom emoji mapping dictionary that will be merged 
-                          with the default mapping. Any emoji in this dictionary will 
-                          override the default replacement for that emoji, and new 
-                          emojis will be added to the mapping. The default mapping 
-                          remains intact for all other emojis.
-            commit_message: Custom Git commit message (optional)
-            
-        Returns:
-            str: Summary of processing results including files processed, 
-                 total replacements made, and any errors encountered
-                 
-        Raises:
-            ValueError: If file paths are invalid, files are binary, or processing fails
-            
-        Security Notes:
-            - Only processes text files (binary files are rejected for security)
-            - Validates all file paths to prevent directory traversal attacks
-            - Uses atomic file operations to prevent data corruption
-            - Maintains file checksums for integrity verification
-        """
-        # Validate input parameters
-        if not file_paths:
-            raise ValueError("No file paths provided")
-        
-        if not isinstance(file_paths, list):
-            raise ValueError("file_paths must be a list of strings")
-        
-        # Default comprehensive emoji mapping based on docs/fix_emojis.py
-        default_emoji_mapping = {
-            # Basic status indicators
-            '\U0001f527': '[API]',      # 🔧 wrench
-            '\U000026a1': '[FAST]',     # ⚡ lightning
-            '\U0001f680': '[PERF]',     # 🚀 rocket
-            '\U0001f4e6': '[PKG]',      # 📦 package
-            '\U0001f4ca': '[CHART]',    # 📊 chart
-            '\U0001f4c8': '[CHART]',    # 📈 chart increasing
-            '\U0001f4c9': '[CHART]',    # 📉 chart decreasing
-            '\U0001f3af': '[TARGET]',   # 🎯 target
-            '\U0001f512': '[SEC]',      # 🔒 lock
-            '\U0001f30d': '[GLOBAL]',   # 🌍 globe
-            '\U0001f30e': '[WEB]',      # 🌎 globe
-            '\U0001f4f6': '[NET]',      # 📶 network
-            '\U0001f310': '[NET]',      # 🌐 network
-            '\U0001f4a1': '[TIP]',      # 💡 bulb
-            '\U0001f3c1': '[FINAL]',    # 🏁 checkered flag
-            '\U0001f389': '[SUCCESS]',  # 🎉 party
-            '\U0001f38a': '[DONE]',     # 🎊 confetti
-            '\U0001f40c': '[SLOW]',     # 🐌 snail
-            '\U0001f433': '[DOCKER]',   # 🐳 whale
-            '\U0001f6e1\ufe0f': '[SHIELD]', # 🛡️ shield
-            '\U0001f6e1': '[SHIELD]',   # 🛡 shield
-            '\U0001f6a8': '[ERR]',      # 🚨 siren
-            '\U0001f50d': '[SEARCH]',   # 🔍 magnifying glass
-            '\U0001f514': '[CONN]',     # 🔔 bell
-            '\U0001f525': '[FIRE]',     # 🔥 fire
-            '\U0001f4aa': '[STRONG]',   # 💪 muscle
-            '\U0001f9ea': '[TEST]',     # 🧪 test tube
-            '\U0001f4dd': '[NOTE]',     # 📝 memo
-            '\U0001f4cb': '[LIST]',     # 📋 clipboard
-            '\U0001f4c4': '[FILE]',     # 📄 document
-            '\U0001f4c1': '[DIR]',      # 📁 folder
-            '\U0001f4c2': '[FOLDER]',   # 📂 open folder
-            '\U0001f4d6': '[BOOK]',     # 📖 book
-            '\U0001f4bb': '[COMP]',     # 💻 computer
-            '\U0001f5a5\ufe0f': '[DESKTOP]', # 🖥️ desktop
-            '\U0001f5a5': '[DESKTOP]',  # 🖥 desktop
-            '\U0001f4f1': '[MOBILE]',   # 📱 mobile
-            '\U000023f1\ufe0f': '[TIMER]', # ⏱️ timer
-            '\U000023f1': '[TIMER]',    # ⏱ timer
-            '\U0001f552': '[TIME]',     # 🕒 clock
-            '\U0001f195': '[NEW]',      # 🆕 new
-            '\U0001f199': '[UP]',       # 🆙 up
-            '\U0001f19a': '[VS]',       # 🆚 vs
-            '\U0001f4a5': '[BOOM]',     # 💥 explosion
-            '\U0001f525': '[HOT]',      # 🔥 fire
-            '\U00002744\ufe0f': '[COLD]', # ❄️ snowflake
-            '\U00002744': '[COLD]',     # ❄ snowflake
-            '\U0001f522': '[NUMS]',     # 🔢 numbers
-            '\U0001f523': '[SYMBOLS]',  # 🔣 symbols
-            '\U0001f524': '[ABC]',      # 🔤 letters
-            '\U00002699\ufe0f': '[GEAR]', # ⚙️ gear
-            '\U00002699': '[GEAR]',     # ⚙ gear
-            '\U00002696\ufe0f': '[BALANCE]', # ⚖️ balance
-            '\U00002696': '[BALANCE]',  # ⚖ balance
-            '\U0001f4e4': '[OUTBOX]',   # 📤 outbox
-            '\U0001f4e5': '[INBOX]',    # 📥 inbox
-            '\U0001f4ed': '[EMPTY]',    # 📭 mailbox
-            '\U0001f4ec': '[MAIL]',     # 📬 mailbox
-            '\U0001f4ea': '[MAILBOX]',  # 📪 closed mailbox
-            '\U0001f4e8': '[ENVELOPE]', # 📨 envelope
-            '\U0001f194': '[ID]',       # 🆔 ID
-            '\U0001f50c': '[PLUG]',     # 🔌 plug
-            '\U0001f4de': '[PHONE]',    # 📞 telephone
-            '\U0001f4e0': '[FAX]',      # 📠 fax
-            '\U0001f4fc': '[VHS]',      # 📼 videocassette
-            '\U0001f4fd\ufe0f': '[FILM]', # 📽️ film projector
-            '\U0001f4fd': '[FILM]',     # 📽 film projector
-            '\U0001f3a5': '[CAMERA]',   # 🎥 movie camera
-            '\U0001f4f7': '[PHOTO]',    # 📷 camera
-            '\U0001f4f8': '[FLASH]',    # 📸 camera with flash
-            '\U0001f50e': '[ZOOM]',     # 🔎 magnifying glass
-            '\U0001f50f': '[LOCK]',     # 🔏 lock with pen
-            '\U0001f510': '[UNLOCK]',   # 🔐 lock with key
-            '\U0001f511': '[KEY]',      # 🔑 key
-            '\U0001f513': '[OPEN]',     # 🔓 unlocked
-            '\U0001f6aa': '[DOOR]',     # 🚪 door
-            '\U0001f4ac': '[COMMENT]',  # 💬 speech balloon
-            '\U0001f4ad': '[THOUGHT]',  # 💭 thought balloon
-            '\U0001f5e8\ufe0f': '[SPEAK]', # 🗨️ left speech bubble
-            '\U0001f5e8': '[SPEAK]',    # 🗨 left speech bubble
-            '\U0001f5ef\ufe0f': '[ANGRY]', # 🗯️ right anger bubble
-            '\U0001f5ef': '[ANGRY]',    # 🗯 right anger bubble
-            '\U0001f4f0': '[NEWS]',     # 📰 newspaper
-            '\U0001f4f3': '[VIBRATE]',  # 📳 vibration mode
-            '\U0001f4f4': '[SILENT]',   # 📴 mobile phone off
-            '\U0001f4f5': '[NO_MOBILE]', # 📵 no mobile phones
-            '\U0001f4f6': '[SIGNAL]',   # 📶 antenna bars
-            '\U0001f4f7': '[CAMERA2]',  # 📷 camera
-            '\U0001f4f9': '[VIDEO]',    # 📹 video camera
-            '\U0001f4fa': '[TV]',       # 📺 television
-            '\U0001f4fb': '[RADIO]',    # 📻 radio
-            '\U0001f4fc': '[TAPE]',     # 📼 videocassette
-            '\U0001f50a': '[LOUD]',     # 🔊 speaker high volume
-            '\U0001f50b': '[LOW]',      # 🔋 battery
-            '\U0001f50c': '[ELECTRIC]', # 🔌 electric plug
-            '\U0001f4af': '[100]',      # 💯 hundred points
-            
-            # Add checkmark and X emojis
-            '\u2705': '[PASS]',         # ✅ check mark
-            '\u274c': '[FAIL]',         # ❌ cross mark
-            '\u26a0\ufe0f': '[WARN]',   # ⚠️ warning
-            '\u26a0': '[WARN]',         # ⚠ warning
-            '\u2139\ufe0f': '[INFO]',   # ℹ️ information
-            '\u2139': '[INFO]',         # ℹ information
-            '\u2753': '[QUESTION]',     # ❓ question mark
-            '\u2754': '[QUESTION2]',    # ❔ white question mark
-            '\u2755': '[EXCLAIM]',      # ❕ white exclamation mark
-            '\u2757': '[EXCLAIM2]',     # ❗ exclamation mark
-            '\u27a1\ufe0f': '[RIGHT]',  # ➡️ right arrow
-            '\u27a1': '[RIGHT]',        # ➡ right arrow
-            '\u2b05\ufe0f': '[LEFT]',   # ⬅️ left arrow
-            '\u2b05': '[LEFT]',         # ⬅ left arrow
-            '\u2b06\ufe0f': '[UP]',     # ⬆️ up arrow
-            '\u2b06': '[UP]',           # ⬆ up arrow
-            '\u2b07\ufe0f': '[DOWN]',   # ⬇️ down arrow
-            '\u2b07': '[DOWN]',         # ⬇ down arrow
-            
-            # Missing emoji mappings from docs/missing_emoji_mappings.md
-            # Brain/Intelligence Category
-            '\U0001f9e0': '[MEMORY]',   # 🧠 brain
-            '\U0001f9ee': '[COMPUTE]',  # 🧮 abacus
-            '\U0001f916': '[BOT]',      # 🤖 robot
-            '\U0001f52e': '[PREDICT]',  # 🔮 crystal ball
-            
-            # Connection/Process Category
-            '\U0001f517': '[LINK]',     # 🔗 link
-            '\U0001f504': '[CYCLE]',    # 🔄 counterclockwise arrows
-            '\U0001f501': '[REPEAT]',   # 🔁 repeat button
-            '\U0001f502': '[REPEAT_ONE]', # 🔂 repeat single
-            '\U0001f503': '[VERTICAL]', # 🔃 clockwise vertical arrows
-            
-            # Places/Environment Category
-            '\U0001f3e0': '[HOST]',     # 🏠 house
-            '\U0001f3c6': '[AWARD]',    # 🏆 trophy
-            '\U0001f3aa': '[STRATEGY]', # 🎪 circus tent
-            '\U0001f3e2': '[OFFICE]',   # 🏢 office building
-            '\U0001f3ed': '[FACTORY]',  # 🏭 factory
-            
-            # Tools/Objects Category
-            '\U0001f9f9': '[CLEANUP]',  # 🧹 broom
-            '\U0001f5d1\ufe0f': '[GARBAGE]', # 🗑️ wastebasket
-            '\U0001f5d1': '[GARBAGE]',  # 🗑 wastebasket
-            '\u270d\ufe0f': '[WRITE]',  # ✍️ writing hand
-            '\u270d': '[WRITE]',        # ✍ writing hand
-            '\U0001f58a\ufe0f': '[PEN]', # 🖊️ pen
-            '\U0001f58a': '[PEN]',      # 🖊 pen
-            '\U0001f528': '[BUILD]',    # 🔨 hammer
-            
-            # Animals Category (Context-Specific)
-            '\U0001f43c': '[PANDAS]',   # 🐼 panda
-            '\U0001f40d': '[PYTHON]',   # 🐍 snake
-            '\U0001f427': '[LINUX]',    # 🐧 penguin
-            '\U0001f980': '[RUST]',     # 🦀 crab
-            
-            # Symbols and Punctuation
-            '\u2022': '-',              # • bullet point to dash
-        }
-        
-        # Start with default mapping and merge/override with custom mapping if provided
-        active_mapping = default_emoji_mapping.copy()
-        
-        if emoji_mapping is not None:
-            if not isinstance(emoji_mapping, dict):
-                raise ValueError("emoji_mapping must be a dictionary")
-            # Update default mapping with custom mappings (overrides existing, adds new)
-            active_mapping.update(emoji_mapping)
-        
-        # Track processing results
-        successful_files = []
-        failed_files = []
-        total_replacements = 0
-        processed_file_paths = []  # For Git commit tracking
-        
-        # Process each file
-        for file_path in file_paths:
-            try:
-                # Validate file path and security checks
-                abs_path = validate_operation(file_path, "replace_all_emojis_in_files", check_binary=True)
-                
-                # Check if file exists and is a text file
-                if not os.path.exists(abs_path):
-                    failed_files.append(f"{file_path} (file does not exist)")
-                    continue
-                
-                if not os.path.isfile(abs_path):
-                    failed_files.append(f"{file_path} (not a regular file)")
-                    continue
-                
-                # Get original file info
-                original_checksum = generate_checksum(abs_path)
-                file_size = os.path.getsize(abs_path)
-                
-                # Read file content with proper error handling
-                try:
-                    with open(abs_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                except UnicodeDecodeError:
-                    failed_files.append(f"{file_path} (binary file - text files only)")
-                    continue
-                except Exception as e:
-                    failed_files.append(f"{file_path} (read error: {str(e)})")
-                    continue
-                
-                # Track changes for this file
-                original_content = content
-                file_replacements = 0
-                
-                # Apply emoji replacements
-                for emoji_char, replacement in active_mapping.items():
-                    if emoji_char in content:
-                        count = content.count(emoji_char)
-                        content = content.replace(emoji_char, replacement)
-                        file_replacements += count
-                
-                # Only write file if changes were made
-                if file_replacements > 0:
-                    # Validate new content size
-                    if len(content) > MAX_FILE_SIZE:
-                        failed_files.append(f"{file_path} (resulting file too large: {len(content)} bytes)")
-                        continue
-                    
-                    # Use atomic write operation with proper error handling
-                    temp_path = f"{abs_path}.tmp.{os.getpid()}.{int(time.time())}"
-                    try:
-                        with open(temp_path, 'w', encoding='utf-8') as f:
-                            f.write(content)
-                        os.replace(temp_path, abs_path)
-                    except Exception as e:
-                        # Clean up temp file if write failed
-                        if os.path.exists(temp_path):
-                            try:
-                                os.remove(temp_path)
-                            except:
-                                pass
-                        failed_files.append(f"{file_path} (write error: {str(e)})")
-                        continue
-                    
-                    # Verify write was successful
-                    new_checksum = generate_checksum(abs_path)
-                    successful_files.append(f"{file_path} ({file_replacements} replacements)")
-                    total_replacements += file_replacements
-                    processed_file_paths.append(abs_path)
-                else:
-                    # No emojis found, but file was processed successfully
-                    successful_files.append(f"{file_path} (no emojis found)")
-                    
-            except Exception as e:
-                failed_files.append(f"{file_path} (error: {str(e)})")
-        
-        # Prepare result summary
-        total_files = len(file_paths)
-        success_count = len(successful_files)
-        failure_count = len(failed_files)
-        
-        result_lines = [
-            f"Emoji replacement completed: {success_count}/{total_files} files processed successfully",
-            f"Total emoji replacements made: {total_replacements}"
-        ]
-        
-        if successful_files:
-            result_lines.append("\nSuccessfully processed files:")
-            for file_info in successful_files:
-                result_lines.append(f"  ✓ {file_info}")
-        
-        if failed_files:
-            result_lines.append(f"\nFailed to process {failure_count} files:")
-            for file_info in failed_files:
-                result_lines.append(f"  ✗ {file_info}")
-        
-        # Auto-commit if enabled and there were successful replacements
-        if processed_file_paths:
-            commit_result = ""
-            try:
-                # Use the first processed file's directory for Git operations
-                commit_path = os.path.dirname(processed_file_paths[0]) if processed_file_paths else "."
-                commit = auto_commit_changes(commit_path, "replace_all_emojis_in_files", commit_message)
-                if commit:
-                    commit_result = f"\n{commit}"
-            except GitError as e:
-                commit_result = f"\nNote: {str(e)}"
-            
-            if commit_result:
-                result_lines.append(commit_result)
-        
-        # Add information about the emoji mapping used
-        if emoji_mapping is not None:
-            overrides = len([k for k in emoji_mapping.keys() if k in default_emoji_mapping])
-            additions = len([k for k in emoji_mapping.keys() if k not in default_emoji_mapping])
-            mapping_info = f"\nUsed emoji mapping: Default mapping ({len(default_emoji_mapping)} patterns) + Custom overrides ({overrides} patterns) + Custom additions ({additions} patterns) = {len(active_mapping)} total patterns"
-        else:
-            mapping_info = f"\nUsed emoji mapping: Default mapping with {len(active_mapping)} emoji patterns"
-        result_lines.append(mapping_info)
-        
-        return "\n".join(result_lines)
-
     @with_error_handling
     @mcp.tool()
     async def replace_all_in_file(path: str, new_string: Union[str, Dict[str, Any], list, int, float, bool] = None, old_string: Union[str, Dict[str, Any], list, int, float, bool] = None, commit_message: str = None, new_str: Union[str, Dict[str, Any], list, int, float, bool] = None, old_str: Union[str, Dict[str, Any], list, int, float, bool] = None) -> str:
@@ -1284,56 +1103,170 @@ def register_file_operations(mcp: FastMCP) -> None:
             
         if '\0' in new_string:
             raise ValueError("Cannot replace with binary content")
-            
-        original_checksum = generate_checksum(abs_path)
         
-        # Read file with proper error handling
-        try:
-            with open(abs_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except UnicodeDecodeError:
-            raise ValueError(f"File {path} is not a valid text file")
+        # Replacing text with itself would rewrite and commit an identical file
+        if old_string == new_string:
+            raise ValueError("Old and new content are identical; nothing to replace")
+            
+        # Disk I/O runs in a worker thread so the event loop stays responsive
+        # while large files are rewritten.
+        occurrence_count, original_checksum, new_checksum = await asyncio.to_thread(
+            _replace_sync, abs_path, old_string.encode('utf-8'), new_string.encode('utf-8')
+        )
         
-        if old_string not in content:
+        if occurrence_count == 0:
             raise ValueError(f"The specified text to replace was not found in {path}")
         
-        # Count occurrences before replacement for reporting
-        occurrence_count = content.count(old_string)
+        # Auto-commit if enabled
+        commit_result = ""
+        try:
+            commit = auto_commit_changes(abs_path, "replace_all_in_file", commit_message)
+            if commit:
+                commit_result = f"\n{commit}"
+        except GitError as e:
+            commit_result = f"\nNote: {str(e)}"
         
-        # Replace ALL occurrences of old_string with new_string
-        updated_content = content.replace(old_string, new_string)
+        return "\n".join((
+            "Successfully replaced all occurrences in file: " + path,
+            f"Replacements made: {occurrence_count}",
+            "Original checksum: " + original_checksum,
+            "New checksum: " + new_checksum,
+        )) + commit_result
+    
+    @with_error_handling
+    @mcp.tool()
+    async def replace_all_in_files(file_paths: list[str], new_string: Union[str, Dict[str, Any], list, int, float, bool] = None, old_string: Union[str, Dict[str, Any], list, int, float, bool] = None, commit_message: str = None, new_str: Union[str, Dict[str, Any], list, int, float, bool] = None, old_str: Union[str, Dict[str, Any], list, int, float, bool] = None) -> str:
+        """
+        Replace ALL occurrences of specific text in multiple files.
         
-        # Validate new size
-        if len(updated_content) > MAX_FILE_SIZE:
-            raise ValueError(f"Updated content would be too large ({len(updated_content)} bytes). Maximum size is {MAX_FILE_SIZE} bytes.")
+        Files are rewritten concurrently in worker threads and all changes are
+        committed together, so a codebase-wide rename costs one tool call and
+        one Git commit. Files that do not contain old_string are left untouched.
         
-        # Use atomic write operation with proper error handling
-        temp_path = f"{abs_path}.tmp.{os.getpid()}.{int(time.time())}"
-        try:
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                f.write(updated_content)
-            os.replace(temp_path, abs_path)
-        except Exception as e:
-            # Clean up temp file if update failed
-            if os.path.exists(temp_path):
-                try:
-                    os.remove(temp_path)
-                except:
-                    pass
-            raise ValueError(f"Failed to update file: {str(e)}")
+        Args:
+            file_paths: List of file paths to update
+            new_string: Replacement text or object. If an object is provided, it will be serialized as JSON.
+            old_string: Text or object to find and replace. If an object is provided, it will be serialized as JSON.
+            commit_message: Custom Git commit message (optional)
+            new_str: Alternative parameter name for new_string (backup for LLM compatibility)
+            old_str: Alternative parameter name for old_string (backup for LLM compatibility)
+            
+        Returns:
+            str: Summary of replacements per file and any failures
+            
+        Raises:
+            ValueError: If parameters are invalid
+        """
+        if not file_paths:
+            raise ValueError("No file paths provided")
         
-        new_checksum = generate_checksum(abs_path)
+        # Handle backup parameters for LLM compatibility
+        # Use old_str as backup if old_string is not provided or is None
+        if old_string is None and old_str is not None:
+            old_string = old_str
+        elif old_string is None and old_str is None:
+            raise ValueError("Either old_string or old_str must be provided")
+            
+        # Use new_str as backup if new_string is not provided or is None
+        if new_string is None and new_str is not None:
+            new_string = new_str
+        elif new_string is None and new_str is None:
+            raise ValueError("Either new_string or new_str must be provided")
         
-        # Auto-commit if enabled
-        commit_result = ""
-        try:
-            commit = auto_commit_changes(abs_path, "replace_all_in_file", commit_message)
-            if commit:
-                commit_result = f"\n{commit}"
-        except GitError as e:
-            commit_result = f"\nNote: {str(e)}"
+        if not old_string:
+            raise ValueError("Old content cannot be empty")
         
-        return f"Successfully replaced all occurrences in file: {path}\nReplacements made: {occurrence_count}\nOriginal checksum: {original_checksum}\nNew checksum: {new_checksum}{commit_result}"
+        old_string = sanitize_file_string(old_string)
+        new_string = sanitize_file_string(new_string)
+        
+        if '\0' in new_string:
+            raise ValueError("Cannot replace with binary content")
+        if old_string == new_string:
+            raise ValueError("Old and new content are identical; nothing to replace")
+        
+        old_bytes = old_string.encode('utf-8')
+        new_bytes = new_string.encode('utf-8')
+        
+        def _process_one(file_path: str, abs_path: str) -> Tuple[bool, str, int, Optional[str]]:
+            try:
+                count, _, new_checksum = _replace_sync(abs_path, old_bytes, new_bytes)
+            except Exception as e:
+                return False, f"{file_path}: {str(e)}", 0, None
+            if count == 0:
+                return True, f"{file_path}: text not found", 0, None
+            return True, f"{file_path}: {count} replacements (checksum: {new_checksum})", count, abs_path
+        
+        # Bound the number of files in flight so large batches do not
+        # exhaust file descriptors or the default thread pool
+        semaphore = asyncio.Semaphore(min(32, (os.cpu_count() or 1) * 4))
+        
+        async def _run_one(file_path: str, abs_path: str) -> Tuple[bool, str, int, Optional[str]]:
+            async with semaphore:
+                return await asyncio.to_thread(_process_one, file_path, abs_path)
+        
+        # Validate every path up front and keep one entry per file: two
+        # spellings of the same file (a.txt, ./a.txt) must not be rewritten
+        # concurrently, nor have their replacements counted twice
+        results = [None] * len(file_paths)
+        abs_paths = [None] * len(file_paths)
+        first_index = {}  # Index of the first input path for each file
+        for i, file_path in enumerate(file_paths):
+            try:
+                abs_paths[i] = validate_operation(file_path, "replace_all_in_files", check_binary=True)
+            except Exception as e:
+                results[i] = (False, f"{file_path}: {str(e)}", 0, None)
+                continue
+            first_index.setdefault(abs_paths[i], i)
+        
+        unique_results = await asyncio.gather(*(_run_one(file_paths[i], abs_path) for abs_path, i in first_index.items()))
+        for i, result in zip(first_index.values(), unique_results):
+            results[i] = result
+        
+        # Repeated files report the outcome of their first occurrence
+        for i, file_path in enumerate(file_paths):
+            if results[i] is None:
+                first = first_index[abs_paths[i]]
+                results[i] = (results[first][0], f"{file_path}: same file as {file_paths[first]}", 0, None)
+        
+        successful_files = []
+        failed_files = []
+        total_replacements = 0
+        changed_paths = []
+        
+        for ok, file_info, count, abs_path in results:
+            if not ok:
+                failed_files.append(file_info)
+                continue
+            successful_files.append(file_info)
+            if abs_path is not None:
+                total_replacements += count
+                changed_paths.append(abs_path)
+        
+        result_lines = [
+            f"Replacement completed: {len(successful_files)}/{len(file_paths)} files processed successfully",
+            f"Total replacements made: {total_replacements} in {len(changed_paths)} files"
+        ]
+        
+        if successful_files:
+            result_lines.append("\nSuccessfully processed files:")
+            for file_info in successful_files:
+                result_lines.append(f"  ✓ {file_info}")
+        
+        if failed_files:
+            result_lines.append(f"\nFailed to process {len(failed_files)} files:")
+            for file_info in failed_files:
+                result_lines.append(f"  ✗ {file_info}")
+        
+        # Auto-commit if enabled and any file changed
+        if changed_paths:
+            try:
+                commit = auto_commit_paths(changed_paths, "replace_all_in_files", commit_message)
+                if commit:
+                    result_lines.append(f"\n{commit}")
+            except GitError as e:
+                result_lines.append(f"\nNote: {str(e)}")
+        
+        return "\n".join(result_lines)
     
     @with_error_handling
     @mcp.tool()
@@ -1354,58 +1287,56 @@ def register_file_operations(mcp: FastMCP) -> None:
         """
         abs_path = validate_operation(path, "read_file", check_binary=True)
         
-        # Get file info
-        file_size = os.path.getsize(abs_path)
-        checksum = generate_checksum(abs_path)
-        
         # Read with timeout protection
         try:
-            with open(abs_path, 'r', encoding='utf-8') as f:
-                if start_line is None and end_line is None:
-                    # Read entire file if no line range specified
-                    content = f.read()
-                    line_info = ""
-                else:
-                    # Read line by line for range selection
-                    all_lines = f.readlines()
-                    total_lines = len(all_lines)
-                    
-                    # Validate line numbers
-                    if start_line is not None:
-                        if start_line < 1:
-                            raise ValueError("start_line must be >= 1")
-                        if start_line > total_lines:
-                            raise ValueError(f"start_line ({start_line}) is beyond file length ({total_lines} lines)")
-                    
-                    if end_line is not None:
-                        if end_line < 1:
-                            raise ValueError("end_line must be >= 1")
-                        if end_line > total_lines:
-                            raise ValueError(f"end_line ({end_line}) is beyond file length ({total_lines} lines)")
-                    
-                    if start_line is not None and end_line is not None:
-                        if start_line > end_line:
-                            raise ValueError("start_line cannot be greater than end_line")
-                    
-                    # Determine actual line range (convert to 0-indexed)
-                    start_idx = (start_line - 1) if start_line is not None else 0
-                    end_idx = end_line if end_line is not None else total_lines
-                    
-                    # Extract the specified lines
-                    selected_lines = all_lines[start_idx:end_idx]
-                    content = ''.join(selected_lines)
-                    
-                    # Add line range info
-                    actual_start = start_idx + 1
-                    actual_end = min(end_idx, total_lines)
-                    line_info = f"Lines: {actual_start}-{actual_end} (of {total_lines} total)\n"
-                    
+            text, checksum, file_size = await _read_text_async(abs_path)
+            if start_line is None and end_line is None:
+                # Return the entire file if no line range specified
+                content = text
+                line_info = ""
+            else:
+                # Split into lines for range selection
+                all_lines = io.StringIO(text).readlines()
+                total_lines = len(all_lines)
+                
+                # Validate line numbers
+                if start_line is not None:
+                    if start_line < 1:
+                        raise ValueError("start_line must be >= 1")
+                    if start_line > total_lines:
+                        raise ValueError(f"start_line ({start_line}) is beyond file length ({total_lines} lines)")
+                
+                if end_line is not None:
+                    if end_line < 1:
+                        raise ValueError("end_line must be >= 1")
+                    if end_line > total_lines:
+                        raise ValueError(f"end_line ({end_line}) is beyond file length ({total_lines} lines)")
+                
+                if start_line is not None and end_line is not None:
+                    if start_line > end_line:
+                        raise ValueError("start_line cannot be greater than end_line")
+                
+                # Determine actual line range (convert to 0-indexed)
+                start_idx = (start_line - 1) if start_line is not None else 0
+                end_idx = end_line if end_line is not None else total_lines
+                
+                # Extract the specified lines
+                selected_lines = all_lines[start_idx:end_idx]
+                content = ''.join(selected_lines)
+                
+                # Add line range info
+                actual_start = start_idx + 1
+                actual_end = min(end_idx, total_lines)
+                line_info = f"Lines: {actual_start}-{actual_end} (of {total_lines} total)\n"
+                
         except UnicodeDecodeError as e:
             raise ValueError(f"Cannot read binary file {path}. Only text files are supported.")
         except Exception as e:
             raise ValueError(f"Error reading file: {str(e)}")
             
         file_info = f"File: {path}\nSize: {file_size} bytes\nChecksum (SHA-256): {checksum}\n{line_info}\nContent:\n\n"
+        # Tools and resources return whole strings, so the output cannot be
+        # streamed; a single concatenation is the only copy of the content
         return file_info + content
 
     @with_error_handling
@@ -1433,14 +1364,9 @@ def register_file_operations(mcp: FastMCP) -> None:
             try:
                 abs_path = validate_operation(path, "read_file", check_binary=True)
                 
-                # Get file info
-                file_size = os.path.getsize(abs_path)
-                checksum = generate_checksum(abs_path)
-                
                 # Read with timeout protection
                 try:
-                    with open(abs_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
+                    content, checksum, file_size = await _read_text_async(abs_path)
                     
                     file_info = f"File: {path}\nSize: {file_size} bytes\nChecksum (SHA-256): {checksum}\n\nContent:\n\n"
                     results.append(file_info + content)
@@ -1600,18 +1526,9 @@ def register_file_operations(mcp: FastMCP) -> None:
             os.makedirs(directory)
         
         # Use atomic write operation with proper error handling
-        temp_path = f"{abs_path}.tmp.{os.getpid()}.{int(time.time())}"
         try:
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            os.replace(temp_path, abs_path)
+            atomic_write(abs_path, content.encode('utf-8'))
         except Exception as e:
-            # Clean up temp file if creation failed
-            if os.path.exists(temp_path):
-                try:
-                    os.remove(temp_path)
-                except:
-                    pass
             raise ValueError(f"Failed to write file: {str(e)}")
         
         # Get file details for verification
@@ -1696,18 +1613,9 @@ def register_file_operations(mcp: FastMCP) -> None:
             raise ValueError(f"Updated content would be too large ({len(updated_content)} bytes). Maximum size is {MAX_FILE_SIZE} bytes.")
         
         # Use atomic write operation with proper error handling
-        temp_path = f"{abs_path}.tmp.{os.getpid()}.{int(time.time())}"
         try:
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                f.write(updated_content)
-            os.replace(temp_path, abs_path)
+            atomic_write(abs_path, updated_content.encode('utf-8'))
         except Exception as e:
-            # Clean up temp file if update failed
-            if os.path.exists(temp_path):
-                try:
-                    os.remove(temp_path)
-                except:
-                    pass
             raise ValueError(f"Failed to update file: {str(e)}")
         
         new_checksum = generate_checksum(abs_path)
@@ -1765,18 +1673,9 @@ def register_file_operations(mcp: FastMCP) -> None:
             os.makedirs(directory)
         
         # Use atomic write operation with proper error handling
-        temp_path = f"{abs_path}.tmp.{os.getpid()}.{int(time.time())}"
         try:
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            os.replace(temp_path, abs_path)
+            atomic_write(abs_path, content.encode('utf-8'))
         except Exception as e:
-            # Clean up temp file if rewrite failed
-            if os.path.exists(temp_path):
-                try:
-                    os.remove(temp_path)
-                except:
-                    pass
             raise ValueError(f"Failed to rewrite file: {str(e)}")
         
         new_checksum = generate_checksum(abs_path)
@@ -1875,18 +1774,9 @@ def register_file_operations(mcp: FastMCP) -> None:
         updated_content = content.replace(old_string, "")
         
         # Use atomic write operation with proper error handling
-        temp_path = f"{abs_path}.tmp.{os.getpid()}.{int(time.time())}"
         try:
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                f.write(updated_content)
-            os.replace(temp_path, abs_path)
+            atomic_write(abs_path, updated_content.encode('utf-8'))
         except Exception as e:
-            # Clean up temp file if update failed
-            if os.path.exists(temp_path):
-                try:
-                    os.remove(temp_path)
-                except:
-                    pass
             raise ValueError(f"Failed to update file: {str(e)}")
         
         new_checksum = generate_checksum(abs_path)
@@ -1972,7 +1862,7 @@ def register_file_operations(mcp: FastMCP) -> None:
             
     @with_error_handling
     @mcp.tool()
-    async def insert_in_file(path: str, content: Union[str, Dict[str, Any], list, int, float, bool], after_line: int = None, before_line: int = None, after_pattern: str = None, commit_message: str = None) -> str:
+    async def insert_in_file(path: str, content: Union[str, Dict[str, Any], list, int, float, bool], after_line: int = None, before_line: int = None, after_pattern: str = None, commit_message: str = None, durable: Optional[bool] = None) -> str:
         """
         Insert content at a specific position in a file.
         
@@ -1982,8 +1872,12 @@ def register_file_operations(mcp: FastMCP) -> None:
                     it will be serialized as JSON.
             after_line: Line number to insert after (0-indexed)
             before_line: Line number to insert before (0-indexed)
-            after_pattern: Pattern to search for and insert after the first occurrence
+            after_pattern: Pattern to search for and insert after the first occurrence (single line)
             commit_message: Custom Git commit message (optional)
+            durable: True always writes through a fsynced temp file and
+                    atomic rename. False rewrites the file in place. When
+                    omitted, the temp file and rename are used and
+                    DURABLE_WRITES decides the fsync.
             
         Returns:
             str: Success message with details of the insertion
@@ -1993,17 +1887,6 @@ def register_file_operations(mcp: FastMCP) -> None:
         """
         abs_path = validate_operation(path, "insert_in_file", check_binary=True)
         
-        # Validate that the file exists
-        if not os.path.exists(abs_path):
-            raise ValueError(f"File does not exist at {path}. Use create_file operation to create it first.")
-        
-        # Validate position specification - only one method should be provided
-        position_methods = sum(1 for p in [after_line is not None, before_line is not None, after_pattern is not None] if p)
-        if position_methods == 0:
-            raise ValueError("Must specify one of: after_line, before_line, or after_pattern")
-        if position_methods > 1:
-            raise ValueError("Only one position specifier can be used: after_line, before_line, or after_pattern")
-        
         # Handle different content types
         content = sanitize_file_string(content)
         
@@ -2011,21 +1894,33 @@ def register_file_operations(mcp: FastMCP) -> None:
         if not content:
             raise ValueError("Content to insert cannot be empty")
             
-        if '\0' in content:
+        if content.find('\0') >= 0:
             raise ValueError("Cannot insert binary content")
         
-        # Get original file information for verification
-        original_checksum = generate_checksum(abs_path)
+        # Validate position specification - only one method should be provided
+        position_methods = (after_line is not None) + (before_line is not None) + (after_pattern is not None)
+        if position_methods == 0:
+            raise ValueError("Must specify one of: after_line, before_line, or after_pattern")
+        if position_methods > 1:
+            raise ValueError("Only one position specifier can be used: after_line, before_line, or after_pattern")
         
-        # Read the file content with proper error handling
+        # Read the raw file content with proper error handling; a missing file
+        # is detected by the open itself rather than a separate stat
         try:
-            with open(abs_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
+            with open(abs_path, 'rb') as f:
+                data = f.read()
+            data.decode('utf-8')
+        except FileNotFoundError:
+            raise ValueError(f"File does not exist at {path}. Use create_file operation to create it first.")
         except UnicodeDecodeError:
             raise ValueError(f"File {path} is not a valid text file")
         except Exception as e:
             raise ValueError(f"Error reading file: {str(e)}")
         
+        # Get original file information for verification
+        original_checksum = hashlib.sha256(data).hexdigest()
+        line_count = data.count(b'\n') + (1 if data and not data.endswith(b'\n') else 0)
+        
         # Determine insertion position
         insertion_index = None
         position_description = ""
@@ -2033,59 +1928,65 @@ def register_file_operations(mcp: FastMCP) -> None:
         if after_line is not None:
             if not isinstance(after_line, int) or after_line < 0:
                 raise ValueError("after_line must be a non-negative integer")
-            if after_line >= len(lines):
-                raise ValueError(f"after_line value {after_line} is out of range. File has {len(lines)} lines (0-indexed).")
+            if after_line >= line_count:
+                raise ValueError(f"after_line value {after_line} is out of range. File has {line_count} lines (0-indexed).")
             insertion_index = after_line + 1
             position_description = f"after line {after_line}"
         
         elif before_line is not None:
             if not isinstance(before_line, int) or before_line < 0:
                 raise ValueError("before_line must be a non-negative integer")
-            if before_line > len(lines):
-                raise ValueError(f"before_line value {before_line} is out of range. File has {len(lines)} lines (0-indexed).")
+            if before_line > line_count:
+                raise ValueError(f"before_line value {before_line} is out of range. File has {line_count} lines (0-indexed).")
             insertion_index = before_line
             position_description = f"before line {before_line}"
         
         elif after_pattern is not None:
-            pattern_found = False
-            for i, line in enumerate(lines):
-                if after_pattern in line:
-                    insertion_index = i + 1
-                    position_description = f"after the pattern '{after_pattern}' (found at line {i})"
-                    pattern_found = True
-                    break
-            if not pattern_found:
+            # Patterns are matched within a single line; searching the whole
+            # buffer would otherwise let one span a line break
+            if '\n' in after_pattern:
+                raise ValueError("after_pattern cannot contain a line break")
+            # Search the whole buffer once and derive the line number from
+            # the newlines before the match
+            pattern_pos = data.find(after_pattern.encode('utf-8'))
+            if pattern_pos < 0:
                 raise ValueError(f"Pattern '{after_pattern}' not found in file {path}")
-        
-        # Check if resulting file would be too large
-        current_size = os.path.getsize(abs_path)
-        content_size = len(content)
-        if current_size + content_size > MAX_FILE_SIZE:
-            raise ValueError(f"Resulting file would be too large ({current_size + content_size} bytes). Maximum size is {MAX_FILE_SIZE} bytes.")
+            line_number = data.count(b'\n', 0, pattern_pos)
+            insertion_index = line_number + 1
+            position_description = f"after the pattern '{after_pattern}' (found at line {line_number})"
         
         # Ensure the content ends with a newline if inserting in the middle of the file
-        if insertion_index < len(lines) and not content.endswith('\n'):
+        if insertion_index < line_count and not content.endswith('\n'):
             content += '\n'
+        content_bytes = content.encode('utf-8')
         
-        # Insert the content at the appropriate position
-        lines.insert(insertion_index, content)
+        # Check if resulting file would be too large, using the bytes already read
+        current_size = len(data)
+        content_size = len(content_bytes)
+        if current_size + content_size > MAX_FILE_SIZE:
+            raise ValueError(f"Resulting file would be too large ({current_size + content_size} bytes). Maximum size is {MAX_FILE_SIZE} bytes.")
         
-        # Use atomic write operation with proper error handling
-        temp_path = f"{abs_path}.tmp.{os.getpid()}.{int(time.time())}"
+        # Byte offset where the insertion line starts
+        offset = 0
+        for _ in range(insertion_index):
+            newline = data.find(b'\n', offset)
+            if newline < 0:
+                offset = len(data)
+                break
+            offset = newline + 1
+        
+        # Splice the content into the file (atomically when durable); the
+        # existing bytes around it are copied by the kernel
         try:
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                f.writelines(lines)
-            os.replace(temp_path, abs_path)
+            insert_bytes(abs_path, offset, content_bytes, durable=durable)
         except Exception as e:
-            # Clean up temp file if update failed
-            if os.path.exists(temp_path):
-                try:
-                    os.remove(temp_path)
-                except:
-                    pass
             raise ValueError(f"Failed to update file: {str(e)}")
         
-        new_checksum = generate_checksum(abs_path)
+        view = memoryview(data)
+        new_hash = hashlib.sha256(view[:offset])
+        new_hash.update(content_bytes)
+        new_hash.update(view[offset:])
+        new_checksum = new_hash.hexdigest()
         
         # Auto-commit if enabled
         commit_result = ""
@@ -2100,12 +2001,14 @@ def register_file_operations(mcp: FastMCP) -> None:
 
     @with_error_handling
     @mcp.tool()
-    async def file_exists(path: str) -> str:
+    async def file_exists(path: str, include_checksum: bool = False, include_size: bool = False) -> str:
         """
         Check if a file exists at the specified path.
         
         Args:
             path: Path to check for file existence
+            include_checksum: Include the file's SHA-256 checksum (reads the whole file)
+            include_size: Include the file size in bytes
             
         Returns:
             str: Status message indicating whether the file exists
@@ -2118,18 +2021,21 @@ def register_file_operations(mcp: FastMCP) -> None:
             abs_path = validate_operation(path, "file_exists", check_exists=False)
             
             # Check if path exists and is a file
-            if os.path.exists(abs_path):
-                if os.path.isfile(abs_path):
-                    # Get file info for additional details
-                    file_size = os.path.getsize(abs_path)
-                    checksum = generate_checksum(abs_path)
-                    return f"File exists: {path}\nSize: {file_size} bytes\nChecksum: {checksum}"
-                elif os.path.isdir(abs_path):
-                    return f"Path exists but is a directory, not a file: {path}"
-                else:
-                    return f"Path exists but is neither a file nor a directory: {path}"
-            else:
+            st = _classify(abs_path)
+            if st is None:
                 return f"File does not exist: {path}"
+            elif stat.S_ISREG(st.st_mode):
+                # Only add the details that were asked for
+                result = f"File exists: {path}"
+                if include_size:
+                    result += f"\nSize: {st.st_size} bytes"
+                if include_checksum:
+                    result += f"\nChecksum: {generate_checksum(abs_path)}"
+                return result
+            elif stat.S_ISDIR(st.st_mode):
+                return f"Path exists but is a directory, not a file: {path}"
+            else:
+                return f"Path exists but is neither a file nor a directory: {path}"
                 
         except Exception as e:
             return f"Error checking file existence: {str(e)}"
@@ -2157,24 +2063,31 @@ def register_file_operations(mcp: FastMCP) -> None:
         successful_deletions = []
         failed_deletions = []
         deleted_files = []  # For Git commit tracking
+        validated = {}  # Validation results by input path
         
         # Process each file deletion
         for path in paths:
             try:
-                # Validate path
-                abs_path = validate_operation(path, "delete_file")
+                # Validate path, reusing the stat validation took; a repeated
+                # path is statted again as an earlier entry may have deleted it
+                abs_path = validated.get(path)
+                if abs_path is None:
+                    abs_path, st = validate_operation_stat(path, "delete_file")
+                    validated[path] = abs_path
+                else:
+                    st = _classify(abs_path)
                 
                 # Check if path exists
-                if not os.path.exists(abs_path):
+                if st is None:
                     failed_deletions.append(f"{path} (file does not exist)")
                     continue
                 
                 # Check if it's a file (not a directory)
-                if os.path.isdir(abs_path):
+                if stat.S_ISDIR(st.st_mode):
                     failed_deletions.append(f"{path} (is a directory, not a file)")
                     continue
                 
-                if not os.path.isfile(abs_path):
+                if not stat.S_ISREG(st.st_mode):
                     failed_deletions.append(f"{path} (is not a regular file)")
                     continue
                 
@@ -2210,9 +2123,7 @@ def register_file_operations(mcp: FastMCP) -> None:
         if deleted_files:
             commit_result = ""
             try:
-                # Use the first deleted file's directory for Git operations
-                commit_path = os.path.dirname(deleted_files[0]) if deleted_files else "."
-                commit = auto_commit_changes(commit_path, "delete_multiple_files", commit_message)
+                commit = auto_commit_paths(deleted_files, "delete_multiple_files", commit_message)
                 if commit:
                     commit_result = f"\n{commit}"
             except GitError as e:
@@ -2222,475 +2133,3 @@ def register_file_operations(mcp: FastMCP) -> None:
                 result_lines.append(commit_result)
         
         return "\n".join(result_lines)
-
-    @with_error_handling
-    @mcp.tool()
-    async def replace_all_emojis_in_files(file_paths: list[str], emoji_mapping: Dict[str, str] = None, commit_message: str = None) -> str:
-        """
-        Replace all emoji occurrences in multiple text files with text representations.
-        
-        This tool processes multiple files to replace Unicode emoji characters with
-        their text equivalents, helping to resolve encoding issues and improve
-        text compatibility across different systems.
-        
-        Default Emoji Mapping (125+ patterns - expanded from docs/missing_emoji_mappings.md):
-        
-        Status & Actions: 🔧 -> [API], ⚡ -> [FAST], 🚀 -> [PERF], 📦 -> [PKG], 🎯 -> [TARGET], 
-        🔒 -> [SEC], 💡 -> [TIP], 🔥 -> [FIRE], 💪 -> [STRONG], 🧪 -> [TEST]
-        
-        Files & Data: 📁 -> [DIR], 📂 -> [FOLDER], 📄 -> [FILE], 📝 -> [NOTE], 📋 -> [LIST], 
-        📖 -> [BOOK], 📊 -> [CHART], 📈 -> [CHART], 📉 -> [CHART]
-        
-        Technology & Devices: 💻 -> [COMP], 🖥️ -> [DESKTOP], 📱 -> [MOBILE], 🐳 -> [DOCKER], 
-        🌐 -> [NET], 📶 -> [NET], 🔌 -> [PLUG], ⚙️ -> [GEAR]
-        
-        Results & Status: ✅ -> [PASS], ❌ -> [FAIL], ⚠️ -> [WARN], ℹ️ -> [INFO], 
-        ❓ -> [QUESTION], ❗ -> [EXCLAIM2], 🚨 -> [ERR], 🎉 -> [SUCCESS]
-        
-        Intelligence & Processing: 🧠 -> [MEMORY], 🧮 -> [COMPUTE], 🤖 -> [BOT], 🔮 -> [PREDICT]
-        
-        Connection & Flow: 🔗 -> [LINK], 🔄 -> [CYCLE], 🔁 -> [REPEAT], 🔂 -> [REPEAT_ONE], 
-        🔃 -> [VERTICAL]
-        
-        Places & Environment: 🏠 -> [HOST], 🏆 -> [AWARD], 🎪 -> [STRATEGY], 🏢 -> [OFFICE], 
-        🏭 -> [FACTORY]
-        
-        Tools & Objects: 🧹 -> [CLEANUP], 🗑️ -> [GARBAGE], ✍️ -> [WRITE], 🖊️ -> [PEN], 
-        🔨 -> [BUILD]
-        
-        Programming Languages: 🐼 -> [PANDAS], 🐍 -> [PYTHON], 🐧 -> [LINUX], 🦀 -> [RUST]
-        
-        Navigation: ➡️ -> [RIGHT], ⬅️ -> [LEFT], ⬆️ -> [UP], ⬇️ -> [DOWN]
-        
-        Communication: 💬 -> [COMMENT], 💭 -> [THOUGHT], 🗨️ -> [SPEAK], 📞 -> [PHONE], 
-        📧 -> [EMAIL]
-        
-        And 90+ more comprehensive patterns for complete emoji coverage!
-        
-        Args:
-            file_paths: List of paths to the text files to process
-            emoji_mapping: Optional custom emoji mapping dictionary that will be merged 
-                          with the default mapping. Any emoji in this dictionary will 
-                          override the default replacement for that emoji, and new 
-                          emojis will be added to the mapping. The default mapping 
-                          remains intact for all other emojis.
-            commit_message: Custom Git commit message (optional)
-            
-        Returns:
-            str: Summary of processing results including files processed, 
-                 total replacements made, and any errors encountered
-                 
-        Raises:
-            ValueError: If file paths are invalid, files are binary, or processing fails
-            
-        Security Notes:
-            - Only processes text files (binary files are rejected for security)
-            - Validates all file paths to prevent directory traversal attacks
-            - Uses atomic file operations to prevent data corruption
-            - Maintains file checksums for integrity verification
-        """
-        # Validate input parameters
-        if not file_paths:
-            raise ValueError("No file paths provided")
-        
-        if not isinstance(file_paths, list):
-            raise ValueError("file_paths must be a list of strings")
-        
-        # Default comprehensive emoji mapping based on docs/fix_emojis.py
-        default_emoji_mapping = {
-            # Basic status indicators
-            '\U0001f527': '[API]',      # 🔧 wrench
-            '\U000026a1': '[FAST]',     # ⚡ lightning
-            '\U0001f680': '[PERF]',     # 🚀 rocket
-            '\U0001f4e6': '[PKG]',      # 📦 package
-            '\U0001f4ca': '[CHART]',    # 📊 chart
-            '\U0001f4c8': '[CHART]',    # 📈 chart increasing
-            '\U0001f4c9': '[CHART]',    # 📉 chart decreasing
-            '\U0001f3af': '[TARGET]',   # 🎯 target
-            '\U0001f512': '[SEC]',      # 🔒 lock
-            '\U0001f30d': '[GLOBAL]',   # 🌍 globe
-            '\U0001f30e': '[WEB]',      # 🌎 globe
-            '\U0001f4f6': '[NET]',      # 📶 network
-            '\U0001f310': '[NET]',      # 🌐 network
-            '\U0001f4a1': '[TIP]',      # 💡 bulb
-            '\U0001f3c1': '[FINAL]',    # 🏁 checkered flag
-            '\U0001f389': '[SUCCESS]',  # 🎉 party
-            '\U0001f38a': '[DONE]',     # 🎊 confetti
-            '\U0001f40c': '[SLOW]',     # 🐌 snail
-            '\U0001f433': '[DOCKER]',   # 🐳 whale
-            '\U0001f6e1\ufe0f': '[SHIELD]', # 🛡️ shield
-            '\U0001f6e1': '[SHIELD]',   # 🛡 shield
-            '\U0001f6a8': '[ERR]',      # 🚨 siren
-            '\U0001f50d': '[SEARCH]',   # 🔍 magnifying glass
-            '\U0001f514': '[CONN]',     # 🔔 bell
-            '\U0001f525': '[FIRE]',     # 🔥 fire
-            '\U0001f4aa': '[STRONG]',   # 💪 muscle
-            '\U0001f9ea': '[TEST]',     # 🧪 test tube
-            '\U0001f4dd': '[NOTE]',     # 📝 memo
-            '\U0001f4cb': '[LIST]',     # 📋 clipboard
-            '\U0001f4c4': '[FILE]',     # 📄 document
-            '\U0001f4c1': '[DIR]',      # 📁 folder
-            '\U0001f4c2': '[FOLDER]',   # 📂 open folder
-            '\U0001f4d6': '[BOOK]',     # 📖 book
-            '\U0001f4bb': '[COMP]',     # 💻 computer
-            '\U0001f5a5\ufe0f': '[DESKTOP]', # 🖥️ desktop
-            '\U0001f5a5': '[DESKTOP]',  # 🖥 desktop
-            '\U0001f4f1': '[MOBILE]',   # 📱 mobile
-            '\U000023f1\ufe0f': '[TIMER]', # ⏱️ timer
-            '\U000023f1': '[TIMER]',    # ⏱ timer
-            '\U0001f552': '[TIME]',     # 🕒 clock
-            '\U0001f195': '[NEW]',      # 🆕 new
-            '\U0001f199': '[UP]',       # 🆙 up
-            '\U0001f19a': '[VS]',       # 🆚 vs
-            '\U0001f4a5': '[BOOM]',     # 💥 explosion
-            '\U0001f525': '[HOT]',      # 🔥 fire
-            '\U00002744\ufe0f': '[COLD]', # ❄️ snowflake
-            '\U00002744': '[COLD]',     # ❄ snowflake
-            '\U0001f522': '[NUMS]',     # 🔢 numbers
-            '\U0001f523': '[SYMBOLS]',  # 🔣 symbols
-            '\U0001f524': '[ABC]',      # 🔤 letters
-            '\U00002699\ufe0f': '[GEAR]', # ⚙️ gear
-            '\U00002699': '[GEAR]',     # ⚙ gear
-            '\U00002696\ufe0f': '[BALANCE]', # ⚖️ balance
-            '\U00002696': '[BALANCE]',  # ⚖ balance
-            '\U0001f4e4': '[OUTBOX]',   # 📤 outbox
-            '\U0001f4e5': '[INBOX]',    # 📥 inbox
-            '\U0001f4ed': '[EMPTY]',    # 📭 mailbox
-            '\U0001f4ec': '[MAIL]',     # 📬 mailbox
-            '\U0001f4ea': '[MAILBOX]',  # 📪 closed mailbox
-            '\U0001f4e8': '[ENVELOPE]', # 📨 envelope
-            '\U0001f194': '[ID]',       # 🆔 ID
-            '\U0001f50c': '[PLUG]',     # 🔌 plug
-            '\U0001f4de': '[PHONE]',    # 📞 telephone
-            '\U0001f4e0': '[FAX]',      # 📠 fax
-            '\U0001f4fc': '[VHS]',      # 📼 videocassette
-            '\U0001f4fd\ufe0f': '[FILM]', # 📽️ film projector
-            '\U0001f4fd': '[FILM]',     # 📽 film projector
-            '\U0001f3a5': '[CAMERA]',   # 🎥 movie camera
-            '\U0001f4f7': '[PHOTO]',    # 📷 camera
-            '\U0001f4f8': '[FLASH]',    # 📸 camera with flash
-            '\U0001f50e': '[ZOOM]',     # 🔎 magnifying glass
-            '\U0001f50f': '[LOCK]',     # 🔏 lock with pen
-            '\U0001f510': '[UNLOCK]',   # 🔐 lock with key
-            '\U0001f511': '[KEY]',      # 🔑 key
-            '\U0001f513': '[OPEN]',     # 🔓 unlocked
-            '\U0001f6aa': '[DOOR]',     # 🚪 door
-            '\U0001f4ac': '[COMMENT]',  # 💬 speech balloon
-            '\U0001f4ad': '[THOUGHT]',  # 💭 thought balloon
-            '\U0001f5e8\ufe0f': '[SPEAK]', # 🗨️ left speech bubble
-            '\U0001f5e8': '[SPEAK]',    # 🗨 left speech bubble
-            '\U0001f5ef\ufe0f': '[ANGRY]', # 🗯️ right anger bubble
-            '\U0001f5ef': '[ANGRY]',    # 🗯 right anger bubble
-            '\U0001f4f0': '[NEWS]',     # 📰 newspaper
-            '\U0001f4f3': '[VIBRATE]',  # 📳 vibration mode
-            '\U0001f4f4': '[SILENT]',   # 📴 mobile phone off
-            '\U0001f4f5': '[NO_MOBILE]', # 📵 no mobile phones
-            '\U0001f4f6': '[SIGNAL]',   # 📶 antenna bars
-            '\U0001f4f7': '[CAMERA2]',  # 📷 camera
-            '\U0001f4f9': '[VIDEO]',    # 📹 video camera
-            '\U0001f4fa': '[TV]',       # 📺 television
-            '\U0001f4fb': '[RADIO]',    # 📻 radio
-            '\U0001f4fc': '[TAPE]',     # 📼 videocassette
-            '\U0001f50a': '[LOUD]',     # 🔊 speaker high volume
-            '\U0001f50b': '[LOW]',      # 🔋 battery
-            '\U0001f50c': '[ELECTRIC]', # 🔌 electric plug
-            '\U0001f4af': '[100]',      # 💯 hundred points
-            
-            # Add checkmark and X emojis
-            '\u2705': '[PASS]',         # ✅ check mark
-            '\u274c': '[FAIL]',         # ❌ cross mark
-            '\u26a0\ufe0f': '[WARN]',   # ⚠️ warning
-            '\u26a0': '[WARN]',         # ⚠ warning
-            '\u2139\ufe0f': '[INFO]',   # ℹ️ information
-            '\u2139': '[INFO]',         # ℹ information
-            '\u2753': '[QUESTION]',     # ❓ question mark
-            '\u2754': '[QUESTION2]',    # ❔ white question mark
-            '\u2755': '[EXCLAIM]',      # ❕ white exclamation mark
-            '\u2757': '[EXCLAIM2]',     # ❗ exclamation mark
-            '\u27a1\ufe0f': '[RIGHT]',  # ➡️ right arrow
-            '\u27a1': '[RIGHT]',        # ➡ right arrow
-            '\u2b05\ufe0f': '[LEFT]',   # ⬅️ left arrow
-            '\u2b05': '[LEFT]',         # ⬅ left arrow
-            '\u2b06\ufe0f': '[UP]',     # ⬆️ up arrow
-            '\u2b06': '[UP]',           # ⬆ up arrow
-            '\u2b07\ufe0f': '[DOWN]',   # ⬇️ down arrow
-            '\u2b07': '[DOWN]',         # ⬇ down arrow
-            
-            # Missing emoji mappings from docs/missing_emoji_mappings.md
-            # Brain/Intelligence Category
-            '\U0001f9e0': '[MEMORY]',   # 🧠 brain
-            '\U0001f9ee': '[COMPUTE]',  # 🧮 abacus
-            '\U0001f916': '[BOT]',      # 🤖 robot
-            '\U0001f52e': '[PREDICT]',  # 🔮 crystal ball
-            
-            # Connection/Process Category
-            '\U0001f517': '[LINK]',     # 🔗 link
-            '\U0001f504': '[CYCLE]',    # 🔄 counterclockwise arrows
-            '\U0001f501': '[REPEAT]',   # 🔁 repeat button
-            '\U0001f502': '[REPEAT_ONE]', # 🔂 repeat single
-            '\U0001f503': '[VERTICAL]', # 🔃 clockwise vertical arrows
-            
-            # Places/Environment Category
-            '\U0001f3e0': '[HOST]',     # 🏠 house
-            '\U0001f3c6': '[AWARD]',    # 🏆 trophy
-            '\U0001f3aa': '[STRATEGY]', # 🎪 circus tent
-            '\U0001f3e2': '[OFFICE]',   # 🏢 office building
-            '\U0001f3ed': '[FACTORY]',  # 🏭 factory
-            
-            # Tools/Objects Category
-            '\U0001f9f9': '[CLEANUP]',  # 🧹 broom
-            '\U0001f5d1\ufe0f': '[GARBAGE]', # 🗑️ wastebasket
-            '\U0001f5d1': '[GARBAGE]',  # 🗑 wastebasket
-            '\u270d\ufe0f': '[WRITE]',  # ✍️ writing hand
-            '\u270d': '[WRITE]',        # ✍ writing hand
-            '\U0001f58a\ufe0f': '[PEN]', # 🖊️ pen
-            '\U0001f58a': '[PEN]',      # 🖊 pen
-            '\U0001f528': '[BUILD]',    # 🔨 hammer
-            
-            # Animals Category (Context-Specific)
-            '\U0001f43c': '[PANDAS]',   # 🐼 panda
-            '\U0001f40d': '[PYTHON]',   # 🐍 snake
-            '\U0001f427': '[LINUX]',    # 🐧 penguin
-            '\U0001f980': '[RUST]',     # 🦀 crab
-            
-            # Symbols and Punctuation
-            '\u2022': '-',              # • bullet point to dash
-        }
-        
-        # Start with default mapping and merge/override with custom mapping if provided
-        active_mapping = default_emoji_mapping.copy()
-        
-        if emoji_mapping is not None:
-            if not isinstance(emoji_mapping, dict):
-                raise ValueError("emoji_mapping must be a dictionary")
-            # Update default mapping with custom mappings (overrides existing, adds new)
-            active_mapping.update(emoji_mapping)
-        
-        # Track processing results
-        successful_files = []
-        failed_files = []
-        total_replacements = 0
-        processed_file_paths = []  # For Git commit tracking
-        
-        # Process each file
-        for file_path in file_paths:
-            try:
-                # Validate file path and security checks
-                abs_path = validate_operation(file_path, "replace_all_emojis_in_files", check_binary=True)
-                
-                # Check if file exists and is a text file
-                if not os.path.exists(abs_path):
-                    failed_files.append(f"{file_path} (file does not exist)")
-                    continue
-                
-                if not os.path.isfile(abs_path):
-                    failed_files.append(f"{file_path} (not a regular file)")
-                    continue
-                
-                # Get original file info
-                original_checksum = generate_checksum(abs_path)
-                file_size = os.path.getsize(abs_path)
-                
-                # Read file content with proper error handling
-                try:
-                    with open(abs_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                except UnicodeDecodeError:
-                    failed_files.append(f"{file_path} (binary file - text files only)")
-                    continue
-                except Exception as e:
-                    failed_files.append(f"{file_path} (read error: {str(e)})")
-                    continue
-                
-                # Track changes for this file
-                original_content = content
-                file_replacements = 0
-                
-                # Apply emoji replacements
-                for emoji_char, replacement in active_mapping.items():
-                    if emoji_char in content:
-                        count = content.count(emoji_char)
-                        content = content.replace(emoji_char, replacement)
-                        file_replacements += count
-                
-                # Only write file if changes were made
-                if file_replacements > 0:
-                    # Validate new content size
-                    if len(content) > MAX_FILE_SIZE:
-                        failed_files.append(f"{file_path} (resulting file too large: {len(content)} bytes)")
-                        continue
-                    
-                    # Use atomic write operation with proper error handling
-                    temp_path = f"{abs_path}.tmp.{os.getpid()}.{int(time.time())}"
-                    try:
-                        with open(temp_path, 'w', encoding='utf-8') as f:
-                            f.write(content)
-                        os.replace(temp_path, abs_path)
-                    except Exception as e:
-                        # Clean up temp file if write failed
-                        if os.path.exists(temp_path):
-                            try:
-                                os.remove(temp_path)
-                            except:
-                                pass
-                        failed_files.append(f"{file_path} (write error: {str(e)})")
-                        continue
-                    
-                    # Verify write was successful
-                    new_checksum = generate_checksum(abs_path)
-                    successful_files.append(f"{file_path} ({file_replacements} replacements)")
-                    total_replacements += file_replacements
-                    processed_file_paths.append(abs_path)
-                else:
-                    # No emojis found, but file was processed successfully
-                    successful_files.append(f"{file_path} (no emojis found)")
-                    
-            except Exception as e:
-                failed_files.append(f"{file_path} (error: {str(e)})")
-        
-        # Prepare result summary
-        total_files = len(file_paths)
-        success_count = len(successful_files)
-        failure_count = len(failed_files)
-        
-        result_lines = [
-            f"Emoji replacement completed: {success_count}/{total_files} files processed successfully",
-            f"Total emoji replacements made: {total_replacements}"
-        ]
-        
-        if successful_files:
-            result_lines.append("\nSuccessfully processed files:")
-            for file_info in successful_files:
-                result_lines.append(f"  ✓ {file_info}")
-        
-        if failed_files:
-            result_lines.append(f"\nFailed to process {failure_count} files:")
-            for file_info in failed_files:
-                result_lines.append(f"  ✗ {file_info}")
-        
-        # Auto-commit if enabled and there were successful replacements
-        if processed_file_paths:
-            commit_result = ""
-            try:
-                # Use the first processed file's directory for Git operations
-                commit_path = os.path.dirname(processed_file_paths[0]) if processed_file_paths else "."
-                commit = auto_commit_changes(commit_path, "replace_all_emojis_in_files", commit_message)
-                if commit:
-                    commit_result = f"\n{commit}"
-            except GitError as e:
-                commit_result = f"\nNote: {str(e)}"
-            
-            if commit_result:
-                result_lines.append(commit_result)
-        
-        # Add information about the emoji mapping used
-        if emoji_mapping is not None:
-            overrides = len([k for k in emoji_mapping.keys() if k in default_emoji_mapping])
-            additions = len([k for k in emoji_mapping.keys() if k not in default_emoji_mapping])
-            mapping_info = f"\nUsed emoji mapping: Default mapping ({len(default_emoji_mapping)} patterns) + Custom overrides ({overrides} patterns) + Custom additions ({additions} patterns) = {len(active_mapping)} total patterns"
-        else:
-            mapping_info = f"\nUsed emoji mapping: Default mapping with {len(active_mapping)} emoji patterns"
-        result_lines.append(mapping_info)
-        
-        return "\n".join(result_lines)
-
-    @with_error_handling
-    @mcp.tool()
-    async def replace_all_in_file(path: str, new_string: Union[str, Dict[str, Any], list, int, float, bool] = None, old_string: Union[str, Dict[str, Any], list, int, float, bool] = None, commit_message: str = None, new_str: Union[str, Dict[str, Any], list, int, float, bool] = None, old_str: Union[str, Dict[str, Any], list, int, float, bool] = None) -> str:
-        """
-        Replace ALL occurrences of specific text within a file.
-        
-        This function replaces every instance of the old_string with new_string throughout the entire file.
-        Unlike some text editors that only replace the first occurrence, this tool replaces all matches.
-        
-        Args:
-            path: Path to the file to update
-            new_string: Replacement text or object. If an object is provided, it will be serialized as JSON.
-            old_string: Text or object to find and replace. If an object is provided, it will be serialized as JSON.
-            commit_message: Custom Git commit message (optional)
-            new_str: Alternative parameter name for new_string (backup for LLM compatibility)
-            old_str: Alternative parameter name for old_string (backup for LLM compatibility)
-            
-        Returns:
-            str: Success message with replacement count and checksum information
-            
-        Raises:
-            ValueError: If file update fails or parameters are invalid
-        """
-        abs_path = validate_operation(path, "replace_all_in_file", check_binary=True)
-        
-        # Handle backup parameters for LLM compatibility
-        # Use old_str as backup if old_string is not provided or is None
-        if old_string is None and old_str is not None:
-            old_string = old_str
-        elif old_string is None and old_str is None:
-            raise ValueError("Either old_string or old_str must be provided")
-            
-        # Use new_str as backup if new_string is not provided or is None
-        if new_string is None and new_str is not None:
-            new_string = new_str
-        elif new_string is None and new_str is None:
-            raise ValueError("Either new_string or new_str must be provided")
-        
-        # Validate content inputs
-        if not old_string:
-            raise ValueError("Old content cannot be empty")
-
-        # Convert old_string to string appropriately
-        old_string = sanitize_file_string(old_string)
-        
-        # Convert new_string to string appropriately
-        new_string = sanitize_file_string(new_string)
-            
-        if '\0' in new_string:
-            raise ValueError("Cannot replace with binary content")
-            
-        original_checksum = generate_checksum(abs_path)
-        
-        # Read file with proper error handling
-        try:
-            with open(abs_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except UnicodeDecodeError:
-            raise ValueError(f"File {path} is not a valid text file")
-        
-        if old_string not in content:
-            raise ValueError(f"The specified text to replace was not found in {path}")
-        
-        # Count occurrences before replacement for reporting
-        occurrence_count = content.count(old_string)
-        
-        # Replace ALL occurrences of old_string with new_string
-        updated_content = content.replace(old_string, new_string)
-        
-        # Validate new size
-        if len(updated_content) > MAX_FILE_SIZE:
-            raise ValueError(f"Updated content would be too large ({len(updated_content)} bytes). Maximum size is {MAX_FILE_SIZE} bytes.")
-        
-        # Use atomic write operation with proper error handling
-        temp_path = f"{abs_path}.tmp.{os.getpid()}.{int(time.time())}"
-        try:
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                f.write(updated_content)
-            os.replace(temp_path, abs_path)
-        except Exception as e:
-            # Clean up temp file if update failed
-            if os.path.exists(temp_path):
-                try:
-                    os.remove(temp_path)
-                except:
-                    pass
-            raise ValueError(f"Failed to update file: {str(e)}")
-        
-        new_checksum = generate_checksum(abs_path)
-        
-        # Auto-commit if enabled
-        commit_result = ""
-        try:
-            commit = auto_commit_changes(abs_path, "replace_all_in_file", commit_message)
-            if commit:
-                commit_result = f"\n{commit}"
-        except GitError as e:
-            commit_result = f"\nNote: {str(e)}"
-        
-        return f"Successfully replaced all occurrences in file: {path}\nReplacements made: {occurrence_count}\nOriginal checksum: {original_checksum}\nNew checksum: {new_checksum}{commit_result}"
@@ -3,18 +3,554 @@ Search operations for FileOps MCP.
 
 This module contains tools for searching files and file content.
 """
+import io
 import os
 import re
+import mmap
 import time
-import glob
-from typing import Dict, Any, List, Optional
+import asyncio
+import fnmatch
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Any, AsyncIterator, Callable, Iterator, List, Optional, Tuple
 
 from mcp.server.fastmcp import FastMCP
 
-from ..constants import config, SEARCH_TIMEOUT
+from ..constants import config, SEARCH_TIMEOUT, MAX_SEARCH_FILE_SIZE
 from ..utils.security import validate_operation, is_text_file, log_security_event, with_error_handling, sanitize_file_string, sanitize_search_text, sanitize_file_pattern
 from ..utils.path_utils import filter_hidden_files, get_relative_path
 
+_GLOB_MAGIC_RE = re.compile(r'[*?[{]')
+
+# Upper bound on the alternatives a single brace-expanded segment may produce
+_MAX_BRACE_EXPANSIONS = 256
+
+# Read size for content searches; large enough to amortize the per-block work
+_SCAN_BLOCK_SIZE = io.DEFAULT_BUFFER_SIZE * 8
+
+# Files above this size are searched through a memory map instead of reads
+_MMAP_SCAN_THRESHOLD = 4 * 1024 * 1024
+
+# Walks read the clock once every this many entries (a power of two minus one,
+# used as a mask on the entry count)
+_DEADLINE_CHECK_MASK = 0xFF
+
+# Searchable files are scanned in batches of this many; batches holding fewer
+# than _PARALLEL_MIN_BYTES are scanned in-process, as starting spawn workers
+# and pickling results would cost more than the scan itself
+_SCAN_BATCH_SIZE = 64
+_PARALLEL_MIN_BYTES = 8 * 1024 * 1024
+
+# Directory listings cached by _list_dir, least recently used first
+_DIR_CACHE_SIZE = 2048
+_dir_cache: "OrderedDict[str, Tuple[int, List[Tuple[str, bool]]]]" = OrderedDict()
+
+# Directories _walk never descends into, whatever config.hide_dot_files says:
+# Git's object store holds no files worth matching and can be very large
+_PRUNED_DIRS = frozenset({'.git'})
+
+# Content scans are mostly I/O bound, so more workers than this only add
+# spawn time and memory
+_SCAN_WORKERS = min(os.cpu_count() or 1, 4)
+_scan_pool: Optional[ProcessPoolExecutor] = None
+
+# Extensions that settle whether a file is worth searching without opening it.
+# A misnamed binary in the text set is harmless here: hits are decoded with
+# replacement characters.
+_KNOWN_BINARY_EXT = frozenset({
+    '.png', '.jpg', '.jpeg', '.gif', '.bmp', '.ico', '.tiff', '.pdf',
+    '.zip', '.gz', '.bz2', '.xz', '.tar', '.7z', '.rar', '.exe', '.dll',
+    '.so', '.dylib', '.o', '.a', '.class', '.jar', '.pyc', '.wasm', '.bin',
+    '.mp3', '.mp4', '.mov', '.wav', '.woff', '.woff2',
+})
+_KNOWN_TEXT_EXT = frozenset({
+    '.py', '.js', '.ts', '.md', '.txt', '.json', '.yaml', '.yml', '.toml',
+    '.ini', '.cfg', '.c', '.h', '.cpp', '.hpp', '.rs', '.go', '.java',
+    '.html', '.css', '.sh', '.csv', '.xml', '.rst', '.sql',
+})
+
+def _expand_braces(segment: str) -> List[str]:
+    """
+    Expand brace alternatives in a glob segment, e.g. ``*.{py,pyi}``.
+    
+    Groups may be nested or repeated. Braces without a top-level comma or
+    without a closing brace are kept as literal characters.
+    
+    Args:
+        segment: One path segment of a glob pattern
+        
+    Returns:
+        List[str]: The alternatives, in order and without duplicates
+    """
+    depth = 0
+    start = 0
+    commas = []
+    for i, char in enumerate(segment):
+        if char == '{':
+            if depth == 0:
+                start = i
+                commas = []
+            depth += 1
+        elif char == ',' and depth == 1:
+            commas.append(i)
+        elif char == '}' and depth:
+            depth -= 1
+            if depth:
+                continue
+            if not commas:
+                # "{x}" is literal; expand whatever follows it
+                return [segment[:i + 1] + rest for rest in _expand_braces(segment[i + 1:])]
+            bounds = [start] + commas + [i]
+            head, tail = segment[:start], segment[i + 1:]
+            expanded = []
+            for left, right in zip(bounds, bounds[1:]):
+                expanded.extend(_expand_braces(head + segment[left + 1:right] + tail))
+                if len(expanded) > _MAX_BRACE_EXPANSIONS:
+                    raise ValueError(f"Pattern expands to more than {_MAX_BRACE_EXPANSIONS} alternatives")
+            return list(dict.fromkeys(expanded))
+    return [segment]
+
+def _compile_segments(segments: List[str]) -> List[Optional[Callable[[str], Any]]]:
+    """
+    Compile glob segments into regex match functions, once per search.
+    
+    Matching entry names against a precompiled pattern skips the pattern
+    cache lookup fnmatch does on every call. Brace alternatives in a segment
+    are joined into the same regex, so the tree is still walked once however
+    many alternatives there are.
+    
+    Args:
+        segments: Glob segments from _split_glob_prefix
+        
+    Returns:
+        List[Optional[Callable[[str], Any]]]: A match function per segment,
+        or None for a ``**`` segment
+    """
+    return [
+        None if segment == '**' else re.compile('|'.join(fnmatch.translate(alternative) for alternative in _expand_braces(segment))).match
+        for segment in segments
+    ]
+
+def _match_segments(parts: List[str], matchers: List[Optional[Callable[[str], Any]]]) -> bool:
+    """
+    Check whether path components match compiled glob segments, where a
+    ``**`` segment (None) matches any number of components (including none).
+    """
+    if not matchers:
+        return not parts
+    if matchers[0] is None:
+        return any(_match_segments(parts[i:], matchers[1:]) for i in range(len(parts) + 1))
+    return bool(parts) and matchers[0](parts[0]) is not None and _match_segments(parts[1:], matchers[1:])
+
+def _split_glob_prefix(pattern: str) -> Tuple[str, List[str]]:
+    """
+    Split a glob pattern into a literal directory prefix and glob segments.
+    
+    A pattern whose leading segments contain no wildcards (e.g.
+    ``src/operations/*.py``) is anchored at that directory, so the walk can
+    start there instead of at the search root. Patterns without a literal
+    prefix match at any depth, as if prefixed with ``**/``.
+    
+    Args:
+        pattern: Sanitized file pattern
+        
+    Returns:
+        Tuple[str, List[str]]: Relative directory to start from ('' for the
+        search root) and the segments to match below it
+    """
+    segments = [segment for segment in pattern.split('/') if segment and segment != '.']
+    prefix = []
+    # Never descend through '..'; it stays in the segments, where it cannot match
+    while len(segments) > 1 and segments[0] != '..' and not _GLOB_MAGIC_RE.search(segments[0]):
+        prefix.append(segments.pop(0))
+    if not segments:
+        # Nothing left to match a file name against (e.g. "." or "/")
+        return '', ['']
+    if not prefix:
+        segments.insert(0, '**')
+    return os.path.join(*prefix) if prefix else '', segments
+
+def _list_dir(dir_path: str) -> List[Tuple[str, bool]]:
+    """
+    List a directory's files and subdirectories, cached by the directory's mtime.
+    
+    Adding, removing or renaming an entry updates the directory's mtime, so a
+    cached listing is reused only while it is still accurate, at the cost of
+    one stat instead of a full scandir. Listings of directories modified in
+    the last second are not cached, since coarse timestamps could hide a
+    further change within the same tick.
+    
+    Args:
+        dir_path: Absolute path of the directory
+        
+    Returns:
+        List[Tuple[str, bool]]: (name, is_dir) pairs; symlinks to files count
+        as files, symlinks to directories and special files are left out
+        
+    Raises:
+        OSError: If the directory cannot be read
+    """
+    mtime_ns = os.stat(dir_path).st_mtime_ns
+    cached = _dir_cache.get(dir_path)
+    if cached is not None and cached[0] == mtime_ns:
+        _dir_cache.move_to_end(dir_path)
+        return cached[1]
+    
+    listing = []
+    with os.scandir(dir_path) as it:
+        for entry in it:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    listing.append((entry.name, True))
+                elif entry.is_file():
+                    listing.append((entry.name, False))
+            except OSError:
+                continue
+    
+    if time.time_ns() - mtime_ns > 1_000_000_000:
+        _dir_cache[dir_path] = (mtime_ns, listing)
+        _dir_cache.move_to_end(dir_path)
+        if len(_dir_cache) > _DIR_CACHE_SIZE:
+            _dir_cache.popitem(last=False)
+    return listing
+
+def _walk(root: str, segments: List[str]) -> Iterator[Tuple[str, str]]:
+    """
+    Yield the files under root whose relative path matches glob segments.
+    
+    Directory listings come from _list_dir, so file types are known without
+    a stat per entry and unchanged directories are not re-read on repeated
+    searches. Hidden entries are skipped when config.hide_dot_files is set,
+    which prunes hidden directories without listing their contents; .git is
+    pruned even when dot files are shown, as the glob this replaced never
+    descended into it.
+    Symlinked directories are not followed, and without a ``**`` segment the
+    walk stops at the depth the segments can reach.
+    
+    The walk works on paths rather than directory file descriptors (as
+    os.fwalk would): listings are cached by path across searches, and the
+    files found are opened in worker processes, which cannot share the
+    walk's descriptors.
+    
+    Args:
+        root: Absolute path of the directory to walk
+        segments: Glob segments from _split_glob_prefix
+        
+    Returns:
+        Iterator[Tuple[str, str]]: (path, name) of each matching file
+    """
+    max_depth = None if '**' in segments else len(segments) - 1
+    matchers = _compile_segments(segments)
+    # The common "**/<name pattern>" case only needs the entry name
+    name_match = matchers[1] if len(matchers) == 2 and matchers[0] is None else None
+    
+    stack = [(root, ())]
+    while stack:
+        dir_path, dir_parts = stack.pop()
+        try:
+            listing = _list_dir(dir_path)
+        except OSError:
+            continue
+        
+        subdirs = []
+        for name, is_dir in listing:
+            if config.hide_dot_files and name.startswith('.'):
+                continue
+            if is_dir:
+                if name in _PRUNED_DIRS:
+                    continue
+                if max_depth is None or len(dir_parts) < max_depth:
+                    subdirs.append((os.path.join(dir_path, name), dir_parts + (name,)))
+                continue
+            if name_match is not None:
+                if name_match(name) is None:
+                    continue
+            elif not _match_segments(list(dir_parts) + [name], matchers):
+                continue
+            yield os.path.join(dir_path, name), name
+        
+        # Visit subdirectories in listing order
+        stack.extend(reversed(subdirs))
+
+async def _iter_matches(root: str, segments: List[str], deadline: float) -> AsyncIterator[str]:
+    """
+    Yield the relative paths of matching files as the walk finds them.
+    
+    The consumer takes only as many paths as it needs and closes the
+    generator, which stops the walk, so memory stays proportional to the
+    results kept rather than to the number of matches. The event loop gets
+    control back every _DEADLINE_CHECK_MASK + 1 entries.
+    
+    Args:
+        root: Absolute path of the directory to walk
+        segments: Glob segments from _split_glob_prefix
+        deadline: time.monotonic() value after which the walk is abandoned
+        
+    Returns:
+        AsyncIterator[str]: Relative path of each matching file
+        
+    Raises:
+        TimeoutError: If the deadline passes before the walk is done
+    """
+    for i, (file_path, _) in enumerate(_walk(root, segments)):
+        if not i & _DEADLINE_CHECK_MASK:
+            if time.monotonic() > deadline:
+                raise TimeoutError
+            await asyncio.sleep(0)
+        yield get_relative_path(file_path)
+
+def _searchable_size(path: str, name: str) -> Optional[int]:
+    """
+    Decide whether find_in_files should search a file.
+    
+    Empty files and files over MAX_SEARCH_FILE_SIZE are skipped without being
+    opened. Known extensions are decided from the name alone; other files are
+    sniffed with is_text_file, which caches its verdict per (path, mtime,
+    size) so repeated searches over the same tree do not re-read them.
+    
+    Args:
+        path: Absolute path of the file
+        name: File name
+        
+    Returns:
+        Optional[int]: The file's size if it should be searched as text,
+        otherwise None
+    """
+    ext = os.path.splitext(name)[1].lower()
+    if ext in _KNOWN_BINARY_EXT:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if not 0 < st.st_size <= MAX_SEARCH_FILE_SIZE:
+        return None
+    if ext in _KNOWN_TEXT_EXT or is_text_file(path):
+        return st.st_size
+    return None
+
+def _iter_searchable(root: str, segments: List[str], deadline: float) -> Iterator[Tuple[str, int]]:
+    """
+    Yield the files under root that match glob segments and are worth searching.
+    
+    Args:
+        root: Absolute path of the directory to walk
+        segments: Glob segments from _split_glob_prefix
+        deadline: time.monotonic() value after which the walk is abandoned
+        
+    Returns:
+        Iterator[Tuple[str, int]]: (path, size) of each searchable file
+        
+    Raises:
+        TimeoutError: If the deadline passes before the walk is done
+    """
+    for i, (file_path, name) in enumerate(_walk(root, segments)):
+        if not i & _DEADLINE_CHECK_MASK and time.monotonic() > deadline:
+            raise TimeoutError
+        size = _searchable_size(file_path, name)
+        if size is not None:
+            yield file_path, size
+
+def _compile_needle(text: str) -> Optional["re.Pattern"]:
+    """
+    Compile search text into the bytes pattern used by _scan_file.
+    
+    The pattern is built once per search and reused for every file and block.
+    
+    Args:
+        text: Sanitized search text
+        
+    Returns:
+        Optional[re.Pattern]: Literal pattern for the UTF-8 encoded text, or
+        None if the text spans a line break and so can never match a line
+    """
+    needle = text.encode('utf-8')
+    if b'\n' in needle[:-1]:
+        return None
+    return re.compile(re.escape(needle))
+
+def _scan_file(path: str, needle_re: "re.Pattern", max_hits: int, deadline: Optional[float] = None) -> Tuple[List[Tuple[int, str]], bool]:
+    """
+    Find the lines of a file that contain a needle.
+    
+    The file is read in binary blocks that are cut at the last newline, so
+    the search runs over whole blocks rather than line by line, and only
+    matching lines are decoded. As UTF-8 is self-synchronizing, a byte match
+    is exactly a text match. Each line is reported once, like
+    ``needle in line`` over the lines of the file.
+    
+    Args:
+        path: Absolute path of the file
+        needle_re: Pattern from _compile_needle
+        max_hits: Stop after this many matching lines
+        deadline: Optional time.monotonic() value after which to stop early
+        
+    Returns:
+        Tuple[List[Tuple[int, str]], bool]: (line number, stripped line) pairs
+        and whether the scan stopped at the deadline
+    """
+    hits = []
+    line_base = 0
+    # Unbuffered: blocks are read straight into buf, which is reused for the
+    # whole file, so the scan does not allocate per block or per line
+    with open(path, 'rb', buffering=0) as f:
+        if os.fstat(f.fileno()).st_size > _MMAP_SCAN_THRESHOLD:
+            # Large files are searched in place in the page cache; only the
+            # text between reported lines is ever copied, to count newlines
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                counted = 0
+                line_no = 1
+                for match in needle_re.finditer(mm):
+                    pos = match.start()
+                    if pos < counted:
+                        continue
+                    if deadline is not None and time.monotonic() > deadline:
+                        return hits, True
+                    line_no += mm[counted:pos].count(b'\n')
+                    line_start = mm.rfind(b'\n', 0, pos) + 1
+                    line_end = mm.find(b'\n', match.end() - 1)
+                    if line_end < 0:
+                        line_end = len(mm)
+                    hits.append((line_no, mm[line_start:line_end].decode('utf-8', errors='replace').strip()))
+                    if len(hits) >= max_hits:
+                        break
+                    counted = line_end + 1
+                    line_no += 1
+            return hits, False
+        
+        buf = bytearray(_SCAN_BLOCK_SIZE)
+        # buf[:filled] holds unscanned data: an incomplete line carried over
+        # from the previous block, followed by what was just read
+        filled = 0
+        while len(hits) < max_hits:
+            # One clock read per block; cheap next to reading and scanning it
+            if deadline is not None and time.monotonic() > deadline:
+                return hits, True
+            if filled == len(buf):
+                # A single line longer than the buffer
+                buf.extend(bytes(len(buf)))
+            with memoryview(buf) as view, view[filled:] as free:
+                n = f.readinto(free)
+            if n:
+                filled += n
+                cut = buf.rfind(b'\n', 0, filled) + 1
+                if not cut:
+                    # No complete line yet
+                    continue
+            else:
+                cut = filled
+                if not cut:
+                    break
+            
+            # finditer walks the hits in C; line numbers are only counted
+            # between reported lines. line_no is the number of the line that
+            # starts at offset counted.
+            counted = 0
+            line_no = line_base + 1
+            for match in needle_re.finditer(buf, 0, cut):
+                pos = match.start()
+                if pos < counted:
+                    # Another hit on a line that was already reported
+                    continue
+                line_no += buf.count(b'\n', counted, pos)
+                line_start = buf.rfind(b'\n', 0, pos) + 1
+                line_end = buf.find(b'\n', match.end() - 1, cut)
+                if line_end < 0:
+                    line_end = cut
+                hits.append((line_no, buf[line_start:line_end].decode('utf-8', errors='replace').strip()))
+                if len(hits) >= max_hits:
+                    break
+                # Continue on the next line
+                counted = line_end + 1
+                line_no += 1
+            if not n:
+                break
+            line_base += buf.count(b'\n', 0, cut)
+            # Move the incomplete last line to the front for the next block
+            buf[:filled - cut] = buf[cut:filled]
+            filled -= cut
+    return hits, False
+
+def _format_hits(rel_path: str, hits: List[Tuple[int, str]]) -> List[str]:
+    """
+    Format _scan_file hits as the ``file:line_number: content`` result lines
+    shared by find_in_files and search_in_file.
+    """
+    return [f"{rel_path}:{line_number}: {line}" for line_number, line in hits]
+
+def _scan_files(paths: List[str], needle_re: "re.Pattern", max_hits: int, deadline: Optional[float]) -> List[Optional[Tuple[List[Tuple[int, str]], bool]]]:
+    """
+    Run _scan_file over several files, as one unit of work for a worker process.
+    
+    Returns:
+        List[Optional[Tuple[List[Tuple[int, str]], bool]]]: _scan_file's result
+        per path, in order, or None for a file that could not be read
+    """
+    outcomes = []
+    for path in paths:
+        try:
+            outcomes.append(_scan_file(path, needle_re, max_hits, deadline))
+        except Exception:
+            outcomes.append(None)
+    return outcomes
+
+def _get_scan_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    Get the process pool for content searches, creating it on first use.
+    
+    Returns:
+        Optional[ProcessPoolExecutor]: The pool, or None on single-core machines
+    """
+    global _scan_pool
+    if _scan_pool is None and _SCAN_WORKERS > 1:
+        # spawn rather than fork: the server runs worker threads, which a
+        # forked child would inherit in an undefined state
+        _scan_pool = ProcessPoolExecutor(max_workers=_SCAN_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+    return _scan_pool
+
+async def _scan_batch(paths: List[str], batch_bytes: int, needle_re: "re.Pattern", max_hits: int, deadline: Optional[float]) -> List[Optional[Tuple[List[Tuple[int, str]], bool]]]:
+    """
+    Scan a batch of files, spread over worker processes when it is big enough.
+    
+    Batches under _PARALLEL_MIN_BYTES in total are scanned in-process, where
+    starting workers, pickling and IPC would cost more than the scan. The
+    event loop is not blocked while workers run.
+    
+    Args:
+        paths: Files to scan
+        batch_bytes: Combined size of the files, as seen by the walk
+        needle_re: Pattern from _compile_needle
+        max_hits: Maximum matching lines per file
+        deadline: Optional time.monotonic() value after which scans stop early
+        
+    Returns:
+        List[Optional[Tuple[List[Tuple[int, str]], bool]]]: As for _scan_files
+    """
+    global _scan_pool
+    pool = _get_scan_pool() if len(paths) > 1 and batch_bytes >= _PARALLEL_MIN_BYTES else None
+    if pool is None:
+        return _scan_files(paths, needle_re, max_hits, deadline)
+    
+    # One task per worker keeps the pickling overhead per batch, not per file
+    step = -(-len(paths) // _SCAN_WORKERS)
+    futures = [
+        asyncio.wrap_future(pool.submit(_scan_files, paths[i:i + step], needle_re, max_hits, deadline))
+        for i in range(0, len(paths), step)
+    ]
+    try:
+        parts = await asyncio.gather(*futures)
+    except BrokenProcessPool:
+        # A worker died; shut the pool down so its remaining workers and
+        # management thread are reaped, drop it (unless a concurrent search
+        # already replaced it) and finish this batch in-process
+        pool.shutdown(wait=False, cancel_futures=True)
+        if _scan_pool is pool:
+            _scan_pool = None
+        return _scan_files(paths, needle_re, max_hits, deadline)
+    return [outcome for part in parts for outcome in part]
+
 def register_search_operations(mcp: FastMCP) -> None:
     """
     Register search operations with the MCP server.
@@ -54,34 +590,32 @@ def register_search_operations(mcp: FastMCP) -> None:
         pattern = sanitize_file_pattern(pattern)
         
         # Perform search with timeout protection
-        start_time = time.time()
+        deadline = time.monotonic() + SEARCH_TIMEOUT
         results = []
         
         try:
             # Get all files matching the pattern
-            for file_path in glob.glob(os.path.join(abs_path, "**", pattern), recursive=True):
-                # Skip directories and hidden files
-                if os.path.isdir(file_path) or (config.hide_dot_files and os.path.basename(file_path).startswith('.')):
-                    continue
+            prefix, segments = _split_glob_prefix(pattern)
+            matches = _iter_matches(os.path.join(abs_path, prefix), segments, deadline)
+            file_count = 0
+            try:
+                async for rel_path in matches:
+                    results.append(rel_path)
+                    file_count += 1
                     
-                # Check if we're taking too long
-                if time.time() - start_time > SEARCH_TIMEOUT:
-                    results.append("... (search timeout, results truncated)")
-                    break
-                    
-                # Add the file to results
-                rel_path = get_relative_path(file_path)
-                results.append(rel_path)
-                
-                # Check if we've reached the maximum number of results
-                if len(results) >= max_results:
-                    results.append(f"... (limited to {max_results} results)")
-                    break
+                    # Check if we've reached the maximum number of results
+                    if file_count >= max_results:
+                        results.append(f"... (limited to {max_results} results)")
+                        break
+            except TimeoutError:
+                results.append("... (search timeout, results truncated)")
+            finally:
+                await matches.aclose()
             
             if not results:
                 return f"No files matching '{pattern}' found in {path}"
             
-            return f"Found {len(results)} files matching '{pattern}' in {path}:\n\n" + "\n".join(results)
+            return f"Found {file_count} files matching '{pattern}' in {path}:\n\n" + "\n".join(results)
         except Exception as e:
             raise ValueError(f"Error searching files: {str(e)}")
 
@@ -127,54 +661,80 @@ def register_search_operations(mcp: FastMCP) -> None:
         file_pattern = sanitize_file_pattern(file_pattern)
         
         # Perform search with timeout protection
-        start_time = time.time()
+        needle_re = _compile_needle(text)
+        deadline = time.monotonic() + SEARCH_TIMEOUT
         results = []
+        hit_count = 0
         files_searched = 0
         
         try:
-            # Get all files matching the pattern
-            for file_path in glob.glob(os.path.join(abs_path, "**", file_pattern), recursive=True):
-                # Skip directories and hidden files
-                if os.path.isdir(file_path) or (config.hide_dot_files and os.path.basename(file_path).startswith('.')):
-                    continue
-                    
-                # Check if we're taking too long
-                if time.time() - start_time > SEARCH_TIMEOUT:
-                    results.append(f"... (search timeout after searching {files_searched} files, results truncated)")
+            timed_out = False
+            limited = False
+            pending = []
+            pending_bytes = 0
+            
+            # Get all text files matching the pattern
+            prefix, segments = _split_glob_prefix(file_pattern)
+            candidates = _iter_searchable(os.path.join(abs_path, prefix), segments, deadline)
+            if needle_re is None:
+                # Text spanning a line break cannot match any line, so skip the walk
+                candidates = iter(())
+            elif config.small_first:
+                # Small files are cheap to scan and likely to fill max_results
+                # before any large one is opened; sorting needs the full walk
+                try:
+                    candidates = iter(sorted(candidates, key=lambda candidate: candidate[1]))
+                except TimeoutError:
+                    timed_out = True
+            
+            while not (timed_out or limited):
+                try:
+                    found = next(candidates, None)
+                except TimeoutError:
+                    # Check if we're taking too long
+                    timed_out = True
+                    break
+                if found is not None:
+                    pending.append(found[0])
+                    pending_bytes += found[1]
+                    if len(pending) < _SCAN_BATCH_SIZE:
+                        continue
+                if not pending:
                     break
-                    
-                # Only search text files
-                if not is_text_file(file_path):
-                    continue
-                    
-                files_searched += 1
                 
-                # Search for the text in the file
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        line_number = 0
-                        for line in f:
-                            line_number += 1
-                            if text in line:
-                                rel_path = get_relative_path(file_path)
-                                results.append(f"{rel_path}:{line_number}: {line.strip()}")
-                                
-                                # Check if we've reached the maximum number of results
-                                if len(results) >= max_results:
-                                    results.append(f"... (limited to {max_results} results)")
-                                    break
+                # Search the batch, then merge its hits in walk order
+                batch, batch_bytes, pending, pending_bytes = pending, pending_bytes, [], 0
+                outcomes = await _scan_batch(batch, batch_bytes, needle_re, max_results - hit_count, deadline)
+                for file_path, outcome in zip(batch, outcomes):
+                    files_searched += 1
+                    if outcome is None:
+                        # Skip files that can't be read
+                        continue
+                    
+                    hits, file_timed_out = outcome
+                    if hits:
+                        hits = hits[:max_results - hit_count]
+                        results.extend(_format_hits(get_relative_path(file_path), hits))
+                        hit_count += len(hits)
                         
-                        # Break the outer loop if we've reached the maximum number of results
-                        if len(results) >= max_results and results[-1].startswith("... (limited to"):
+                        # Check if we've reached the maximum number of results
+                        if hit_count >= max_results:
+                            results.append(f"... (limited to {max_results} results)")
+                            limited = True
                             break
-                except Exception:
-                    # Skip files that can't be read
-                    continue
+                    if file_timed_out:
+                        timed_out = True
+                        break
+                if found is None:
+                    break
+            
+            if timed_out and not limited:
+                results.append(f"... (search timeout after searching {files_searched} files, results truncated)")
             
             if not results:
                 return f"No occurrences of '{text}' found in files matching '{file_pattern}' in {path}"
             
-            return f"Found {len(results) - (1 if results[-1].startswith('...') else 0)} occurrences of '{text}' in files matching '{file_pattern}' in {path} (searched {files_searched} files):\n\n" + "\n".join(results)
+            return f"Found {hit_count} occurrences of '{text}' in files matching '{file_pattern}' in {path} (searched {files_searched} files):\n\n" + "\n".join(results)
         except Exception as e:
             raise ValueError(f"Error searching in files: {str(e)}")
 
@@ -223,33 +783,25 @@ def register_search_operations(mcp: FastMCP) -> None:
         rel_path = get_relative_path(abs_path)
         
         # Perform search with timeout protection
-        start_time = time.time()
-        results = []
+        deadline = time.monotonic() + SEARCH_TIMEOUT
         
         try:
             # Search for the text in the file
-            with open(abs_path, 'r', encoding='utf-8') as f:
-                line_number = 0
-                for line in f:
-                    line_number += 1
-                    
-                    # Check if we're taking too long
-                    if time.time() - start_time > SEARCH_TIMEOUT:
-                        results.append("... (search timeout, results truncated)")
-                        break
-                    
-                    if text in line:
-                        # Use same format as find_in_files: file:line_number: content
-                        results.append(f"{rel_path}:{line_number}: {line.strip()}")
-                        
-                        # Check if we've reached the maximum number of results
-                        if len(results) >= max_results:
-                            results.append(f"... (limited to {max_results} results)")
-                            break
+            needle_re = _compile_needle(text)
+            hits, timed_out = _scan_file(abs_path, needle_re, max_results, deadline) if needle_re else ([], False)
+            
+            # Use same format as find_in_files: file:line_number: content
+            results = _format_hits(rel_path, hits)
+            
+            if timed_out:
+                results.append("... (search timeout, results truncated)")
+            elif len(hits) >= max_results:
+                # Check if we've reached the maximum number of results
+                results.append(f"... (limited to {max_results} results)")
             
             if not results:
                 return f"No occurrences of '{text}' found in {file_path}"
             
-            return f"Found {len(results) - (1 if results[-1].startswith('...') else 0)} occurrences of '{text}' in {file_path}:\n\n" + "\n".join(results)
+            return f"Found {len(hits)} occurrences of '{text}' in {file_path}:\n\n" + "\n".join(results)
         except Exception as e:
             raise ValueError(f"Error searching in file: {str(e)}")
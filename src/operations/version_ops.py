@@ -12,7 +12,7 @@ from ..utils.security import validate_operation, log_security_event, with_error_
 from ..utils.path_utils import get_file_info, get_dir_info
 from ..utils.git_utils import (
     GitError, check_git_available, init_repo, commit_file,
-    get_file_history, get_file_at_commit, get_file_diff,
+    iter_file_history, get_file_at_commit, get_file_diff,
     revert_to_commit, get_repo_status
 )
 
@@ -95,28 +95,26 @@ def register_version_operations(mcp: FastMCP) -> None:
             # Limit maximum results
             max_count = min(50, max(1, max_count))
             
-            history = get_file_history(abs_path, max_count)
+            # Format the history as the commits are parsed
+            parts = [f"Commit history for {path}:\n\n"]
             
-            if not history:
-                return f"No commit history found for {path}"
-            
-            # Format the history
-            result = f"Commit history for {path}:\n\n"
-            
-            for i, commit in enumerate(history):
-                result += f"{i+1}. Commit: {commit['commit'][:8]}\n"
-                result += f"   Author: {commit['author']}\n"
-                result += f"   Date: {commit['date']}\n"
-                result += f"   Message: {commit['message']}\n"
+            for i, commit in enumerate(iter_file_history(abs_path, max_count)):
+                parts.append(f"{i+1}. Commit: {commit['commit'][:8]}\n")
+                parts.append(f"   Author: {commit['author']}\n")
+                parts.append(f"   Date: {commit['date']}\n")
+                parts.append(f"   Message: {commit['message']}\n")
                 
                 if commit.get('changes'):
-                    result += "   Changes:\n"
+                    parts.append("   Changes:\n")
                     for change in commit['changes']:
-                        result += f"   - {change}\n"
+                        parts.append(f"   - {change}\n")
                 
-                result += "\n"
+                parts.append("\n")
+            
+            if len(parts) == 1:
+                return f"No commit history found for {path}"
             
-            return result
+            return "".join(parts)
         except GitError as e:
             raise ValueError(str(e))
 
@@ -218,47 +216,37 @@ def register_version_operations(mcp: FastMCP) -> None:
         try:
             status = get_repo_status(abs_path)
             
-            result = f"Git repository status for {status['path']}:\n\n"
+            parts = [f"Git repository status for {status['path']}:\n\n"]
             
             # Current branch
-            result += f"Branch: {status['active_branch']}\n\n"
+            parts.append(f"Branch: {status['active_branch']}\n\n")
             
             # Working tree status
-            result += f"Working tree: {'Dirty (has uncommitted changes)' if status['is_dirty'] else 'Clean'}\n\n"
+            parts.append(f"Working tree: {'Dirty (has uncommitted changes)' if status['is_dirty'] else 'Clean'}\n\n")
             
             # Latest commit
             if status.get('latest_commit'):
                 commit = status['latest_commit']
-                result += "Latest commit:\n"
-                result += f"  Hash: {commit['hash'][:8]}\n"
-                result += f"  Author: {commit['author']}\n"
-                result += f"  Date: {commit['date']}\n"
-                result += f"  Message: {commit['message']}\n\n"
+                parts.append("Latest commit:\n")
+                parts.append(f"  Hash: {commit['hash'][:8]}\n")
+                parts.append(f"  Author: {commit['author']}\n")
+                parts.append(f"  Date: {commit['date']}\n")
+                parts.append(f"  Message: {commit['message']}\n\n")
             else:
-                result += "No commits yet.\n\n"
-            
-            # Staged files
-            if status['staged_files']:
-                result += "Staged files:\n"
-                for file in status['staged_files']:
-                    result += f"  {file}\n"
-                result += "\n"
-            
-            # Changed files
-            if status['changed_files']:
-                result += "Changed files (not staged):\n"
-                for file in status['changed_files']:
-                    result += f"  {file}\n"
-                result += "\n"
-            
-            # Untracked files
-            if status['untracked_files']:
-                result += "Untracked files:\n"
-                for file in status['untracked_files']:
-                    result += f"  {file}\n"
-                result += "\n"
-            
-            return result
+                parts.append("No commits yet.\n\n")
+            
+            # Staged, changed and untracked files
+            for title, files in (
+                ("Staged files:", status['staged_files']),
+                ("Changed files (not staged):", status['changed_files']),
+                ("Untracked files:", status['untracked_files']),
+            ):
+                if files:
+                    parts.append(f"{title}\n")
+                    parts.extend(f"  {file}\n" for file in files)
+                    parts.append("\n")
+            
+            return "".join(parts)
         except GitError as e:
             raise ValueError(str(e))
 
@@ -282,31 +270,27 @@ def register_version_operations(mcp: FastMCP) -> None:
         
         try:
             # Get branches
-            from ..utils.git_utils import list_branches, get_current_branch
+            from ..utils.git_utils import list_branches
             branches = list_branches(abs_path)
-            current = get_current_branch(abs_path)
             
             if not branches:
                 return "No branches found in the repository."
             
             # Format the output
-            result = f"Branches in repository at {path}:\n\n"
+            parts = [f"Branches in repository at {path}:\n\n"]
             
             for branch in branches:
                 marker = "*" if branch["is_current"] else " "
-                result += f"{marker} {branch['name']}"
-                
-                # Add last commit info
-                result += f" - {branch['last_commit_date']}"
-                result += f" ({branch['commit'][:8]})"
                 
                 # Add commit message preview (first line only)
                 message = branch['last_commit_message'].split("\n")[0]
                 if len(message) > 50:
                     message = message[:47] + "..."
-                result += f" {message}\n"
+                
+                # Name, then last commit info
+                parts.append(f"{marker} {branch['name']} - {branch['last_commit_date']} ({branch['commit'][:8]}) {message}\n")
             
-            return result
+            return "".join(parts)
         except GitError as e:
             raise ValueError(str(e))
 
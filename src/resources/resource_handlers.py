@@ -4,7 +4,7 @@ Resource handlers for the FileOps MCP server.
 This module contains resource handlers for accessing files, directories,
 and version control information.
 """
-from typing import Tuple, Dict, Any, List, Optional
+from typing import Tuple, Dict, Any, Awaitable, Callable, List, Optional
 import asyncio
 
 from mcp.server.fastmcp import FastMCP, Context
@@ -12,130 +12,71 @@ from mcp.server.fastmcp import FastMCP, Context
 from ..utils.security import with_error_handling
 from ..constants import ALL_OPERATIONS
 from ..utils.git_utils import GitError
+from ..operations.help_ops import get_operations_help
 
-# Define standalone wrapper functions since we can't import them directly
-
-async def standalone_read_file(path: str) -> str:
-    """Wrapper function to read file contents"""
-    # Create temporary FastMCP to access the registered tool
-    temp_mcp = FastMCP("ResourceTemp")
-    
-    # Register file operations on this temporary server
-    from ..operations.file_ops import register_file_operations
-    register_file_operations(temp_mcp)
-    
-    # Find the read_file tool by name
-    for name, func in temp_mcp._tools.items():
-        if name.endswith("read_file"):
-            return await func(path)
-    
-    # Fallback if tool not found
-    return f"Error: Unable to find read_file tool"
-
-async def standalone_list_directory(path: str) -> str:
-    """Wrapper function to list directory contents"""
-    # Create temporary FastMCP to access the registered tool
-    temp_mcp = FastMCP("ResourceTemp")
-    
-    # Register directory operations on this temporary server
-    from ..operations.dir_ops import register_directory_operations
-    register_directory_operations(temp_mcp)
-    
-    # Find the list_dir tool by name
-    for name, func in temp_mcp._tools.items():
-        if name.endswith("list_dir"):
-            return await func(path)
-    
-    # Fallback if tool not found
-    return f"Error: Unable to find list_dir tool"
-
-async def standalone_get_file_tree(path: str) -> str:
-    """Wrapper function to get file tree"""
-    # Create temporary FastMCP to access the registered tool
-    temp_mcp = FastMCP("ResourceTemp")
-    
-    # Register directory operations on this temporary server
-    from ..operations.dir_ops import register_directory_operations
-    register_directory_operations(temp_mcp)
-    
-    # Find the get_tree tool by name
-    for name, func in temp_mcp._tools.items():
-        if name.endswith("get_tree"):
-            return await func(path)
-    
-    # Fallback if tool not found
-    return f"Error: Unable to find get_tree tool"
+# Tools the resource handlers delegate to, and the registered functions for
+# them. The cache is filled once by cache_resource_tools at server start, so
+# serving a resource is a dict lookup rather than a tool registration.
+_RESOURCE_TOOLS = ("read_file", "list_dir", "get_tree", "get_stats", "git_log", "git_show", "git_status")
+_TOOL_CACHE: Dict[str, Callable[..., Awaitable[str]]] = {}
 
-async def standalone_get_path_stats(path: str) -> str:
-    """Wrapper function to get path stats"""
-    # Create temporary FastMCP to access the registered tool
-    temp_mcp = FastMCP("ResourceTemp")
-    
-    # Register directory operations on this temporary server
-    from ..operations.dir_ops import register_directory_operations
-    register_directory_operations(temp_mcp)
-    
-    # Find the get_stats tool by name
-    for name, func in temp_mcp._tools.items():
-        if name.endswith("get_stats"):
-            return await func(path)
-    
-    # Fallback if tool not found
-    return f"Error: Unable to find get_stats tool"
+def _registered_tools(mcp: FastMCP) -> Dict[str, Callable[..., Awaitable[str]]]:
+    # FastMCP keeps its tools as Tool objects in the tool manager, with the
+    # registered function as .fn. This is private API, so a missing or
+    # changed attribute yields no tools rather than failing server startup;
+    # the resource wrappers then report the tool as not found.
+    tools = getattr(getattr(mcp, "_tool_manager", None), "_tools", None)
+    if not isinstance(tools, dict):
+        return {}
+    return {name: tool.fn for name, tool in tools.items() if callable(getattr(tool, "fn", None))}
 
-async def standalone_git_log(path: str, max_count: int = 10) -> str:
-    """Wrapper function to get git log"""
-    # Create temporary FastMCP to access the registered tool
-    temp_mcp = FastMCP("ResourceTemp")
-    
-    # Register version operations on this temporary server
-    from ..operations.version_ops import register_version_operations
-    register_version_operations(temp_mcp)
-    
-    # Find the git_log tool by name
-    for name, func in temp_mcp._tools.items():
-        if name.endswith("git_log"):
-            return await func(path, max_count)
-    
-    # Fallback if tool not found
-    return f"Error: Unable to find git_log tool"
-
-async def standalone_git_show(path: str, commit_id: str = "HEAD") -> str:
-    """Wrapper function to show git version"""
-    # Create temporary FastMCP to access the registered tool
-    temp_mcp = FastMCP("ResourceTemp")
-    
-    # Register version operations on this temporary server
-    from ..operations.version_ops import register_version_operations
-    register_version_operations(temp_mcp)
+def cache_resource_tools(mcp: FastMCP) -> None:
+    """
+    Look up the tools used by the resource handlers on the MCP server.
     
-    # Find the git_show tool by name
-    for name, func in temp_mcp._tools.items():
-        if name.endswith("git_show"):
-            return await func(path, commit_id)
+    Must be called after the tool operations are registered.
     
-    # Fallback if tool not found
-    return f"Error: Unable to find git_show tool"
+    Args:
+        mcp: The MCP server instance
+    """
+    # Index the tools by short name in one pass, rather than scanning all
+    # tools for each name
+    name_index = {name.rsplit(".", 1)[-1]: func for name, func in _registered_tools(mcp).items()}
+    for tool_name in _RESOURCE_TOOLS:
+        if tool_name in name_index:
+            _TOOL_CACHE[tool_name] = name_index[tool_name]
 
-async def standalone_git_status(path: str) -> str:
-    """Wrapper function to get git status"""
-    # Create temporary FastMCP to access the registered tool
-    temp_mcp = FastMCP("ResourceTemp")
-    
-    # Register version operations on this temporary server
-    from ..operations.version_ops import register_version_operations
-    register_version_operations(temp_mcp)
+def _tool_wrapper(tool_name: str, doc: str) -> Callable[..., Awaitable[str]]:
+    """
+    Build a wrapper that calls a cached tool by name.
     
-    # Find the git_status tool by name
-    for name, func in temp_mcp._tools.items():
-        if name.endswith("git_status"):
-            return await func(path)
+    Arguments are passed through unchanged, so omitted ones take the tool's
+    own defaults.
     
-    # Fallback if tool not found
-    return f"Error: Unable to find git_status tool"
+    Args:
+        tool_name: Name of the tool in _RESOURCE_TOOLS
+        doc: Docstring for the wrapper
+        
+    Returns:
+        Callable[..., Awaitable[str]]: Coroutine function calling the tool
+    """
+    async def _call(*args: Any) -> str:
+        func = _TOOL_CACHE.get(tool_name)
+        if func is None:
+            # Fallback if tool not found
+            return f"Error: Unable to find {tool_name} tool"
+        return await func(*args)
+    
+    _call.__doc__ = doc
+    return _call
 
-# Use help_ops functions directly since they're not wrapped in a register function
-from ..operations.help_ops import get_operations_help
+standalone_read_file = _tool_wrapper("read_file", "Wrapper function to read file contents")
+standalone_list_directory = _tool_wrapper("list_dir", "Wrapper function to list directory contents")
+standalone_get_file_tree = _tool_wrapper("get_tree", "Wrapper function to get file tree")
+standalone_get_path_stats = _tool_wrapper("get_stats", "Wrapper function to get path stats")
+standalone_git_log = _tool_wrapper("git_log", "Wrapper function to get git log")
+standalone_git_show = _tool_wrapper("git_show", "Wrapper function to show git version")
+standalone_git_status = _tool_wrapper("git_status", "Wrapper function to get git status")
 
 def register_resources(mcp: FastMCP) -> None:
     """
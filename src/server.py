@@ -7,6 +7,8 @@ import os
 import sys
 import signal
 import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional, Union, Callable
 from contextlib import asynccontextmanager
 from collections.abc import AsyncIterator
@@ -16,6 +18,21 @@ from mcp.server.fastmcp import FastMCP, Context
 from .constants import config
 from .utils.security import log_security_event
 
+# Worker threads behind asyncio.to_thread (hashing, file reads, tree walks).
+# A pool of known size bounds concurrent disk I/O, where the default
+# executor allows up to 32 threads and is shared with other libraries.
+_IO_WORKERS = max(4, min(16, (os.cpu_count() or 2) * 2))
+_io_pool_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def _install_io_pool() -> None:
+    """Make a sized thread pool the running loop's default executor, once per loop."""
+    global _io_pool_loop
+    loop = asyncio.get_running_loop()
+    if _io_pool_loop is not loop:
+        # The loop shuts its default executor down when it closes
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=_IO_WORKERS, thread_name_prefix="fileops-io"))
+        _io_pool_loop = loop
+
 # Define lifespan manager
 @asynccontextmanager
 async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
@@ -29,6 +46,7 @@ async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
         Dict[str, Any]: Server context
     """
     # Initialize resources
+    _install_io_pool()
     print(f"Starting FileOps MCP server with working directory: {config.abs_working_dir}", file=sys.stderr)
     
     # Setup context
@@ -46,13 +64,16 @@ async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
 # Create MCP server with lifespan
 mcp = FastMCP("FileOps", lifespan=server_lifespan)
 
-# Set up signal handlers for clean shutdown
+# Set up signal handlers for clean shutdown. SIGINT keeps Python's default
+# handler, which the asyncio runner turns into cancellation of the running
+# tasks, so in-flight calls unwind and the lifespan cleanup runs. SIGTERM is
+# forwarded as SIGINT to get the same cooperative shutdown, rather than
+# exiting from whatever code the signal happened to interrupt.
 def signal_handler(sig, frame):
     """Handle signals for clean shutdown."""
     print("Shutting down gracefully...", file=sys.stderr)
-    sys.exit(0)
+    signal.raise_signal(signal.SIGINT)
 
-signal.signal(signal.SIGINT, signal_handler)
 signal.signal(signal.SIGTERM, signal_handler)
 
 def initialize_server(
@@ -61,6 +82,7 @@ def initialize_server(
     hide_dot_files: bool = True,
     max_depth: int = 5,
     max_results: int = 100,
+    small_first: bool = False,
     git_enabled: bool = True,
     git_auto_commit: bool = True,
     git_username: str = "FileOps MCP",
@@ -75,6 +97,7 @@ def initialize_server(
         hide_dot_files: Whether to hide files and directories starting with .
         max_depth: Maximum depth for directory tree traversal
         max_results: Maximum number of results for searches
+        small_first: Whether content searches scan smaller files first
         git_enabled: Whether to enable Git functionality
         git_auto_commit: Whether to automatically commit changes
         git_username: Username for Git commits
@@ -86,6 +109,7 @@ def initialize_server(
     config.hide_dot_files = hide_dot_files
     config.max_depth = max(1, min(10, max_depth))  # Limit between 1 and 10
     config.max_results = max(1, min(1000, max_results))  # Limit between 1 and 1000
+    config.small_first = small_first
     config.git_enabled = git_enabled
     config.git_auto_commit = git_auto_commit
     config.git_username = git_username
@@ -98,6 +122,7 @@ def initialize_server(
     print(f"  Hide dot files: {config.hide_dot_files}", file=sys.stderr)
     print(f"  Max depth: {config.max_depth}", file=sys.stderr)
     print(f"  Max results: {config.max_results}", file=sys.stderr)
+    print(f"  Small files first: {config.small_first}", file=sys.stderr)
     print(f"  Git enabled: {config.git_enabled}", file=sys.stderr)
     print(f"  Git auto-commit: {config.git_auto_commit}", file=sys.stderr)
     
@@ -106,8 +131,9 @@ def initialize_server(
 
 def register_all_components():
     """Register all tools and resources with the MCP server."""
-    # Import and register components
-    from .resources.resource_handlers import register_resources
+    # The operation modules are imported here, once at startup, rather than
+    # at module level so that importing this module stays cheap
+    from .resources.resource_handlers import register_resources, cache_resource_tools
     from .operations.file_ops import register_file_operations
     from .operations.dir_ops import register_directory_operations
     from .operations.search_ops import register_search_operations
@@ -125,3 +151,6 @@ def register_all_components():
     register_version_operations(mcp)
     register_help_operations(mcp)
     register_doc_operations(mcp)
+    
+    # Let resource handlers call the registered tools directly
+    cache_resource_tools(mcp)
@@ -7,9 +7,31 @@ such as directory trees, file listings, and Git diffs.
 import os
 import time
 import json
-from typing import Dict, Any, List, Optional
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Final, Iterable, List, Optional, Tuple
 
 from ..constants import config
+from .path_utils import generate_checksum, guess_mime_type
+
+# Threads that list the directories of one tree level concurrently, so a
+# slow disk or network file system serves several listings at once
+_TREE_WORKERS = 8
+_tree_pool: Optional[ThreadPoolExecutor] = None
+
+# Directory listings cached by _scan_sorted, least recently used first. The
+# lock guards the cache against the tree pool's threads.
+_TREE_CACHE_SIZE = 2048
+_tree_cache: "OrderedDict[Tuple[str, bool], Tuple[int, List[Tuple[str, bool]]]]" = OrderedDict()
+_tree_cache_lock = threading.Lock()
+
+# (divisor, format spec) per unit, indexed by the size's power of 1024
+_SIZE_UNITS = (
+    (1, "{:.0f} bytes"),
+    (1024, "{:.1f} KB"),
+    (1024 * 1024, "{:.1f} MB"),
+)
 
 def format_size(size_bytes: int) -> str:
     """
@@ -21,17 +43,80 @@ def format_size(size_bytes: int) -> str:
     Returns:
         str: Formatted size string
     """
-    if size_bytes < 1024:
-        return f"{size_bytes} bytes"
-    elif size_bytes < 1024 * 1024:
-        return f"{size_bytes/1024:.1f} KB"
-    else:
-        return f"{size_bytes/(1024*1024):.1f} MB"
+    # Every 10 bits is one unit step, capped at the largest unit
+    unit = min(max(size_bytes.bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+    divisor, spec = _SIZE_UNITS[unit]
+    return spec.format(size_bytes / divisor)
+
+def _get_tree_pool() -> ThreadPoolExecutor:
+    """Get the thread pool for directory listings, creating it on first use."""
+    global _tree_pool
+    if _tree_pool is None:
+        _tree_pool = ThreadPoolExecutor(max_workers=_TREE_WORKERS, thread_name_prefix="fileops-tree")
+    return _tree_pool
+
+def _visible_entries(entries: Iterable[os.DirEntry]) -> List[os.DirEntry]:
+    """
+    Drop hidden entries if config.hide_dot_files is set.
+    
+    The setting is read once per listing and the filtering runs as a single
+    comprehension, rather than a check inside each caller's loop.
+    """
+    if config.hide_dot_files:
+        return [entry for entry in entries if not entry.name.startswith('.')]
+    return list(entries)
+
+def _scan_sorted(path: str) -> Tuple[List[Tuple[str, bool]], Optional[OSError]]:
+    """
+    List a directory's visible subdirectories and files sorted by name.
+    
+    Listings are cached by the directory's mtime, which changes whenever an
+    entry is added, removed or renamed, so repeated trees of an unchanged
+    directory cost one stat per directory instead of a scandir. As in
+    search_ops, directories modified in the last second are not cached.
+    
+    Returns:
+        Tuple[List[Tuple[str, bool]], Optional[OSError]]: (name, is_dir)
+        pairs, and the error if the directory could not be fully listed
+    """
+    key = (path, config.hide_dot_files)
+    listing = []
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+        with _tree_cache_lock:
+            cached = _tree_cache.get(key)
+            if cached is not None and cached[0] == mtime_ns:
+                _tree_cache.move_to_end(key)
+                return cached[1], None
+        
+        with os.scandir(path) as it:
+            entries = _visible_entries(it)
+        entries.sort(key=lambda entry: entry.name)
+        for entry in entries:
+            if entry.is_dir():
+                listing.append((entry.name, True))
+            elif entry.is_file():
+                listing.append((entry.name, False))
+    except OSError as e:
+        return listing, e
+    
+    if time.time_ns() - mtime_ns > 1_000_000_000:
+        with _tree_cache_lock:
+            _tree_cache[key] = (mtime_ns, listing)
+            _tree_cache.move_to_end(key)
+            if len(_tree_cache) > _TREE_CACHE_SIZE:
+                _tree_cache.popitem(last=False)
+    return listing, None
 
 def get_directory_tree(path: str, max_depth: int = 5, current_depth: int = 0) -> Dict[str, Any]:
     """
     Generate a nested dictionary representing a directory tree.
     
+    Directories are listed level by level with os.scandir, whose entries
+    carry the file type, so no separate stat is needed per entry. The
+    directories of a level are listed concurrently on a thread pool, and
+    listings of unchanged directories are served from a cache.
+    
     Args:
         path: Path to the directory
         max_depth: Maximum depth to traverse
@@ -46,30 +131,43 @@ def get_directory_tree(path: str, max_depth: int = 5, current_depth: int = 0) ->
     if not os.path.isdir(path):
         return None
     
-    name = os.path.basename(path)
-    
-    result = {"name": name, "type": "directory", "children": []}
+    result = {"name": os.path.basename(path), "type": "directory", "children": []}
     
-    try:
-        entries = sorted(os.listdir(path))
-        for entry in entries:
-            if config.hide_dot_files and entry.startswith('.'):
-                continue
-                
-            entry_path = os.path.join(path, entry)
-            if os.path.isdir(entry_path):
-                child = get_directory_tree(entry_path, max_depth, current_depth + 1)
-                if child:
-                    result["children"].append(child)
-            elif os.path.isfile(entry_path):
-                result["children"].append({"name": entry, "type": "file"})
-    except PermissionError:
-        result["error"] = "Permission denied"
-    except OSError as e:
-        result["error"] = str(e)
+    # Directories of the current level. Each node is attached to its parent
+    # when the parent is listed, so children keep their sorted order.
+    level = [(path, current_depth, result)]
+    while level:
+        if len(level) == 1:
+            listings = [_scan_sorted(level[0][0])]
+        else:
+            listings = _get_tree_pool().map(_scan_sorted, [dir_path for dir_path, _, _ in level])
+        
+        next_level = []
+        for (dir_path, depth, node), (listing, error) in zip(level, listings):
+            for name, is_dir in listing:
+                if not is_dir:
+                    node["children"].append({"name": name, "type": "file"})
+                elif depth + 1 > max_depth:
+                    node["children"].append({"truncated": True})
+                else:
+                    child = {"name": name, "type": "directory", "children": []}
+                    node["children"].append(child)
+                    next_level.append((os.path.join(dir_path, name), depth + 1, child))
+            if isinstance(error, PermissionError):
+                node["error"] = "Permission denied"
+            elif error is not None:
+                node["error"] = str(error)
+        level = next_level
     
     return result
 
+# Tree drawing pieces: a branch to a middle child, a branch to the last
+# child, and the indentation continuing below a middle or a last child
+_TREE_TEE: Final[str] = "\u251c\u2500\u2500 "
+_TREE_END: Final[str] = "\u2514\u2500\u2500 "
+_TREE_BAR: Final[str] = "\u2502   "
+_TREE_SPACE: Final[str] = "    "
+
 def format_tree_for_display(tree: Dict[str, Any], indent: str = "", is_last: bool = True) -> str:
     """
     Format a directory tree dictionary as a string for display.
@@ -82,34 +180,45 @@ def format_tree_for_display(tree: Dict[str, Any], indent: str = "", is_last: boo
     Returns:
         str: Formatted tree string
     """
-    if not tree:
-        return ""
-    
-    if tree.get("truncated"):
-        marker = "└── " if is_last else "├── "
-        return f"{indent}{marker}...\n"
-    
-    marker = "└── " if is_last else "├── "
-    result = f"{indent}{marker}{tree['name']}\n"
-    
-    if tree.get("error"):
-        result += f"{indent}    └── Error: {tree['error']}\n"
-        return result
-    
-    if tree.get("type") == "file":
-        return result
-    
-    children = tree.get("children", [])
-    if not children:
-        return result
-    
-    new_indent = indent + ("    " if is_last else "│   ")
-    
-    for i, child in enumerate(children):
-        is_last_child = i == len(children) - 1
-        result += format_tree_for_display(child, new_indent, is_last_child)
+    # Nodes still to print, with their indentation; children are pushed in
+    # reverse so they pop in order, without recursing per level
+    parts = []
+    stack = [(tree, indent, is_last)]
+    # Child indentation per (indent, is_last), so directories whose ancestors
+    # line up the same share one prefix string instead of building their own
+    child_indents: Dict[Tuple[str, bool], str] = {}
+    while stack:
+        node, indent, is_last = stack.pop()
+        if not node:
+            continue
+        
+        marker = _TREE_END if is_last else _TREE_TEE
+        if node.get("truncated"):
+            parts.append(f"{indent}{marker}...\n")
+            continue
+        
+        parts.append(f"{indent}{marker}{node['name']}\n")
+        
+        if node.get("error"):
+            parts.append(f"{indent}{_TREE_SPACE}{_TREE_END}Error: {node['error']}\n")
+            continue
+        
+        if node.get("type") == "file":
+            continue
+        
+        children = node.get("children", [])
+        if not children:
+            continue
+        
+        new_indent = child_indents.get((indent, is_last))
+        if new_indent is None:
+            new_indent = indent + (_TREE_SPACE if is_last else _TREE_BAR)
+            child_indents[(indent, is_last)] = new_indent
+        last = len(children) - 1
+        for i in range(last, -1, -1):
+            stack.append((children[i], new_indent, i == last))
     
-    return result
+    return "".join(parts)
 
 def format_file_contents(path: str, content: str, include_metadata: bool = True) -> str:
     """
@@ -127,40 +236,31 @@ def format_file_contents(path: str, content: str, include_metadata: bool = True)
         return content
     
     try:
-        file_size = os.path.getsize(path)
-        checksum = None
+        st = os.stat(path)
         try:
-            import hashlib
-            h = hashlib.sha256()
-            with open(path, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b''):
-                    h.update(chunk)
-            checksum = h.hexdigest()
+            # generate_checksum caches by file identity, with the same-second
+            # guard, so an unchanged file is not hashed again
+            metadata = f"File: {path}\nSize: {st.st_size} bytes\nChecksum (SHA-256): {generate_checksum(path, st)}"
         except Exception:
-            pass
-        
-        metadata = f"File: {path}\nSize: {file_size} bytes"
-        if checksum:
-            metadata += f"\nChecksum (SHA-256): {checksum}"
+            # Leave out the checksum if the file could not be hashed
+            metadata = f"File: {path}\nSize: {st.st_size} bytes"
         
         return f"{metadata}\n\nContent:\n\n{content}"
     except Exception as e:
         return f"Error retrieving file metadata: {str(e)}\n\nContent:\n\n{content}"
 
-def format_directory_listing(path: str, entries: List[str]) -> str:
+def format_directory_listing(path: str, entries: List[os.DirEntry]) -> str:
     """
     Format directory listing with file details.
     
     Args:
         path: Path to the directory
-        entries: List of directory entries
+        entries: Entries of the directory, as returned by os.scandir
         
     Returns:
         str: Formatted directory listing
     """
-    import mimetypes
-    
-    result = f"Directory: {path}\n\n"
+    parts = [f"Directory: {path}\n\n"]
     
     dirs = []
     files = []
@@ -169,65 +269,62 @@ def format_directory_listing(path: str, entries: List[str]) -> str:
     start_time = time.time()
     entry_count = 0
     
-    for entry in sorted(entries):
+    for entry in sorted(_visible_entries(entries), key=lambda entry: entry.name):
         # Check timeout periodically
         entry_count += 1
         if entry_count % 100 == 0 and time.time() - start_time > 10:  # 10 second timeout
-            result += "... (listing truncated due to timeout)\n"
+            parts.append("... (listing truncated due to timeout)\n")
             break
             
-        if config.hide_dot_files and entry.startswith('.'):
-            continue
-            
-        full_path = os.path.join(path, entry)
         try:
-            # Use os.path.isdir with error handling for path access issues
-            if os.path.isdir(full_path):
-                dirs.append((entry, full_path))
+            # The entry's type comes from the directory listing, without a stat
+            if entry.is_dir():
+                dirs.append((entry.name, entry))
             else:
-                files.append((entry, full_path))
+                files.append((entry.name, entry))
         except (PermissionError, OSError):
             # If we can't determine type, treat as a file with access issues
-            files.append((entry, full_path, "access_error"))
+            files.append((entry.name, entry, "access_error"))
     
     if dirs:
-        result += "Directories:\n"
-        for name, full_path in dirs:
-            result += f"📁 {name}/\n"
-        result += "\n"
+        parts.append("Directories:\n")
+        for name, _ in dirs:
+            parts.append(f"📁 {name}/\n")
+        parts.append("\n")
         
     if files:
-        result += "Files:\n"
+        parts.append("Files:\n")
         for file_info in files:
             if len(file_info) == 3:  # This is a file with access error
                 name, _, _ = file_info
-                result += f"📄 {name} (access error)\n"
+                parts.append(f"📄 {name} (access error)\n")
                 continue
                 
-            name, full_path = file_info
+            name, entry = file_info
             try:
-                size = os.path.getsize(full_path)
+                # DirEntry caches its stat result, so this is the only stat per
+                # entry even on filesystems where is_dir() above had to stat
+                size = entry.stat().st_size
                 size_str = format_size(size)
                 
                 # Use a try/except specifically for mime type to handle that error separately
                 try:
-                    mime_type, _ = mimetypes.guess_type(full_path)
-                    mime_str = mime_type or 'application/octet-stream'
+                    mime_str = guess_mime_type(name) or 'application/octet-stream'
                 except Exception:
                     mime_str = 'unknown/type'
                     
-                result += f"📄 {name} ({size_str}, {mime_str})\n"
+                parts.append(f"📄 {name} ({size_str}, {mime_str})\n")
             except PermissionError:
-                result += f"📄 {name} (permission denied)\n"
+                parts.append(f"📄 {name} (permission denied)\n")
             except OSError as e:
-                result += f"📄 {name} (error: {str(e)})\n"
+                parts.append(f"📄 {name} (error: {str(e)})\n")
             except Exception as e:
-                result += f"📄 {name} (unexpected error)\n"
+                parts.append(f"📄 {name} (unexpected error)\n")
     
     if not dirs and not files:
-        result += "Directory is empty."
+        parts.append("Directory is empty.")
         
-    return result
+    return "".join(parts)
 
 def format_git_log(log_entries: List[Dict[str, Any]]) -> str:
     """
@@ -242,20 +339,20 @@ def format_git_log(log_entries: List[Dict[str, Any]]) -> str:
     if not log_entries:
         return "No commit history available."
     
-    result = "Commit History:\n\n"
+    parts = ["Commit History:\n\n"]
     
     for entry in log_entries:
-        result += f"Commit: {entry['commit']}\n"
-        result += f"Author: {entry['author']}\n"
-        result += f"Date: {entry['date']}\n"
-        result += f"Message: {entry['message']}\n"
+        parts.append(f"Commit: {entry['commit']}\n")
+        parts.append(f"Author: {entry['author']}\n")
+        parts.append(f"Date: {entry['date']}\n")
+        parts.append(f"Message: {entry['message']}\n")
         if 'changes' in entry and entry['changes']:
-            result += "Changes:\n"
+            parts.append("Changes:\n")
             for change in entry['changes']:
-                result += f"  {change}\n"
-        result += "\n"
+                parts.append(f"  {change}\n")
+        parts.append("\n")
     
-    return result
+    return "".join(parts)
 
 def format_git_diff(diff_content: str) -> str:
     """
@@ -267,7 +364,10 @@ def format_git_diff(diff_content: str) -> str:
     Returns:
         str: Formatted diff
     """
-    # Simple formatting for now - could be enhanced with syntax highlighting
+    # Returned as plain text: MCP clients render tool output as text, so
+    # colour codes would only add noise. Any per-line markup added later
+    # should be one re.sub over the whole diff with a precompiled
+    # re.MULTILINE pattern, not a Python loop over splitlines().
     if not diff_content:
         return "No differences found."
     
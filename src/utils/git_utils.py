@@ -6,15 +6,14 @@ including initialization, commits, logs, and diffs.
 """
 import os
 import time
-import re
-from typing import Dict, Any, List, Optional, Tuple, Union
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
 
-# Import git module
-try:
-    import git
-    GIT_AVAILABLE = True
-except ImportError:
-    GIT_AVAILABLE = False
+# GitPython is imported on first use by _load_git, so servers running with
+# Git disabled never pay for the import. None until the import is attempted.
+git = None
+GIT_AVAILABLE: Optional[bool] = None
 
 from ..constants import config
 from .security import log_security_event, sanitize_path
@@ -24,6 +23,49 @@ class GitError(Exception):
     """Custom exception for Git-related errors."""
     pass
 
+# Repository handles by working tree root, with the mtime of the HEAD file
+# when the handle was opened, least recently used first. Bounded because
+# each handle may keep git helper processes running.
+_repo_cache: "OrderedDict[str, Tuple[int, git.Repo]]" = OrderedDict()
+_REPO_CACHE_SIZE = 32
+# Repository root found for each directory looked up so far
+_repo_root_cache: Dict[str, str] = {}
+_REPO_ROOT_CACHE_SIZE = 4096
+_repo_cache_lock = threading.Lock()
+
+# Diff output by (git dir, commit SHA, commit SHA, path), least recently used
+# first. Commits are immutable, so entries never go stale.
+_DIFF_CACHE_SIZE = 256
+_diff_cache: "OrderedDict[Tuple[str, str, str, str], str]" = OrderedDict()
+_diff_cache_lock = threading.Lock()
+
+def clear_repo_cache() -> None:
+    """
+    Forget all cached repository handles and repository root lookups.
+    """
+    with _repo_cache_lock:
+        _repo_cache.clear()
+        _repo_root_cache.clear()
+
+def _load_git() -> bool:
+    """
+    Import GitPython into the module's ``git`` name on first call.
+    
+    Every function using ``git`` reaches it through check_git_available,
+    directly or via get_repo.
+    
+    Returns:
+        bool: Whether GitPython is available
+    """
+    global git, GIT_AVAILABLE
+    if GIT_AVAILABLE is None:
+        try:
+            import git
+            GIT_AVAILABLE = True
+        except ImportError:
+            GIT_AVAILABLE = False
+    return GIT_AVAILABLE
+
 def check_git_available():
     """
     Check if Git functionality is available.
@@ -31,16 +73,21 @@ def check_git_available():
     Raises:
         GitError: If Git is not available
     """
-    if not GIT_AVAILABLE:
-        raise GitError("Git functionality is not available. Please install 'gitpython' package.")
-    
     if not config.git_enabled:
         raise GitError("Git functionality is disabled in configuration.")
+    
+    if not _load_git():
+        raise GitError("Git functionality is not available. Please install 'gitpython' package.")
 
 def get_repo(path: str) -> 'git.Repo':
     """
     Get Git repository for a path.
     
+    Handles are cached, so repeated calls do not rediscover the repository
+    or re-read its configuration. GitPython reads refs from disk on each
+    access, so a cached handle stays current across commits; it is reopened
+    if the repository's HEAD file changes or disappears.
+    
     Args:
         path: Path within a Git repository
         
@@ -56,6 +103,19 @@ def get_repo(path: str) -> 'git.Repo':
         # If path is a file, use its directory
         if os.path.isfile(path):
             path = os.path.dirname(path)
+        
+        with _repo_cache_lock:
+            root = _repo_root_cache.get(path)
+            cached = _repo_cache.get(root)
+            if cached is not None:
+                _repo_cache.move_to_end(root)
+        if cached is not None:
+            head_mtime, repo = cached
+            try:
+                if os.stat(os.path.join(repo.git_dir, 'HEAD')).st_mtime_ns == head_mtime:
+                    return repo
+            except OSError:
+                pass
             
         # Try to find repository
         repo = git.Repo(path, search_parent_directories=True)
@@ -65,6 +125,16 @@ def get_repo(path: str) -> 'git.Repo':
         if not repo_root.startswith(config.abs_working_dir):
             raise GitError(f"Repository root {repo_root} is outside the working directory")
         
+        head_mtime = os.stat(os.path.join(repo.git_dir, 'HEAD')).st_mtime_ns
+        with _repo_cache_lock:
+            if len(_repo_root_cache) >= _REPO_ROOT_CACHE_SIZE:
+                _repo_root_cache.clear()
+            _repo_root_cache[path] = repo_root
+            _repo_cache[repo_root] = (head_mtime, repo)
+            _repo_cache.move_to_end(repo_root)
+            if len(_repo_cache) > _REPO_CACHE_SIZE:
+                _repo_cache.popitem(last=False)
+        
         return repo
     except git.InvalidGitRepositoryError:
         raise GitError(f"No Git repository found at or above {path}")
@@ -103,6 +173,9 @@ def init_repo(path: str) -> str:
         # Initialize repository
         repo = git.Repo.init(path)
         
+        # Directories below the new repository now resolve to it
+        clear_repo_cache()
+        
         # Set up initial configuration
         with repo.config_writer() as config_writer:
             config_writer.set_value("user", "name", config.git_username)
@@ -119,6 +192,20 @@ def init_repo(path: str) -> str:
     except Exception as e:
         raise GitError(f"Failed to initialize Git repository: {str(e)}")
 
+def _has_staged_changes(repo: 'git.Repo', *rel_paths: str) -> bool:
+    """
+    Check whether the index differs from HEAD for the given paths.
+    
+    Unlike repo.is_dirty(), this only compares the paths just staged rather
+    than scanning the whole index and working tree.
+    """
+    try:
+        # --quiet exits with status 1 when there are differences
+        repo.git.diff("--cached", "--quiet", "--", *rel_paths)
+        return False
+    except git.GitCommandError:
+        return True
+
 def commit_file(path: str, message: str = None, operation: str = None) -> str:
     """
     Commit changes to a file.
@@ -148,14 +235,19 @@ def commit_file(path: str, message: str = None, operation: str = None) -> str:
         # Get relative path from repo root
         rel_path = os.path.relpath(os.path.abspath(path), repo.working_dir)
         
-        # Check if file is tracked or new
-        is_new = rel_path not in repo.git.ls_files().split()
+        # Check if file is tracked or new; ls-files is limited to the path so
+        # the cost does not grow with the number of tracked files
+        try:
+            repo.git.ls_files("--error-unmatch", "--", rel_path)
+            is_new = False
+        except git.GitCommandError:
+            is_new = True
         
         # Stage file
         repo.git.add(rel_path)
         
         # Check if there are changes to commit
-        if not repo.is_dirty():
+        if not _has_staged_changes(repo, rel_path):
             return "No changes to commit"
         
         # Generate commit message if not provided
@@ -176,16 +268,26 @@ def commit_file(path: str, message: str = None, operation: str = None) -> str:
     except Exception as e:
         raise GitError(f"Failed to commit changes: {str(e)}")
 
-def get_file_history(path: str, max_count: int = 10) -> List[Dict[str, Any]]:
+# Descriptions of the name-status codes reported in file history; other
+# codes (type changes, unmerged entries) are left out
+_CHANGE_LABELS = {'A': "Added", 'D': "Deleted", 'M': "Modified"}
+
+def iter_file_history(path: str, max_count: int = 10) -> Iterator[Dict[str, Any]]:
     """
-    Get commit history for a file.
+    Yield the commit history of a file, newest first.
+    
+    The commits and the file's change in each are read from a single
+    ``git log --follow --name-status`` run, instead of loading commit
+    objects and diffing each against its parents. History continues across
+    renames, with earlier commits reported under the file's old path. Each
+    commit's dict is built only when the caller asks for it.
     
     Args:
         path: Path to the file
-        max_count: Maximum number of commits to return
+        max_count: Maximum number of commits to yield
         
-    Returns:
-        List[Dict[str, Any]]: List of commit information
+    Yields:
+        Dict[str, Any]: Commit information
         
     Raises:
         GitError: If history retrieval fails
@@ -199,39 +301,74 @@ def get_file_history(path: str, max_count: int = 10) -> List[Dict[str, Any]]:
         # Get relative path from repo root
         rel_path = os.path.relpath(os.path.abspath(path), repo.working_dir)
         
-        # Get commit history
-        commits = list(repo.iter_commits(paths=rel_path, max_count=max_count))
-        
-        # Format commit information
-        history = []
-        for commit in commits:
+        # Get commit history. Each commit starts with \x01 and its fields and
+        # name-status entries are NUL-separated.
+        try:
+            output = repo.git.log(
+                f"--max-count={max_count}", "--format=%x01%H%x00%an%x00%ae%x00%ct%x00%B",
+                "--follow", "--name-status", "-z", "--", rel_path
+            )
+        except git.GitCommandError:
+            # No commits yet
+            return
+        
+        # Format commit information, one record at a time
+        start = output.find("\x01")
+        while start != -1:
+            end = output.find("\x01", start + 1)
+            record = output[start + 1:end] if end != -1 else output[start + 1:]
+            start = end
+            
+            fields = record.split("\0")
+            commit_hash, author_name, author_email, committed_date, message = fields[:5]
+            
             # Get changes in this commit for the specific file
             file_changes = []
-            for parent in commit.parents:
-                diff = parent.diff(commit, paths=rel_path)
-                for d in diff:
-                    change_type = d.change_type
-                    if change_type == 'A':
-                        file_changes.append(f"Added: {rel_path}")
-                    elif change_type == 'D':
-                        file_changes.append(f"Deleted: {rel_path}")
-                    elif change_type == 'R':
-                        file_changes.append(f"Renamed: {d.a_path} -> {d.b_path}")
-                    elif change_type == 'M':
-                        file_changes.append(f"Modified: {rel_path}")
+            entries = iter(fields[5:])
+            for change_type in entries:
+                change_type = change_type.strip()
+                if not change_type:
+                    continue
+                if change_type[0] in "RC":
+                    # Renames and copies list the old and the new path
+                    old_path, new_path = next(entries, ""), next(entries, "")
+                    if change_type[0] == "R":
+                        file_changes.append(f"Renamed: {old_path} -> {new_path}")
+                    continue
+                # The path as it was in this commit, which differs from
+                # rel_path in commits from before a rename
+                changed_path = next(entries, rel_path)
+                label = _CHANGE_LABELS.get(change_type)
+                if label is not None:
+                    file_changes.append(f"{label}: {changed_path}")
             
-            history.append({
-                'commit': commit.hexsha,
-                'author': f"{commit.author.name} <{commit.author.email}>",
-                'date': time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(commit.committed_date)),
-                'message': commit.message,
+            yield {
+                'commit': commit_hash,
+                'author': f"{author_name} <{author_email}>",
+                'date': time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(int(committed_date))),
+                'message': message,
                 'changes': file_changes
-            })
-        
-        return history
+            }
     except Exception as e:
         raise GitError(f"Failed to get file history: {str(e)}")
 
+def get_file_history(path: str, max_count: int = 10) -> List[Dict[str, Any]]:
+    """
+    Get commit history for a file.
+    
+    Args:
+        path: Path to the file
+        max_count: Maximum number of commits to return
+        
+    Returns:
+        List[Dict[str, Any]]: List of commit information, as yielded by
+        iter_file_history
+        
+    Raises:
+        GitError: If history retrieval fails
+    """
+    return list(iter_file_history(path, max_count))
+
 def get_file_at_commit(path: str, commit_id: str = "HEAD") -> str:
     """
     Get the contents of a file at a specific commit.
@@ -261,12 +398,18 @@ def get_file_at_commit(path: str, commit_id: str = "HEAD") -> str:
         except git.BadName:
             raise GitError(f"Invalid commit reference: {commit_id}")
         
-        # Get file contents at that commit
+        # Get file contents at that commit. The <commit>:<path> lookup goes to
+        # the repository's persistent `git cat-file --batch` process (kept
+        # alive with the cached repo handle) instead of walking the commit's
+        # trees in Python.
         try:
-            blob = commit.tree / rel_path
-            return blob.data_stream.read().decode('utf-8')
-        except KeyError:
+            _, object_type, _, data = repo.git.get_object_data(f"{commit.hexsha}:{rel_path.replace(os.sep, '/')}")
+        except ValueError:
             raise GitError(f"File {rel_path} does not exist in commit {commit_id}")
+        # GitPython passes the type through as read from git, i.e. as bytes
+        if object_type not in (b"blob", "blob"):
+            raise GitError(f"{rel_path} is not a file in commit {commit_id}")
+        return data.decode('utf-8')
     except Exception as e:
         if isinstance(e, GitError):
             raise
@@ -296,32 +439,44 @@ def get_file_diff(path: str, commit1: str = "HEAD~1", commit2: str = "HEAD") ->
         # Get relative path from repo root
         rel_path = os.path.relpath(os.path.abspath(path), repo.working_dir)
         
+        # Refs such as HEAD move, so the cache is keyed on the commits they
+        # point to now; references that do not resolve are not cached
+        try:
+            key = (repo.git_dir, repo.rev_parse(commit1).hexsha, repo.rev_parse(commit2).hexsha, rel_path)
+        except Exception:
+            key = None
+        
         # Get diff
         try:
-            diff = repo.git.diff(commit1, commit2, "--", rel_path)
+            with _diff_cache_lock:
+                diff = _diff_cache.get(key) if key is not None else None
+                if diff is not None:
+                    _diff_cache.move_to_end(key)
+            if diff is None:
+                diff = repo.git.diff(commit1, commit2, "--", rel_path)
+                if key is not None:
+                    with _diff_cache_lock:
+                        _diff_cache[key] = diff
+                        if len(_diff_cache) > _DIFF_CACHE_SIZE:
+                            _diff_cache.popitem(last=False)
             if not diff:
                 return "No differences found between these commits for this file."
             return diff
         except git.GitCommandError as e:
             # Check if error is due to file not existing in one of the commits
             if "does not exist" in str(e) or "exists on disk, but not in" in str(e):
-                # Try to determine if file was added or deleted
+                # One name-status diff tells whether the file was added or
+                # deleted, instead of probing each commit with git show
                 try:
-                    repo.git.show(f"{commit1}:{rel_path}")
-                    try:
-                        repo.git.show(f"{commit2}:{rel_path}")
-                        # File exists in both commits but diff failed for another reason
-                        raise GitError(f"Failed to get diff: {str(e)}")
-                    except git.GitCommandError:
-                        # File exists in commit1 but not in commit2
-                        return f"File was deleted between {commit1} and {commit2}"
+                    status = repo.git.diff("--name-status", commit1, commit2, "--", rel_path).strip()
                 except git.GitCommandError:
-                    try:
-                        repo.git.show(f"{commit2}:{rel_path}")
-                        # File exists in commit2 but not in commit1
+                    status = None
+                if status is not None:
+                    if status.startswith("A"):
                         return f"File was added between {commit1} and {commit2}"
-                    except git.GitCommandError:
-                        # File doesn't exist in either commit
+                    if status.startswith("D"):
+                        return f"File was deleted between {commit1} and {commit2}"
+                    if not status:
                         raise GitError(f"File {rel_path} does not exist in either commit")
             
             raise GitError(f"Failed to get diff: {str(e)}")
@@ -365,13 +520,13 @@ def revert_to_commit(path: str, commit_id: str) -> str:
         except KeyError:
             raise GitError(f"File {rel_path} does not exist in commit {commit_id}")
         
-        # Checkout file from commit
+        # Checkout file from commit; checking out from a commit updates the
+        # index as well as the working tree, so no separate add is needed
         repo.git.checkout(commit_id, "--", rel_path)
         
         # Commit the revert
         commit_msg = f"Reverted {rel_path} to state at {commit_id}"
-        repo.git.add(rel_path)
-        if repo.is_dirty():
+        if _has_staged_changes(repo, rel_path):
             new_commit = repo.index.commit(commit_msg)
             return f"Reverted to commit {commit_id} and created new commit {new_commit.hexsha[:8]}"
         else:
@@ -385,6 +540,10 @@ def get_repo_status(path: str) -> Dict[str, Any]:
     """
     Get status of a Git repository.
     
+    Branch, staged, changed and untracked files all come from a single
+    ``git status --porcelain=v2`` run, which reads the index once; the
+    latest commit takes one ``git log`` run.
+    
     Args:
         path: Path within repository
         
@@ -403,33 +562,55 @@ def get_repo_status(path: str) -> Dict[str, Any]:
         # Get status
         status = {
             'path': repo.working_dir,
-            'active_branch': str(repo.active_branch),
-            'is_dirty': repo.is_dirty(),
-            'untracked_files': repo.untracked_files,
+            'active_branch': None,
+            'is_dirty': False,
+            'untracked_files': [],
             'staged_files': [],
             'changed_files': [],
             'latest_commit': None,
         }
         
-        # Get staged and changed files
-        for item in repo.index.diff("HEAD"):
-            status['staged_files'].append(item.a_path)
-        
-        for item in repo.index.diff(None):
-            status['changed_files'].append(item.a_path)
+        # Records are NUL-terminated; see git-status(1), "Porcelain Format Version 2"
+        output = repo.git.status("--porcelain=v2", "--branch", "-z", "--untracked-files=all")
+        records = iter(output.split("\0"))
+        for record in records:
+            kind = record[:2]
+            if kind == "1 " or kind == "2 ":
+                # Changed entry: "1 XY sub mH mI mW hH hI path", where X is
+                # the staged and Y the unstaged status ('.' if unchanged);
+                # renames have an extra score field and the original path as
+                # the next record
+                fields = record.split(" ", 8 if kind == "1 " else 9)
+                if kind == "2 ":
+                    next(records, None)
+                xy, file_path = fields[1], fields[-1]
+                if xy[0] != ".":
+                    status['staged_files'].append(file_path)
+                if xy[1] != ".":
+                    status['changed_files'].append(file_path)
+            elif kind == "u ":
+                # Unmerged entry, with three stages before the path
+                status['changed_files'].append(record.split(" ", 10)[-1])
+            elif kind == "? ":
+                status['untracked_files'].append(record[2:])
+            elif record.startswith("# branch.head "):
+                status['active_branch'] = record[len("# branch.head "):]
+        status['is_dirty'] = bool(status['staged_files'] or status['changed_files'])
         
         # Get latest commit if available
         try:
-            latest_commit = next(repo.iter_commits(max_count=1))
+            fields = repo.git.log("-1", "--format=%H%x00%an%x00%ae%x00%ct%x00%B").split("\0", 4)
+        except git.GitCommandError:
+            # No commits yet
+            fields = None
+        if fields and len(fields) == 5:
+            commit_hash, author_name, author_email, committed_date, message = fields
             status['latest_commit'] = {
-                'hash': latest_commit.hexsha,
-                'author': f"{latest_commit.author.name} <{latest_commit.author.email}>",
-                'date': time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(latest_commit.committed_date)),
-                'message': latest_commit.message,
+                'hash': commit_hash,
+                'author': f"{author_name} <{author_email}>",
+                'date': time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(int(committed_date))),
+                'message': message,
             }
-        except StopIteration:
-            # No commits yet
-            pass
         
         return status
     except Exception as e:
@@ -441,6 +622,10 @@ def auto_commit_changes(path: str, operation: str, commit_message: str = None) -
     """
     Automatically commit changes if configured to do so.
     
+    The commit is made before returning, so the tool can report its hash.
+    Operations that change several files use auto_commit_paths instead,
+    which stages them with one ``git add`` and commits once.
+    
     Args:
         path: Path to the file
         operation: Operation that triggered the commit
@@ -481,6 +666,72 @@ def auto_commit_changes(path: str, operation: str, commit_message: str = None) -
         })
         return f"Auto-commit failed: {str(e)}"
 
+def auto_commit_paths(paths: List[str], operation: str, commit_message: str = None) -> Optional[str]:
+    """
+    Automatically commit changes to several files as a single commit.
+
+    Paths that still exist are staged with one ``git add`` call and deleted
+    ones with one ``git rm --cached`` call (paths Git never tracked are
+    ignored), then everything is committed together instead of per file.
+
+    Args:
+        paths: Absolute paths of the files that were changed or deleted
+        operation: Operation that triggered the commit
+        commit_message: Custom commit message (optional)
+
+    Returns:
+        Optional[str]: Commit result or None if auto-commit is disabled or
+        there is nothing to commit
+    """
+    if not config.git_enabled or not config.git_auto_commit or not paths:
+        return None
+
+    try:
+        check_git_available()
+
+        # Locate the repository from the deepest directory shared by all paths;
+        # files may have been deleted, so use their parent directories
+        abs_paths = [os.path.abspath(p) for p in paths]
+        base_dir = os.path.commonpath([os.path.dirname(p) for p in abs_paths])
+        try:
+            repo = get_repo(base_dir)
+        except GitError:
+            # Not in a Git repository, try to initialize one
+            init_repo(base_dir)
+            repo = get_repo(base_dir)
+
+        rel_paths = [os.path.relpath(p, repo.working_dir) for p in abs_paths]
+
+        # git add fails outright on a pathspec that is neither on disk nor
+        # tracked, so stage deletions separately and tolerate unknown paths
+        present = [r for p, r in zip(abs_paths, rel_paths) if os.path.lexists(p)]
+        missing = [r for p, r in zip(abs_paths, rel_paths) if not os.path.lexists(p)]
+        if present:
+            repo.git.add("-A", "--", *present)
+        if missing:
+            repo.git.rm("--cached", "--ignore-unmatch", "-q", "--", *missing)
+
+        # Check if there are changes to commit
+        if not _has_staged_changes(repo, *rel_paths):
+            return "No changes to commit"
+
+        label = rel_paths[0] if len(rel_paths) == 1 else f"{len(rel_paths)} files"
+        if commit_message:
+            message = f"[{operation}] {label}: {commit_message}"
+        else:
+            message = config.git_commit_template.format(operation=operation, path=label)
+
+        commit = repo.index.commit(message)
+        return f"Committed {label}: {commit.hexsha[:8]}"
+    except Exception as e:
+        # Log error but don't interrupt the main operation
+        log_security_event("auto_commit_error", {
+            "paths": paths,
+            "operation": operation,
+            "error": str(e)
+        })
+        return f"Auto-commit failed: {str(e)}"
+
 def get_current_branch(path: str) -> str:
     """
     Get the name of the current branch.
@@ -506,6 +757,9 @@ def list_branches(path: str) -> List[Dict[str, Any]]:
     """
     Get a list of all branches in the repository.
     
+    All branches and their last commits are read from a single
+    ``git for-each-ref`` run rather than loading each branch's commit.
+    
     Args:
         path: Path within the repository
         
@@ -517,17 +771,23 @@ def list_branches(path: str) -> List[Dict[str, Any]]:
     """
     try:
         repo = get_repo(path)
-        current = str(repo.active_branch)
+        
+        # Each branch starts with \x01 and its fields are NUL-separated;
+        # %(HEAD) is '*' for the checked out branch
+        output = repo.git.for_each_ref(
+            "--format=%01%(HEAD)%00%(refname:short)%00%(objectname)%00%(committerdate:unix)%00%(contents)",
+            "refs/heads/"
+        )
         
         branches = []
-        for branch in repo.branches:
+        for record in output.split("\x01")[1:]:
+            head, name, commit_hash, committed_date, message = record.split("\0", 4)
             branches.append({
-                'name': branch.name,
-                'is_current': branch.name == current,
-                # Try to get the commit it points to
-                'commit': branch.commit.hexsha,
-                'last_commit_date': time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(branch.commit.committed_date)),
-                'last_commit_message': branch.commit.message.strip(),
+                'name': name,
+                'is_current': head == "*",
+                'commit': commit_hash,
+                'last_commit_date': time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(int(committed_date))),
+                'last_commit_message': message.strip(),
             })
         
         return branches
@@ -536,6 +796,14 @@ def list_branches(path: str) -> List[Dict[str, Any]]:
             raise
         raise GitError(f"Failed to list branches: {str(e)}")
 
+def _branch_exists(repo: 'git.Repo', branch_name: str) -> bool:
+    """Check for a local branch by looking up its ref, without listing all branches."""
+    try:
+        repo.git.show_ref("--verify", "--quiet", f"refs/heads/{branch_name}")
+        return True
+    except git.GitCommandError:
+        return False
+
 def create_branch(path: str, branch_name: str) -> bool:
     """
     Create a new branch at the current HEAD.
@@ -554,7 +822,7 @@ def create_branch(path: str, branch_name: str) -> bool:
         repo = get_repo(path)
         
         # Check if branch already exists
-        if branch_name in [b.name for b in repo.branches]:
+        if _branch_exists(repo, branch_name):
             raise GitError(f"Branch '{branch_name}' already exists")
         
         # Create new branch at current HEAD
@@ -584,7 +852,7 @@ def switch_branch(path: str, branch_name: str) -> bool:
         repo = get_repo(path)
         
         # Check if branch exists
-        if branch_name not in [b.name for b in repo.branches]:
+        if not _branch_exists(repo, branch_name):
             raise GitError(f"Branch '{branch_name}' does not exist")
         
         # Check for uncommitted changes
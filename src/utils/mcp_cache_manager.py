@@ -1,4 +1,5 @@
 import subprocess
+import shutil
 import time
 import sys
 import hashlib
@@ -14,6 +15,8 @@ class CacheAvailabilityManager:
     def __init__(self, script_path=None):
         self.script_name = Path(script_path or sys.argv[0]).stem
         self.start_time = time.time()
+        # Resolved once; None once uv is known to be missing
+        self._uv_path = shutil.which('uv')
     
     def log(self, message):
         """Log with timestamp and script name."""
@@ -22,20 +25,14 @@ class CacheAvailabilityManager:
     
     def test_uv_responsiveness(self, timeout=3):
         """Test if UV is responsive and cache is accessible."""
+        if self._uv_path is None:
+            return False, "UV not found"
         try:
-            # Test 1: Basic UV responsiveness
-            result = subprocess.run(
-                ['uv', '--version'],
-                capture_output=True,
-                timeout=timeout,
-                text=True
-            )
-            if result.returncode != 0:
-                return False, "UV not responsive"
-            
-            # Test 2: Cache directory access
+            # A single probe: `uv cache dir` only succeeds if uv runs and can
+            # resolve its cache, so separate version and prune checks add
+            # process spawns without telling us more
             cache_result = subprocess.run(
-                ['uv', 'cache', 'dir'],
+                [self._uv_path, 'cache', 'dir'],
                 capture_output=True,
                 timeout=timeout,
                 text=True
@@ -43,20 +40,12 @@ class CacheAvailabilityManager:
             if cache_result.returncode != 0:
                 return False, "Cache not accessible"
             
-            # Test 3: Quick cache operation (non-destructive)
-            info_result = subprocess.run(
-                ['uv', 'cache', 'prune', '--dry-run'],
-                capture_output=True,
-                timeout=timeout,
-                text=True
-            )
-            # This might fail on older UV versions, so we don't check return code
-            
             return True, "Cache available"
             
         except subprocess.TimeoutExpired:
             return False, "UV operation timed out"
         except FileNotFoundError:
+            self._uv_path = None
             return False, "UV not found"
         except Exception as e:
             return False, f"Unexpected error: {e}"
@@ -73,8 +62,12 @@ class CacheAvailabilityManager:
         """
         self.log("🔍 Checking cache availability...")
         
-        # Strategy 1: Try to detect cache availability
-        for attempt in range(int(max_wait / 0.5)):  # Check every 0.5s
+        # Strategy 1: Try to detect cache availability, backing off from
+        # 0.25s to at most 2s between probes
+        deadline = time.time() + max_wait
+        delay = 0.25
+        next_log = time.time() + 2.0
+        while time.time() < deadline:
             available, reason = self.test_uv_responsiveness()
             
             if available:
@@ -82,11 +75,17 @@ class CacheAvailabilityManager:
                 self.log(f"✅ Cache available after {elapsed:.1f}s")
                 return True
             
-            if attempt % 4 == 0 and attempt > 0:  # Log every 2 seconds
+            if self._uv_path is None:
+                # Waiting cannot make a missing uv appear
+                break
+            
+            if time.time() >= next_log:  # Log every 2 seconds
                 elapsed = time.time() - self.start_time
                 self.log(f"⏳ Cache busy ({reason}), waiting... ({elapsed:.1f}s)")
+                next_log += 2.0
             
-            time.sleep(0.5)
+            time.sleep(min(delay, max(0.0, deadline - time.time())))
+            delay = min(delay * 2, 2.0)
         
         # Strategy 2: Fallback to deterministic delay
         self.log("⚠️  Cache detection timeout, using fallback strategy")
@@ -6,19 +6,42 @@ including path validation, normalization, and metadata extraction.
 """
 import os
 import hashlib
+import mmap
 import datetime
 import mimetypes
+import functools
+import codecs
 import stat
-from typing import Dict, Any, Optional, List, Union
+import time
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Iterable, Optional, List, Tuple, Union
 
-from ..constants import config
+from ..constants import config, DURABLE_WRITES
 
-def generate_checksum(path: str) -> str:
+# Load the MIME type tables at import rather than on the first lookup
+mimetypes.init()
+
+# Checksums by (device, inode, mtime, size), least recently used first
+_CHECKSUM_CACHE_SIZE = 1024
+_checksum_cache: "OrderedDict[Tuple[int, int, int, int], str]" = OrderedDict()
+_checksum_cache_lock = threading.Lock()
+
+# Read size for checksums where hashlib.file_digest (Python 3.11+) is missing
+_CHECKSUM_BUFFER_SIZE = 1024 * 1024
+
+def generate_checksum(path: str, stat_info: Optional[os.stat_result] = None) -> str:
     """
     Generate SHA-256 checksum for a file.
     
+    Checksums are cached by the file's identity, so asking again for an
+    unchanged file does not re-read it. Files modified in the last second
+    are not cached, since coarse timestamps could hide a same-size rewrite
+    within the same tick.
+    
     Args:
         path: Path to the file
+        stat_info: Result of os.stat(path), if the caller already has it
         
     Returns:
         str: SHA-256 checksum as a hexadecimal string
@@ -27,14 +50,479 @@ def generate_checksum(path: str) -> str:
         ValueError: If checksum generation fails
     """
     try:
-        h = hashlib.sha256()
-        with open(path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b''):
-                h.update(chunk)
-        return h.hexdigest()
+        if stat_info is None:
+            stat_info = os.stat(path)
+        key = (stat_info.st_dev, stat_info.st_ino, stat_info.st_mtime_ns, stat_info.st_size)
+        with _checksum_cache_lock:
+            checksum = _checksum_cache.get(key)
+            if checksum is not None:
+                _checksum_cache.move_to_end(key)
+                return checksum
+        
+        with open(path, 'rb', buffering=0) as f:
+            if hasattr(hashlib, "file_digest"):
+                checksum = hashlib.file_digest(f, "sha256").hexdigest()
+            else:
+                # Python < 3.11: read into one reused buffer rather than
+                # allocating a bytes object per chunk
+                h = hashlib.sha256()
+                buf = bytearray(_CHECKSUM_BUFFER_SIZE)
+                view = memoryview(buf)
+                while n := f.readinto(buf):
+                    h.update(view[:n])
+                checksum = h.hexdigest()
+        
+        if time.time_ns() - stat_info.st_mtime_ns > 1_000_000_000:
+            with _checksum_cache_lock:
+                _checksum_cache[key] = checksum
+                _checksum_cache.move_to_end(key)
+                if len(_checksum_cache) > _CHECKSUM_CACHE_SIZE:
+                    _checksum_cache.popitem(last=False)
+        return checksum
     except Exception as e:
         raise ValueError(f"Failed to generate checksum: {str(e)}")
 
+def temp_path_for(path: str) -> str:
+    """
+    Get a unique temporary file path next to a file.
+    
+    Args:
+        path: Path of the file the temp file will replace
+        
+    Returns:
+        str: Sibling path of the form ``<path>.tmp.<12 random hex digits>``
+    """
+    # Random rather than pid-based, so names cannot collide across forked
+    # workers or with leftovers from a crashed process that had the same pid
+    return f"{path}.tmp.{os.urandom(6).hex()}"
+
+def _remove_quietly(path: str) -> None:
+    """Remove a file, ignoring errors."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+def _create_temp(path: str) -> Tuple[int, Optional[str]]:
+    """
+    Create a temporary file in the same directory as path.
+
+    On Linux an anonymous O_TMPFILE inode is used, so nothing is visible in
+    the directory until it is published and nothing is left behind if the
+    process dies. Elsewhere (or on filesystems without O_TMPFILE support) a
+    uniquely named sibling temp file is created with O_EXCL.
+
+    Returns:
+        Tuple of the open file descriptor and the temp file path, which is
+        None for an anonymous file
+    """
+    if hasattr(os, "O_TMPFILE"):
+        try:
+            return os.open(os.path.dirname(path), os.O_TMPFILE | os.O_RDWR, 0o666), None
+        except OSError:
+            pass
+    temp_path = temp_path_for(path)
+    return os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666), temp_path
+
+_datasync = getattr(os, "fdatasync", os.fsync)
+
+def _sync_dir(path: str) -> None:
+    """
+    Flush the directory entry of path to disk so a rename into it is durable.
+
+    Platforms that cannot open directories (e.g. Windows) are skipped.
+    """
+    try:
+        dir_fd = os.open(os.path.dirname(path) or ".", os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+def _publish_temp(fd: int, temp_path: Optional[str], path: str, sync: bool) -> None:
+    """
+    Flush a temp file from _create_temp to disk and move it over path.
+
+    Anonymous files are first linked into the directory through
+    /proc/self/fd and then renamed, since linkat cannot replace an existing
+    file. If linking is not permitted (e.g. /proc is unavailable), the data
+    is copied into a named temp file instead. When sync is set, the data is
+    synced before the rename and the directory after it.
+    """
+    if temp_path is not None:
+        if sync:
+            _datasync(fd)
+        os.replace(temp_path, path)
+        if sync:
+            _sync_dir(path)
+        return
+
+    link_path = temp_path_for(path)
+    try:
+        if sync:
+            _datasync(fd)
+        os.link(f"/proc/self/fd/{fd}", link_path, follow_symlinks=True)
+    except FileExistsError:
+        raise
+    except OSError:
+        copy_fd = os.open(link_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        try:
+            _copy_range(fd, copy_fd, 0, os.fstat(fd).st_size)
+            if sync:
+                _datasync(copy_fd)
+        except BaseException:
+            os.close(copy_fd)
+            _remove_quietly(link_path)
+            raise
+        os.close(copy_fd)
+    try:
+        os.replace(link_path, path)
+    except BaseException:
+        _remove_quietly(link_path)
+        raise
+    if sync:
+        _sync_dir(path)
+
+def atomic_write(path: str, data: Union[bytes, Iterable[bytes]], durable: Optional[bool] = None) -> None:
+    """
+    Write data to a file, replacing its previous contents.
+
+    Unless durable is False, the data is written to a temp file in the same
+    directory (anonymous via O_TMPFILE where supported) and moved into place
+    with os.replace, so readers never see a partially written file. With
+    durable=True the data and directory are always fsynced; when durable is
+    None, DURABLE_WRITES decides. With durable=False the file is truncated
+    and rewritten in place, skipping the temp file, fsync and rename.
+
+    Args:
+        path: Absolute path of the file to write
+        data: Bytes to write, or an iterable of byte chunks written in order
+        durable: True to fsync and rename, False to write in place, None for
+            the DURABLE_WRITES default
+
+    Raises:
+        OSError: If the write fails (any temp file is removed)
+    """
+    chunks = (data,) if isinstance(data, (bytes, bytearray, memoryview)) else data
+
+    if durable is False:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        with os.fdopen(fd, 'wb') as f:
+            for chunk in chunks:
+                f.write(chunk)
+        return
+
+    fd, temp_path = _create_temp(path)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            for chunk in chunks:
+                f.write(chunk)
+            f.flush()
+            _publish_temp(f.fileno(), temp_path, path, DURABLE_WRITES if durable is None else True)
+    except BaseException:
+        if temp_path is not None:
+            _remove_quietly(temp_path)
+        raise
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of data to a file descriptor, retrying on short writes."""
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+def _copy_range(src_fd: int, dst_fd: int, offset: int, count: int) -> None:
+    """
+    Copy count bytes at offset in src_fd to the current position of dst_fd.
+
+    Uses copy_file_range so the kernel moves the data (or shares extents on
+    copy-on-write filesystems), falling back to sendfile and finally to a
+    pread/write loop where those are unavailable.
+    """
+    use_copy_file_range = hasattr(os, "copy_file_range")
+    use_sendfile = hasattr(os, "sendfile") and os.name == "posix"
+    while count > 0:
+        if use_copy_file_range:
+            try:
+                copied = os.copy_file_range(src_fd, dst_fd, count, offset)
+            except OSError:
+                use_copy_file_range = False
+                continue
+        elif use_sendfile:
+            try:
+                copied = os.sendfile(dst_fd, src_fd, offset, count)
+            except OSError:
+                use_sendfile = False
+                continue
+        else:
+            chunk = os.pread(src_fd, min(count, 1024 * 1024), offset)
+            _write_all(dst_fd, chunk)
+            copied = len(chunk)
+        if copied == 0:
+            break
+        offset += copied
+        count -= copied
+
+def insert_bytes(path: str, offset: int, data: bytes, durable: Optional[bool] = None) -> None:
+    """
+    Insert data into a file at a byte offset.
+
+    Unless durable is False, a temp file (as in atomic_write) is assembled
+    from the bytes before the offset, the new data and the bytes after it,
+    and moved into place with os.replace; it is fsynced as atomic_write
+    would. The existing bytes are copied in-kernel and never pass through
+    Python. With durable=False only the tail of the file from the offset
+    onwards is rewritten in place.
+
+    Args:
+        path: Absolute path of the file to modify
+        offset: Byte offset to insert at
+        data: Bytes to insert
+        durable: True to fsync and rename, False to write in place, None for
+            the DURABLE_WRITES default
+
+    Raises:
+        OSError: If the write fails (any temp file is removed)
+    """
+    if durable is False:
+        with open(path, 'r+b') as f:
+            f.seek(offset)
+            tail = f.read()
+            f.seek(offset)
+            f.write(data)
+            f.write(tail)
+        return
+
+    src_fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(src_fd).st_size
+        dst_fd, temp_path = _create_temp(path)
+        try:
+            try:
+                _copy_range(src_fd, dst_fd, 0, offset)
+                _write_all(dst_fd, data)
+                _copy_range(src_fd, dst_fd, offset, size - offset)
+                _publish_temp(dst_fd, temp_path, path, DURABLE_WRITES if durable is None else True)
+            finally:
+                os.close(dst_fd)
+        except BaseException:
+            if temp_path is not None:
+                _remove_quietly(temp_path)
+            raise
+    finally:
+        os.close(src_fd)
+
+def check_utf8(data: Any, chunk_size: int = 1024 * 1024) -> None:
+    """
+    Check that a buffer is valid UTF-8 without decoding it whole.
+    
+    The buffer is decoded a chunk at a time, so it is never held as a str;
+    the incremental decoder handles sequences split across chunks.
+    
+    Args:
+        data: Bytes-like object to check, such as a memory map
+        chunk_size: Number of bytes decoded per step
+        
+    Raises:
+        UnicodeDecodeError: If the buffer is not valid UTF-8
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')('strict')
+    for start in range(0, len(data), chunk_size):
+        decoder.decode(data[start:start + chunk_size])
+    decoder.decode(b"", final=True)
+
+def replace_in_file(path: str, old: bytes, new: bytes, max_size: Optional[int] = None,
+                    chunk_size: int = 1024 * 1024, src_hash: Optional[Any] = None,
+                    dst_hash: Optional[Any] = None, text: bool = False) -> int:
+    """
+    Replace every occurrence of a byte string in a file without loading it whole.
+
+    The file is streamed in chunks into a temp file (as in atomic_write),
+    carrying the last ``len(old) - 1`` bytes of each chunk over so matches
+    spanning a chunk boundary are found. Peak memory is about one chunk
+    regardless of file size. The file is first probed through a read-only
+    memory map, so when old does not occur at all nothing is copied, no temp
+    file is created and the hash objects are left untouched.
+
+    With text=True the file is treated as UTF-8 text: it must decode
+    strictly, which is checked through the memory map before anything else,
+    and if its first line ends in CRLF, LF line breaks in new are written as
+    CRLF and those in old are matched as CRLF, so multi-line text given with
+    \n still matches and the file keeps its line endings. Files that mix line
+    endings are matched by the style of their first line only.
+
+    Args:
+        path: Absolute path of the file to modify
+        old: Bytes to search for (must not be empty)
+        new: Replacement bytes
+        max_size: Abort if the rewritten file would exceed this many bytes
+        chunk_size: Number of bytes read per iteration
+        src_hash: Optional hashlib object updated with the original bytes as
+            they are read, so the caller gets the pre-image checksum for free
+        dst_hash: Optional hashlib object updated with the rewritten bytes as
+            they are written, so the new file does not have to be re-read
+        text: Validate the file as UTF-8 and match its CRLF line endings
+
+    Returns:
+        int: Number of replacements made (0 leaves the file untouched)
+
+    Raises:
+        ValueError: If old is empty or the result would exceed max_size
+        UnicodeDecodeError: If text is set and the file is not valid UTF-8
+        OSError: If reading or writing fails (any temp file is removed)
+    """
+    if not old:
+        raise ValueError("Text to replace cannot be empty")
+
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if not size:
+            return 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if text:
+                check_utf8(mm, chunk_size)
+                first_lf = mm.find(b"\n")
+                if first_lf > 0 and mm[first_lf - 1] == 0x0D:
+                    # new is always converted so a single-line old replaced by
+                    # multi-line text does not introduce bare LF line breaks
+                    if b"\n" in old:
+                        old = old.replace(b"\r\n", b"\n").replace(b"\n", b"\r\n")
+                    new = new.replace(b"\r\n", b"\n").replace(b"\n", b"\r\n")
+            if size < len(old) or mm.find(old) < 0:
+                return 0
+
+    keep = len(old) - 1
+    count = 0
+    written = 0
+
+    fd, temp_path = _create_temp(path)
+    try:
+        with os.fdopen(fd, 'wb') as dst, open(path, 'rb') as src:
+            def check_size(size: int) -> None:
+                if max_size is not None and size > max_size:
+                    raise ValueError(f"Updated content would be too large. Maximum size is {max_size} bytes.")
+
+            def emit(data: bytes) -> None:
+                nonlocal written
+                written += len(data)
+                check_size(written)
+                dst.write(data)
+                if dst_hash is not None:
+                    dst_hash.update(data)
+
+            carry = b""
+            while True:
+                chunk = src.read(chunk_size)
+                if not chunk:
+                    break
+                if src_hash is not None:
+                    src_hash.update(chunk)
+                buf = carry + chunk if carry else chunk
+                # split() finds the same leftmost, non-overlapping matches as
+                # a find() loop, but the scan and the splice run in C rather
+                # than once per match in Python
+                parts = buf.split(old)
+                tail = parts.pop()
+                if parts:
+                    count += len(parts)
+                    # Predict the spliced size before join() allocates it
+                    check_size(written + len(buf) - len(tail) + len(parts) * (len(new) - len(old)))
+                    emit(new.join(parts))
+                    emit(new)
+                # Hold back a tail that could be the start of a match
+                tail_start = max(0, len(tail) - keep)
+                emit(tail[:tail_start])
+                carry = tail[tail_start:]
+            emit(carry)
+
+            if count:
+                dst.flush()
+                _publish_temp(dst.fileno(), temp_path, path, DURABLE_WRITES)
+    except BaseException:
+        if temp_path is not None:
+            _remove_quietly(temp_path)
+        raise
+
+    if not count and temp_path is not None:
+        _remove_quietly(temp_path)
+    return count
+
+@functools.lru_cache(maxsize=4096)
+def _mime_for_suffix(suffix: str) -> Optional[str]:
+    mime_type, _ = mimetypes.guess_type("x" + suffix)
+    return mime_type
+
+def guess_mime_type(path: str) -> Optional[str]:
+    """
+    Guess a file's MIME type from its name, as mimetypes.guess_type does.
+    
+    guess_type only looks at the extensions, including compound ones such as
+    .tar.gz, so the result is cached per suffix (everything from the first
+    dot of the name) and shared by every file with that suffix.
+    
+    Args:
+        path: Path or name of the file
+        
+    Returns:
+        Optional[str]: MIME type, or None if it cannot be guessed
+    """
+    name = os.path.basename(path)
+    dot = name.find('.')
+    return _mime_for_suffix(name[dot:] if dot >= 0 else "")
+
+# Read size for _count_lines
+_LINE_COUNT_CHUNK_SIZE = 1024 * 1024
+
+def _count_lines(path: str) -> Optional[int]:
+    """
+    Count the lines of a UTF-8 text file as iterating it in text mode would.
+    
+    Line breaks are counted on the raw bytes with bytes.count, which works
+    because CR and LF never occur inside other UTF-8 characters. \r\n, \r
+    and \n each end a line, and a final line without a break still counts.
+    The chunks still go through a UTF-8 decoder, but only to check that the
+    file is valid text.
+    
+    Returns:
+        Optional[int]: Number of lines, or None if the file is not valid UTF-8
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    count = 0
+    last = b''
+    with open(path, 'rb') as f:
+        while chunk := f.read(_LINE_COUNT_CHUNK_SIZE):
+            try:
+                decoder.decode(chunk)
+            except UnicodeDecodeError:
+                return None
+            count += chunk.count(b'\n') + chunk.count(b'\r') - chunk.count(b'\r\n')
+            if last == b'\r' and chunk[:1] == b'\n':
+                # \r\n split across two chunks was counted twice
+                count -= 1
+            last = chunk[-1:]
+    try:
+        decoder.decode(b'', final=True)
+    except UnicodeDecodeError:
+        return None
+    if last and last not in b'\r\n':
+        count += 1
+    return count
+
+# Permission bits in rwxrwxrwx order, with the letter shown when set
+_PERM_BITS = (
+    (stat.S_IRUSR, 'r'), (stat.S_IWUSR, 'w'), (stat.S_IXUSR, 'x'),
+    (stat.S_IRGRP, 'r'), (stat.S_IWGRP, 'w'), (stat.S_IXGRP, 'x'),
+    (stat.S_IROTH, 'r'), (stat.S_IWOTH, 'w'), (stat.S_IXOTH, 'x'),
+)
+
+def _perm_string(mode: int) -> str:
+    """Format the permission bits of a mode as e.g. ``rwxr-xr--``."""
+    return ''.join([char if mode & bit else '-' for bit, char in _PERM_BITS])
+
 def get_file_info(path: str) -> Dict[str, Any]:
     """
     Get detailed information about a file.
@@ -52,7 +540,7 @@ def get_file_info(path: str) -> Dict[str, Any]:
         
         # Basic file information
         stat_info = os.stat(abs_path)
-        mime_type, _ = mimetypes.guess_type(abs_path)
+        mime_type = guess_mime_type(abs_path)
         
         stats["path"] = path
         stats["type"] = "file"
@@ -63,25 +551,15 @@ def get_file_info(path: str) -> Dict[str, Any]:
         stats["accessed"] = datetime.datetime.fromtimestamp(stat_info.st_atime).isoformat()
         
         # Permission information
-        mode = stat_info.st_mode
-        perms = ""
-        for who in "USR", "GRP", "OTH":
-            for what in "R", "W", "X":
-                perm = getattr(stat, f"S_I{what}{who}")
-                perms += what.lower() if mode & perm else "-"
-        stats["permissions"] = perms
-        
-        # Checksum for files
-        if os.path.isfile(abs_path):
-            stats["checksum"] = generate_checksum(abs_path)
+        stats["permissions"] = _perm_string(stat_info.st_mode)
+        
+        # Checksum for files, reusing the stat above
+        if stat.S_ISREG(stat_info.st_mode):
+            stats["checksum"] = generate_checksum(abs_path, stat_info)
             
             # Count lines for text files
             if mime_type and (mime_type.startswith('text/') or mime_type in ('application/json', 'application/xml', 'application/javascript')):
-                try:
-                    with open(abs_path, 'r', encoding='utf-8') as f:
-                        stats["line_count"] = sum(1 for _ in f)
-                except UnicodeDecodeError:
-                    stats["line_count"] = None
+                stats["line_count"] = _count_lines(abs_path)
     except Exception as e:
         stats["error"] = str(e)
     
@@ -113,22 +591,26 @@ def get_dir_info(path: str, include_contents: bool = True) -> Dict[str, Any]:
         stats["accessed"] = datetime.datetime.fromtimestamp(stat_info.st_atime).isoformat()
         
         # Permission information
-        mode = stat_info.st_mode
-        perms = ""
-        for who in "USR", "GRP", "OTH":
-            for what in "R", "W", "X":
-                perm = getattr(stat, f"S_I{what}{who}")
-                perms += what.lower() if mode & perm else "-"
-        stats["permissions"] = perms
+        stats["permissions"] = _perm_string(stat_info.st_mode)
         
         # Content counts
         if include_contents:
             try:
-                entries = os.listdir(abs_path)
-                dirs = sum(1 for e in entries if os.path.isdir(os.path.join(abs_path, e)))
-                files = sum(1 for e in entries if os.path.isfile(os.path.join(abs_path, e)))
+                # One pass; entry types come from the directory listing, so
+                # only symlinks need a stat to be classified
+                entry_count = dirs = files = 0
+                with os.scandir(abs_path) as it:
+                    for entry in it:
+                        entry_count += 1
+                        try:
+                            if entry.is_dir():
+                                dirs += 1
+                            elif entry.is_file():
+                                files += 1
+                        except OSError:
+                            pass
                 
-                stats["entry_count"] = len(entries)
+                stats["entry_count"] = entry_count
                 stats["dir_count"] = dirs
                 stats["file_count"] = files
             except Exception as e:
@@ -157,15 +639,28 @@ def get_relative_path(path: str) -> str:
     Get path relative to the working directory.
     
     Args:
-        path: Absolute path
+        path: Absolute path (normalized here if needed)
         
     Returns:
         str: Path relative to working directory
     """
-    if not path.startswith(config.abs_working_dir):
+    # Read once per call; the working directory is only known after
+    # initialize_server runs, so it cannot be bound at import time
+    working_dir = config.abs_working_dir
+    # Callers may pass joined but unnormalized paths such as "<wd>/./sub",
+    # which slicing alone would return as "./sub"
+    path = os.path.normpath(path)
+    if not path.startswith(working_dir):
         return path  # Not within working directory
     
-    rel_path = os.path.relpath(path, config.abs_working_dir)
+    # Paths below the working directory are sliced rather than passed to
+    # os.path.relpath, which splits and rejoins both paths. relpath still
+    # handles the rest, such as a sibling sharing the prefix.
+    base_len = len(working_dir.rstrip(os.sep))
+    if path[base_len:base_len + 1] == os.sep and len(path) > base_len + 1:
+        return path[base_len + 1:]
+    
+    rel_path = os.path.relpath(path, working_dir)
     if rel_path == ".":
         return ""
     return rel_path
@@ -5,16 +5,69 @@ This module contains functions for ensuring secure file operations,
 including path validation, sanitization, and security event logging.
 """
 import os
-import re
+import stat
 import sys
+import atexit
+import threading
 import json
 import hashlib
-import datetime
-import mimetypes
-from pathlib import Path
-from typing import Union, Dict, Any, Tuple, Optional
+import functools
+import inspect
+import time
+from typing import Union, Dict, Any, List, Tuple, Optional
 
-from ..constants import config, MAX_FILE_SIZE
+from ..constants import config, MAX_FILE_SIZE, BUFFER_SECURITY_LOG, SECURITY_LOG_FLUSH_INTERVAL
+from .path_utils import guess_mime_type
+
+# Translation tables for the sanitize_* functions: control characters and
+# shell metacharacters are dropped in a single str.translate pass. Search
+# text keeps tab, LF and CR.
+_SHELL_CHARS = ';&|`$'
+_SANITIZE_DROP = dict.fromkeys(
+    [*range(0x20), 0x7F, *map(ord, _SHELL_CHARS)], None)
+_SEARCH_SANITIZE_DROP = {c: None for c in _SANITIZE_DROP if c not in (0x09, 0x0A, 0x0D)}
+
+# Pending security event lines, written to stderr together once the buffer
+# reaches _SECURITY_LOG_BUFFER_SIZE characters or the flush timer fires
+_SECURITY_LOG_BUFFER_SIZE = 8192
+_security_log: List[str] = []
+_security_log_size = 0
+_security_log_timer: Optional[threading.Timer] = None
+_security_log_lock = threading.Lock()
+
+def _flush_security_log_locked() -> None:
+    global _security_log_size, _security_log_timer
+    if _security_log_timer is not None:
+        _security_log_timer.cancel()
+        _security_log_timer = None
+    if _security_log:
+        sys.stderr.write("\n".join(_security_log) + "\n")
+        sys.stderr.flush()
+        _security_log.clear()
+        _security_log_size = 0
+
+def flush_security_log() -> None:
+    """Write any buffered security events to stderr."""
+    with _security_log_lock:
+        _flush_security_log_locked()
+
+# Events still buffered when the server exits are written out
+atexit.register(flush_security_log)
+
+def _write_security_log(message: str) -> None:
+    global _security_log_size, _security_log_timer
+    if not BUFFER_SECURITY_LOG:
+        print(message, file=sys.stderr)
+        return
+    with _security_log_lock:
+        _security_log.append(message)
+        _security_log_size += len(message) + 1
+        if _security_log_size >= _SECURITY_LOG_BUFFER_SIZE:
+            _flush_security_log_locked()
+        elif _security_log_timer is None:
+            _security_log_timer = threading.Timer(SECURITY_LOG_FLUSH_INTERVAL, flush_security_log)
+            _security_log_timer.daemon = True
+            _security_log_timer.start()
 
 def log_security_event(event_type: str, details: Dict[str, Any]) -> str:
     """
@@ -27,28 +80,45 @@ def log_security_event(event_type: str, details: Dict[str, Any]) -> str:
     Returns:
         str: Event ID for reference
     """
-    timestamp = datetime.datetime.now().isoformat()
-    event_id = hashlib.md5(f"{timestamp}:{event_type}:{json.dumps(details)}".encode()).hexdigest()[:8]
-    message = f"SECURITY EVENT [{timestamp}] [{event_id}] {event_type}: {json.dumps(details)}"
-    print(message, file=sys.stderr)
+    # Local time in datetime.isoformat() form, formatted from integers
+    # rather than through a datetime object
+    secs, nanos = divmod(time.time_ns(), 1_000_000_000)
+    tm = time.localtime(secs)
+    timestamp = (f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}"
+                 f"T{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}.{nanos // 1000:06d}")
+    # Serialized once for both the event ID and the message, with json's
+    # default formatting so existing log parsers keep working
+    payload = json.dumps(details)
+    # A 4-byte blake2b digest gives the same 8 hex characters as a truncated md5, for less work
+    event_id = hashlib.blake2b(f"{timestamp}:{event_type}:{payload}".encode(), digest_size=4).hexdigest()
+    message = f"SECURITY EVENT [{timestamp}] [{event_id}] {event_type}: {payload}"
+    _write_security_log(message)
     return event_id
 
-def is_safe_path(path: str) -> bool:
+def is_safe_path(path: str, working_dir: Optional[str] = None) -> bool:
     """
     Verify that a path is within the allowed directory.
     
     Args:
         path: The path to check
+        working_dir: Allowed directory; defaults to the configured working directory
         
     Returns:
         bool: True if the path is within the allowed directory
     """
+    if working_dir is None:
+        working_dir = config.abs_working_dir
     try:
-        path = os.path.abspath(path)
-        return path.startswith(config.abs_working_dir)
+        return _is_within(os.path.abspath(path), working_dir)
     except Exception:
         return False
 
+def _is_within(abs_path: str, working_dir: str) -> bool:
+    # abs_path must already be normalized. Compare against the directory
+    # plus a separator, so that /tmp/foo is not accepted as inside /tmp/f
+    prefix = working_dir if working_dir.endswith(os.sep) else working_dir + os.sep
+    return abs_path == working_dir or abs_path.startswith(prefix)
+
 def sanitize_path(path: str) -> str:
     """
     Sanitize a path to prevent directory traversal attacks.
@@ -65,23 +135,34 @@ def sanitize_path(path: str) -> str:
     if not path:
         raise ValueError("Path cannot be None or empty")
     
-    # Remove NULL bytes and control characters
-    path = re.sub(r'[\x00-\x1F\x7F]', '', path)
-    
-    # Remove potentially dangerous patterns
-    path = re.sub(r'[;&|`$]', '', path)
-    
-    # Normalize path and make it absolute within working directory
+    return _sanitize_path_cached(path, config.abs_working_dir)
+
+@functools.lru_cache(maxsize=1024)
+def _sanitize_path_cached(path: str, working_dir: str) -> str:
+    # The result depends only on the path string and the working directory
+    # (nothing here touches the file system), so it is safe to memoize;
+    # working_dir is part of the key so reconfiguring the server cannot
+    # return a stale result. Rejected paths raise and are not cached.
+    
+    # Remove NULL bytes, control characters and potentially dangerous patterns
+    path = path.translate(_SANITIZE_DROP)
+    
+    # Normalize path and make it absolute within working directory. normpath
+    # already resolves every '..' it can, so the result is checked directly
+    # rather than normalized again by is_safe_path
     norm_path = os.path.normpath(path)
     if os.path.isabs(norm_path):
         # If absolute, ensure it's within working directory
-        if not is_safe_path(norm_path):
+        if not _is_within(norm_path, working_dir):
             raise ValueError(f"Path {path} is outside the working directory")
         return norm_path
     else:
-        # If relative, make it absolute relative to working directory
-        abs_path = os.path.join(config.abs_working_dir, norm_path)
-        if not is_safe_path(abs_path):
+        # If relative, make it absolute relative to working directory; only
+        # leading '..' components survive normpath, and only those can
+        # climb out of it
+        abs_path = os.path.join(working_dir, norm_path)
+        climbs = norm_path == os.pardir or norm_path.startswith(os.pardir + os.sep)
+        if not _is_within(os.path.normpath(abs_path) if climbs else abs_path, working_dir):
             raise ValueError(f"Path {path} is outside the working directory")
         return abs_path
     
@@ -109,11 +190,9 @@ def sanitize_file_pattern(pattern: str, max_length: int = 500) -> str:
     if len(pattern) > max_length:
         raise ValueError(f"File pattern is too long ({len(pattern)} characters). Maximum length is {max_length} characters.")
     
-    # Remove NULL bytes and control characters
-    sanitized = re.sub(r'[\x00-\x1F\x7F]', '', pattern)
-    
-    # Remove potentially dangerous shell command characters
-    sanitized = re.sub(r'[;&|`$]', '', sanitized)
+    # Remove NULL bytes, control characters and potentially dangerous shell
+    # command characters
+    sanitized = pattern.translate(_SANITIZE_DROP)
     
     # Ensure we still have content after sanitization
     if not sanitized:
@@ -145,13 +224,11 @@ def sanitize_search_text(text: str, max_length: int = 1000) -> str:
     if len(text) > max_length:
         raise ValueError(f"Search text is too long ({len(text)} characters). Maximum length is {max_length} characters.")
     
-    # Remove NULL bytes and most control characters that could cause display issues
-    # Keep common whitespace characters like \n, \t, \r
-    sanitized = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', text)
-    
-    # Remove potentially dangerous shell command characters
-    # These aren't strictly necessary for text search but good for defense in depth
-    sanitized = re.sub(r'[;&|`$]', '', sanitized)
+    # Remove NULL bytes and most control characters that could cause display issues,
+    # keeping common whitespace characters like \n, \t, \r. Potentially dangerous
+    # shell command characters go too: they aren't strictly necessary for text
+    # search but good for defense in depth
+    sanitized = text.translate(_SEARCH_SANITIZE_DROP)
     
     # Ensure we still have content after sanitization
     if not sanitized:
@@ -160,12 +237,45 @@ def sanitize_search_text(text: str, max_length: int = 1000) -> str:
     return sanitized
 
 def sanitize_file_string(content: Union[str, Dict[str, Any], list, int, float, bool]) -> str:
-    if not isinstance(content, str) :
-        try : 
-            content = json.dumps(content, indent=2)
-        except Exception as e :
-            raise ValueError(f"sanitize_file_string(): Failed to serialize content: {str(e)}")
-    return content
+    if isinstance(content, str):
+        return content
+    try :
+        # indent=2 keeps the slower pure-Python encoder, but the output is
+        # both written to files and matched against them as old_string, so
+        # it has to stay byte-for-byte what earlier writes produced
+        return json.dumps(content, indent=2)
+    except Exception as e :
+        raise ValueError(f"sanitize_file_string(): Failed to serialize content: {str(e)}")
+
+# Operation groups checked by validate_operation
+_WRITE_OPS = frozenset({
+    "create_file", "update_file", "rewrite_file", "delete_file",
+    "create_dir", "delete_dir", "remove_from_file", "append_to_file",
+    "insert_in_file", "git_init", "git_commit", "git_revert",
+    "copy_file", "move_file", "delete_multiple_files", "replace_all_in_file", "replace_all_in_files",
+    "replace_all_emojis_in_files",
+})
+# Operations whose target must already exist
+_EXISTS_OPS = frozenset({
+    "update_file", "rewrite_file", "delete_file", "delete_dir", "get_tree", "remove_from_file",
+    "git_log", "git_show", "git_diff", "git_revert", "copy_file", "move_file", "delete_multiple_files", "replace_all_in_file",
+    "replace_all_in_files",
+})
+# Operations that need a file rather than a directory, and vice versa
+_FILE_OPS = frozenset({
+    "update_file", "rewrite_file", "delete_file", "remove_from_file", "append_to_file",
+    "insert_in_file", "git_log", "git_show", "git_diff", "git_revert", "replace_all_in_file", "replace_all_in_files",
+})
+_DIR_OPS = frozenset({"list_dir", "delete_dir", "get_tree"})
+# Text operations that refuse binary files when check_binary is set
+_TEXT_OPS = frozenset({
+    "update_file", "rewrite_file", "read_file", "remove_from_file", "append_to_file", "insert_in_file", "replace_all_in_file",
+    "replace_all_in_files",
+})
+# Operations limited to MAX_FILE_SIZE
+_SIZE_CHECK_OPS = frozenset({"read_file", "git_show"})
+# Operations for which validate_operation stats the path
+_STAT_OPS = _EXISTS_OPS | _FILE_OPS | _DIR_OPS | _TEXT_OPS | _SIZE_CHECK_OPS
 
 def validate_operation(path: str, operation: str, check_binary: bool = False, check_exists: bool = True) -> str:
     """
@@ -180,15 +290,34 @@ def validate_operation(path: str, operation: str, check_binary: bool = False, ch
     Returns:
         str: Absolute path if valid
         
+    Raises:
+        ValueError: If the operation is invalid
+    """
+    return validate_operation_stat(path, operation, check_binary, check_exists)[0]
+
+def validate_operation_stat(path: str, operation: str, check_binary: bool = False,
+                            check_exists: bool = True) -> Tuple[str, Optional[os.stat_result]]:
+    """
+    Validate a file operation like validate_operation, also returning the stat it took.
+    
+    Batch tools use the stat instead of statting each path a second time.
+    
+    Args:
+        path: Path to validate
+        operation: Operation being performed
+        check_binary: Whether to check if the file is binary
+        check_exists: Whether to check if the file exists
+        
+    Returns:
+        Tuple[str, Optional[os.stat_result]]: Absolute path if valid, and its
+        stat result; None if the path does not exist or the operation does
+        not stat it
+        
     Raises:
         ValueError: If the operation is invalid
     """
     # Check read-only mode
-    if config.read_only and operation in ["create_file", "update_file", "rewrite_file", "delete_file", 
-                                         "create_dir", "delete_dir", "remove_from_file", "append_to_file",
-                                         "insert_in_file", "git_init", "git_commit", "git_revert", 
-                                         "copy_file", "move_file", "delete_multiple_files", "replace_all_in_file",
-                                         "replace_all_emojis_in_files"]:
+    if config.read_only and operation in _WRITE_OPS:
         log_security_event("write_attempt_in_readonly", {"operation": operation, "path": path})
         raise ValueError("Server is in read-only mode. Write operations are disabled.")
     
@@ -199,36 +328,64 @@ def validate_operation(path: str, operation: str, check_binary: bool = False, ch
         log_security_event("invalid_path", {"operation": operation, "path": path, "error": str(e)})
         raise
     
-    # Basic existence check if needed
-    if check_exists and operation in ["update_file", "rewrite_file", "delete_file", "delete_dir", "get_tree", "remove_from_file", 
-                    "git_log", "git_show", "git_diff", "git_revert", "copy_file", "move_file", "delete_multiple_files", "replace_all_in_file"]:
-        if not os.path.exists(abs_path):
+    # One stat answers the existence, type and size checks below; it is
+    # skipped for operations that need none of them
+    st = None
+    if operation in _STAT_OPS:
+        try:
+            st = os.stat(abs_path)
+        except OSError:
+            # os.path.exists treats any stat failure as "does not exist"
+            pass
+    
+    # Nothing below applies to a missing path, beyond the existence check
+    if st is None:
+        if check_exists and operation in _EXISTS_OPS:
             raise ValueError(f"Path does not exist at {path}")
+        return abs_path, None
             
     # Type check - directory vs file
-    if operation in ["update_file", "rewrite_file", "delete_file", "remove_from_file", "append_to_file", 
-                    "insert_in_file", "git_log", "git_show", "git_diff", "git_revert", "replace_all_in_file"] and os.path.exists(abs_path):
-        if os.path.isdir(abs_path):
-            raise ValueError(f"{path} is a directory, not a file.")
+    is_dir = stat.S_ISDIR(st.st_mode)
+    if is_dir and operation in _FILE_OPS:
+        raise ValueError(f"{path} is a directory, not a file.")
             
-    if operation in ["list_dir", "delete_dir", "get_tree"] and os.path.exists(abs_path):
-        if not os.path.isdir(abs_path):
-            raise ValueError(f"{path} is a file, not a directory.")
+    if not is_dir and operation in _DIR_OPS:
+        raise ValueError(f"{path} is a file, not a directory.")
             
     # Binary file check for text operations
-    if check_binary and operation in ["update_file", "rewrite_file", "read_file", "remove_from_file", "append_to_file", "insert_in_file", "replace_all_in_file"] and os.path.exists(abs_path):
+    if check_binary and operation in _TEXT_OPS:
         if not is_text_file(abs_path):
             log_security_event("binary_file_operation", {"operation": operation, "path": path})
             raise ValueError(f"Cannot {operation} binary file {path}. Only text files are supported.")
             
     # Size check for large files
-    if operation in ["read_file", "git_show"] and os.path.exists(abs_path) and os.path.isfile(abs_path):
-        file_size = os.path.getsize(abs_path)
+    if operation in _SIZE_CHECK_OPS and stat.S_ISREG(st.st_mode):
+        file_size = st.st_size
         if file_size > MAX_FILE_SIZE:
             log_security_event("file_size_limit", {"operation": operation, "path": path, "size": file_size})
             raise ValueError(f"File {path} is too large ({file_size} bytes). Maximum file size is {MAX_FILE_SIZE} bytes.")
             
-    return abs_path
+    return abs_path, st
+
+# Extensions that are virtually always text files
+_TEXT_EXTENSIONS = frozenset({
+    '.txt', '.md', '.rst', '.py', '.js', '.html', '.htm', '.css', '.xml',
+    '.json', '.yaml', '.yml', '.toml', '.ini', '.cfg', '.conf', '.log',
+    '.csv', '.tsv', '.sql', '.sh', '.bat', '.ps1', '.rb', '.php', '.java',
+    '.c', '.cpp', '.h', '.hpp', '.cs', '.go', '.rs', '.scala', '.kt'
+})
+
+# Extensions that are virtually always binary files
+_BINARY_EXTENSIONS = frozenset({
+    '.exe', '.dll', '.so', '.dylib', '.bin', '.img', '.iso',
+    '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.ico', '.tiff',
+    '.mp3', '.wav', '.flac', '.ogg', '.mp4', '.avi', '.mkv',
+    '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
+    '.zip', '.rar', '.7z', '.tar', '.gz', '.bz2'
+})
+
+# Bytes that do not count as printable text in is_text_file's sample
+_NON_PRINTABLE_BYTES = bytes(b for b in range(256) if not (32 <= b <= 126 or b in (9, 10, 13)))
 
 def is_text_file(path: str) -> bool:
     """
@@ -252,36 +409,16 @@ def is_text_file(path: str) -> bool:
         PermissionError: If insufficient permissions to read the file
     """
     
-    # Step 1: Fast extension-based text file detection
-    # These extensions are virtually always text files
-    '''text_extensions = {
-        '.txt', '.md', '.rst', '.py', '.js', '.html', '.htm', '.css', '.xml',
-        '.json', '.yaml', '.yml', '.toml', '.ini', '.cfg', '.conf', '.log',
-        '.csv', '.tsv', '.sql', '.sh', '.bat', '.ps1', '.rb', '.php', '.java',
-        '.c', '.cpp', '.h', '.hpp', '.cs', '.go', '.rs', '.scala', '.kt'
-    }
-    
-    file_ext = Path(path).suffix.lower()
-    if file_ext in text_extensions:
-        return True'''
-    
-    # Step 2: Fast extension-based binary file rejection
-    # These extensions are virtually always binary files
-    binary_extensions = {
-        '.exe', '.dll', '.so', '.dylib', '.bin', '.img', '.iso',
-        '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.ico', '.tiff',
-        '.mp3', '.wav', '.flac', '.ogg', '.mp4', '.avi', '.mkv',
-        '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
-        '.zip', '.rar', '.7z', '.tar', '.gz', '.bz2'
-    }
-    
-    file_ext = Path(path).suffix.lower()
-    if file_ext in binary_extensions:
+    # Steps 1 and 2: Fast extension-based detection, before any file access
+    file_ext = os.path.splitext(path)[1].lower()
+    if file_ext in _TEXT_EXTENSIONS:
+        return True
+    if file_ext in _BINARY_EXTENSIONS:
         return False
     
     # Step 3: MIME type analysis using Python's mimetypes module
     # This handles many file types not covered by extension lists
-    mime_type, _ = mimetypes.guess_type(path)
+    mime_type = guess_mime_type(path)
     if mime_type:
         # Text MIME types are definitely text files
         if mime_type.startswith('text/'):
@@ -290,6 +427,23 @@ def is_text_file(path: str) -> bool:
         if mime_type.startswith(('image/', 'audio/', 'video/')):
             return False
     
+    # Step 4 is cached per (path, mtime, size), so an unchanged file is not
+    # read again. Files modified within the last second are not cached, as a
+    # rewrite within the same mtime tick would go unnoticed
+    try:
+        st = os.stat(path)
+    except OSError:
+        return _sniff_text_file(path)
+    if time.time() - st.st_mtime < 1:
+        return _sniff_text_file(path)
+    return _sniff_text_file_cached(path, st.st_mtime_ns, st.st_size)
+
+@functools.lru_cache(maxsize=2048)
+def _sniff_text_file_cached(path: str, mtime_ns: int, size: int) -> bool:
+    # mtime and size are part of the key so edited files are sniffed again
+    return _sniff_text_file(path)
+
+def _sniff_text_file(path: str) -> bool:
     # Step 4: Content-based analysis (most reliable but slowest)
     # Used when extension and MIME type are inconclusive
     try:
@@ -305,13 +459,22 @@ def is_text_file(path: str) -> bool:
         if b'\0' in sample:
             return False
             
+        # Check the ratio of printable ASCII characters first: counting them
+        # is a single translate pass, and a failing ratio makes decoding moot
+        # Printable chars: space (32) through tilde (126), plus tab (9), LF (10), CR (13)
+        printable = len(sample.translate(None, _NON_PRINTABLE_BYTES))
+        if (printable / len(sample)) <= 0.75:
+            return False
+            
+        # An all-ASCII sample is valid UTF-8; isascii() confirms that without
+        # allocating the decoded string
+        if sample.isascii():
+            return True
+            
         # Attempt UTF-8 decoding - most text files should decode cleanly
         try:
             sample.decode('utf-8')
-            # Additional heuristic: check ratio of printable ASCII characters
-            # Printable chars: space (32) through tilde (126), plus tab (9), LF (10), CR (13)
-            printable = sum(1 for b in sample if 32 <= b <= 126 or b in [9, 10, 13])
-            return (printable / len(sample)) > 0.75
+            return True
         except UnicodeDecodeError:
             # If UTF-8 decoding fails, likely a binary file
             return False
@@ -351,11 +514,22 @@ def with_error_handling(func):
     Returns:
         function: Wrapped function with error handling
     """
-    async def wrapper(*args, **kwargs):
-        try:
-            return await func(*args, **kwargs)
-        except Exception as e:
-            return format_error(e)
+    # The wrapper matches func: a coroutine wrapper for async tools, a plain
+    # one otherwise, so synchronous functions are not turned into coroutines
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                return format_error(e)
+    else:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                return format_error(e)
     return wrapper
 
 
@@ -396,12 +570,10 @@ def is_text_file_robust(path: str) -> bool:
         - Files that cannot be decoded as UTF-8 are considered binary
         - Unknown or suspicious content patterns trigger binary classification
     """
-    from pathlib import Path
-    
     try:
         # Layer 1: File size validation (prevents DoS and resource exhaustion)
         # Large files are often binary and can cause memory issues during analysis
-        file_size = Path(path).stat().st_size
+        file_size = os.stat(path).st_size
         if file_size > 10 * 1024 * 1024:  # 10MB threshold
             return False  # Treat oversized files as binary for security
         
@@ -454,6 +626,36 @@ def is_text_file_robust(path: str) -> bool:
         return False
 
 
+# Common binary file signatures (magic numbers) checked by _has_binary_signature
+# Each signature represents a different binary file format
+_BINARY_SIGNATURES = (
+    b'\x4D\x5A',              # PE executable (Windows .exe, .dll) - "MZ" header
+    b'\x7F\x45\x4C\x46',      # ELF executable (Linux/Unix executables)
+    b'\x89\x50\x4E\x47',      # PNG image format
+    b'\xFF\xD8\xFF',          # JPEG image format
+    b'\x50\x4B\x03\x04',      # ZIP archive (also .docx, .xlsx, .jar)
+    b'\x50\x4B\x05\x06',      # Empty ZIP archive
+    b'\x50\x4B\x07\x08',      # ZIP with data descriptor
+    b'\x25\x50\x44\x46',      # PDF document - "%PDF"
+    b'\x47\x49\x46\x38',      # GIF image format - "GIF8"
+    b'\x42\x4D',              # Windows Bitmap (BMP) image
+    b'\x00\x00\x01\x00',      # Windows Icon (.ico)
+    b'\x52\x49\x46\x46',      # RIFF container (WAV, AVI) - "RIFF"
+    b'\x1F\x8B\x08',          # GZIP compressed data
+    b'\x42\x5A\x68',          # BZIP2 compressed data - "BZh"
+    b'\xFE\xED\xFA\xCE',      # Mach-O executable (macOS, 32-bit)
+    b'\xFE\xED\xFA\xCF',      # Mach-O executable (macOS, 64-bit)
+    b'\xCA\xFE\xBA\xBE',      # Java class file
+    b'\xD0\xCF\x11\xE0',      # Microsoft Office documents (legacy)
+)
+
+# Signatures grouped by their first byte, so a header is only compared
+# against the few signatures that can match it
+_SIGNATURES_BY_FIRST_BYTE: Dict[int, Tuple[bytes, ...]] = {}
+for _signature in _BINARY_SIGNATURES:
+    _SIGNATURES_BY_FIRST_BYTE[_signature[0]] = _SIGNATURES_BY_FIRST_BYTE.get(_signature[0], ()) + (_signature,)
+del _signature
+
 def _has_binary_signature(data: bytes) -> bool:
     """
     Check if file data starts with known binary file format signatures.
@@ -473,38 +675,27 @@ def _has_binary_signature(data: bytes) -> bool:
         - List includes common executable and media formats that pose security risks
         - Detection is performed on raw bytes to prevent encoding-based evasion
     """
-    # Common binary file signatures (magic numbers)
-    # Each signature represents a different binary file format
-    binary_signatures = [
-        b'\x4D\x5A',              # PE executable (Windows .exe, .dll) - "MZ" header
-        b'\x7F\x45\x4C\x46',      # ELF executable (Linux/Unix executables)
-        b'\x89\x50\x4E\x47',      # PNG image format
-        b'\xFF\xD8\xFF',          # JPEG image format
-        b'\x50\x4B\x03\x04',      # ZIP archive (also .docx, .xlsx, .jar)
-        b'\x50\x4B\x05\x06',      # Empty ZIP archive
-        b'\x50\x4B\x07\x08',      # ZIP with data descriptor
-        b'\x25\x50\x44\x46',      # PDF document - "%PDF"
-        b'\x47\x49\x46\x38',      # GIF image format - "GIF8"
-        b'\x42\x4D',              # Windows Bitmap (BMP) image
-        b'\x00\x00\x01\x00',      # Windows Icon (.ico)
-        b'\x52\x49\x46\x46',      # RIFF container (WAV, AVI) - "RIFF"
-        b'\x1F\x8B\x08',          # GZIP compressed data
-        b'\x42\x5A\x68',          # BZIP2 compressed data - "BZh"
-        b'\x7F\x45\x4C\x46',      # ELF (Linux executables, libraries)
-        b'\xFE\xED\xFA\xCE',      # Mach-O executable (macOS, 32-bit)
-        b'\xFE\xED\xFA\xCF',      # Mach-O executable (macOS, 64-bit)
-        b'\xCA\xFE\xBA\xBE',      # Java class file
-        b'\xD0\xCF\x11\xE0',      # Microsoft Office documents (legacy)
-    ]
-    
-    # Check if the file data starts with any known binary signature
-    # Using startswith() ensures we match the exact beginning of the file
-    for signature in binary_signatures:
-        if data.startswith(signature):
-            return True
-    
-    return False
+    # Only the signatures starting with the file's first byte can match;
+    # startswith() ensures we match the exact beginning of the file
+    if not data:
+        return False
+    candidates = _SIGNATURES_BY_FIRST_BYTE.get(data[0])
+    return candidates is not None and data.startswith(candidates)
+
+
+# Byte categories used by _analyze_content_security
+_PRINTABLE, _WHITESPACE, _CONTROL, _HIGH = b'\x00', b'\x01', b'\x02', b'\x03'
+
+def _byte_category(byte_value: int) -> bytes:
+    if 32 <= byte_value <= 126:  # Printable ASCII range
+        return _PRINTABLE
+    if byte_value in (9, 10, 13):  # Tab, LF, CR
+        return _WHITESPACE
+    if byte_value < 32:  # Control characters (excluding allowed whitespace)
+        return _CONTROL
+    return _HIGH  # byte_value > 126 - Extended ASCII or UTF-8
 
+_BYTE_CATEGORIES = b''.join(_byte_category(b) for b in range(256))
 
 def _analyze_content_security(data: bytes) -> float:
     """
@@ -537,22 +728,13 @@ def _analyze_content_security(data: bytes) -> float:
     if b'\x00' in data:
         return 0.95  # Very high binary probability for null bytes
     
-    # Categorize bytes by type for statistical analysis
-    printable_ascii = 0    # Standard printable characters (space through tilde)
-    whitespace = 0         # Legitimate whitespace characters
-    control_chars = 0      # Control characters (excluding allowed whitespace)
-    high_bytes = 0         # Extended ASCII or UTF-8 continuation bytes
-    
-    # Count each category of bytes in the data
-    for byte_value in data:
-        if 32 <= byte_value <= 126:  # Printable ASCII range
-            printable_ascii += 1
-        elif byte_value in [9, 10, 13, 32]:  # Tab, LF, CR, Space
-            whitespace += 1
-        elif byte_value < 32:  # Control characters (excluding allowed whitespace)
-            control_chars += 1
-        else:  # byte_value > 126 - Extended ASCII or UTF-8
-            high_bytes += 1
+    # Categorize bytes by type for statistical analysis: map every byte to
+    # its category and count the categories, both in C
+    categories = data.translate(_BYTE_CATEGORIES)
+    printable_ascii = categories.count(_PRINTABLE)    # Standard printable characters (space through tilde)
+    whitespace = categories.count(_WHITESPACE)        # Legitimate whitespace characters
+    control_chars = categories.count(_CONTROL)        # Control characters (excluding allowed whitespace)
+    high_bytes = categories.count(_HIGH)              # Extended ASCII or UTF-8 continuation bytes
     
     total_bytes = len(data)
     